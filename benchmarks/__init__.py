@@ -0,0 +1,3 @@
+"""
+BetterUptime client benchmarks.
+"""
@@ -0,0 +1,6 @@
+"""
+Run the client benchmark suite: `python -m benchmarks --help`.
+"""
+from benchmarks.suite import main
+
+main()
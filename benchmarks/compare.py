@@ -0,0 +1,51 @@
+"""
+Compare two benchmark suite reports:
+
+    python -m benchmarks.compare baseline.json results.json --threshold 10
+
+Exits with status 1 when a scenario throughput dropped, or its p99 latency grew,
+by more than `threshold` percent.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+
+def load(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Results of a report, by scenario.
+    """
+    with open(path, encoding="utf-8") as report:
+        return {result["scenario"]: result for result in json.load(report)["results"]}
+
+
+def change(before: float, after: float) -> float:
+    """
+    Relative change, in percent.
+    """
+    return (after - before) / before * 100 if before else 0.0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("results")
+    parser.add_argument("--threshold", type=float, default=10.0, help="tolerated regression, in percent")
+    args = parser.parse_args(argv)
+
+    baseline, results = load(args.baseline), load(args.results)
+    regressions = 0
+    for scenario in sorted(baseline.keys() & results.keys()):
+        throughput = change(baseline[scenario]["ops_per_sec"], results[scenario]["ops_per_sec"])
+        p99 = change(baseline[scenario]["p99_ms"], results[scenario]["p99_ms"])
+        regressed = throughput < -args.threshold or p99 > args.threshold
+        regressions += regressed
+        print(f"{scenario:>19}: ops/s {throughput:+7.1f}%  p99 {p99:+7.1f}%{'  REGRESSION' if regressed else ''}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""
+JSON decoders benchmark.
+
+Decodes a large incidents listing, built from the recorded `test_list_incidents`
+and `test_get_incident_200` cassettes, with every installed decoder:
+
+    python -m benchmarks.decoders --items 10000 --rounds 20
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+
+from betteruptime.util.decoders import DECODERS
+from tests.stub_server import recorded_payload
+
+
+def recorded_listing(items: int) -> bytes:
+    """
+    Recorded incidents listing holding `items` copies of the recorded incident.
+    """
+    payload = recorded_payload("test_list_incidents")
+    incident = recorded_payload("test_get_incident_200")["data"]
+    payload["data"] = [dict(incident, id=str(i)) for i in range(items)]
+    return json.dumps(payload).encode("utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000, help="incidents in the listing")
+    parser.add_argument("--rounds", type=int, default=20, help="decodes per decoder")
+    args = parser.parse_args()
+
+    content = recorded_listing(args.items)
+    print(f"{len(content) / 1e6:.1f} MB, {args.items} incidents, best of {args.rounds} decodes")
+    baseline = None
+    for name, decoder in sorted(DECODERS.items(), key=lambda item: item[0] != "json"):
+        best = min(timeit.repeat(lambda: decoder(content), number=1, repeat=args.rounds))
+        baseline = baseline or best
+        print(f"{name:>8}: {best * 1e3:8.2f} ms  x{baseline / best:.2f}")
+
+
+if __name__ == "__main__":
+    main()
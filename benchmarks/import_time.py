@@ -0,0 +1,63 @@
+"""
+Import time benchmark, based on `python -X importtime`:
+
+    python -m benchmarks.import_time --repeat 5
+
+Each snippet runs in a fresh interpreter. `eager` imports every client module,
+as `import betteruptime` did before attributes were loaded lazily.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+SNIPPETS: Dict[str, str] = {
+    "import": "import betteruptime",
+    "client": "import betteruptime; betteruptime.Client(bearer_token='fake')",
+    "client.monitors": "import betteruptime; betteruptime.Client(bearer_token='fake').monitors",
+    "eager": (
+        "import betteruptime.api.api_client, betteruptime.api.async_api_client, betteruptime.models,"
+        " betteruptime.resources.aio, betteruptime.resources.status_pages"
+    ),
+}
+
+
+def measure(code: str) -> Tuple[float, int]:
+    """
+    Cumulative import time of the `betteruptime` modules imported by `code`, in ms, and modules loaded.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{code}; import sys; print(len(sys.modules))"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    total_us = 0
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[0].startswith("import time:"):
+            continue
+        name = parts[2]
+        # Top level imports only, the nested ones are part of their cumulative time
+        if name.startswith(" betteruptime") and parts[1].strip().isdigit():
+            total_us += int(parts[1])
+    return total_us / 1e3, int(process.stdout.split()[-1])
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="interpreters started per snippet")
+    args = parser.parse_args(argv)
+
+    for name, code in SNIPPETS.items():
+        runs = [measure(code) for _ in range(args.repeat)]
+        median = statistics.median(duration for duration, _ in runs)
+        print(f"{name:>15}: {median:8.1f} ms  {runs[-1][1]:5d} modules loaded")
+
+
+if __name__ == "__main__":
+    main()
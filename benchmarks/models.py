@@ -0,0 +1,53 @@
+"""
+Typed models memory benchmark.
+
+Measures the memory held by a monitors inventory, built from the recorded
+`test_get_monitor_200` cassette, as raw dicts and as slotted models:
+
+    python -m benchmarks.models --items 20000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, List
+
+from betteruptime.models import Monitor
+from tests.stub_server import recorded_payload
+
+
+def allocated(build: Callable[[], List[Any]]) -> int:
+    """
+    Bytes still allocated by the objects `build` returns.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=20_000, help="monitors in the inventory")
+    args = parser.parse_args()
+
+    monitor = recorded_payload("test_get_monitor_200")["data"]
+    content = json.dumps({"data": [dict(monitor, id=str(i)) for i in range(args.items)]}).encode("utf-8")
+
+    as_dicts = allocated(lambda: json.loads(content)["data"])
+    as_models = allocated(lambda: Monitor.from_listing(json.loads(content)))
+    print(f"{args.items} monitors")
+    print(f"  dicts: {as_dicts / args.items:8.0f} B/monitor")
+    print(f" models: {as_models / args.items:8.0f} B/monitor  x{as_dicts / as_models:.2f} smaller")
+
+
+if __name__ == "__main__":
+    main()
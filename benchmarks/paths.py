@@ -0,0 +1,62 @@
+"""
+Resource path micro-benchmark: `python -m benchmarks.paths`.
+
+Builds the item url of `status_pages(id).reports(id).status_updates`, as every
+request to it does, by walking the parent chain with `yarl.URL` objects and by
+reusing the path cached on the resource.
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from yarl import URL
+
+import betteruptime
+from betteruptime.util.format import construct_url
+
+
+def build_url_functions() -> Dict[str, Callable[[], str]]:
+    """
+    Url builders to compare.
+    """
+    client = betteruptime.Client(bearer_token="fake")
+    base_url = client.http_client.base_url
+    status_updates = client.status_pages("123456").reports("456789").status_updates
+    return {
+        "yarl chain": lambda: construct_url(base_url, status_updates._build_path(URL(status_updates.name)) / "42"),
+        "cached path": lambda: construct_url(base_url, status_updates._path("42")),
+    }
+
+
+def peak_allocation(function: Callable[[], str], calls: int) -> float:
+    """
+    Mean peak of the memory allocated by a call of `function`, in bytes.
+    """
+    function()
+    total = 0
+    for _ in range(calls):
+        tracemalloc.start()
+        try:
+            function()
+            total += tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return total / calls
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=100_000, help="calls timed")
+    args = parser.parse_args(argv)
+
+    for name, function in build_url_functions().items():
+        duration = min(timeit.repeat(function, number=args.number, repeat=3))
+        peak = peak_allocation(function, 1_000)
+        print(f"{name:>12}: {duration / args.number * 1e6:6.2f} us/call  {peak:7.0f} bytes allocated at peak")
+
+
+if __name__ == "__main__":
+    main()
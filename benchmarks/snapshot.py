@@ -0,0 +1,93 @@
+"""
+Snapshot store benchmark.
+
+Writes a monitors snapshot built from the recorded `test_get_monitor_200`
+cassette, then times opening it and random lookups by id, against loading
+the same monitors from a single `json.dump` file:
+
+    python -m benchmarks.snapshot --items 50000 --format ndjson
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from betteruptime.snapshot import SNAPSHOT_FORMATS, open_snapshot, write_collection, write_manifest
+from tests.stub_server import recorded_payload
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=50_000, help="monitors in the snapshot")
+    parser.add_argument("--lookups", type=int, default=1_000, help="random lookups by id")
+    parser.add_argument("--format", choices=SNAPSHOT_FORMATS, default="ndjson")
+    args = parser.parse_args()
+
+    monitor = recorded_payload("test_get_monitor_200")["data"]
+    monitors = [dict(monitor, id=str(i)) for i in range(args.items)]
+    ids = random.Random(0).choices([item["id"] for item in monitors], k=args.lookups)
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        with open(os.path.join(directory, "dump.json"), "w", encoding="utf-8") as dump:
+            json.dump({"monitors": monitors}, dump)
+        dump_write = time.perf_counter() - start
+        start = time.perf_counter()
+        count = write_collection(directory, "monitors", monitors, snapshot_format=args.format)
+        write_manifest(directory, {"monitors": count}, snapshot_format=args.format)
+        snapshot_write = time.perf_counter() - start
+        del monitors
+
+        # Timed first, tracing allocations slows the lookups down
+        start = time.perf_counter()
+        with open(os.path.join(directory, "dump.json"), encoding="utf-8") as dump:
+            by_id = {item["id"]: item for item in json.load(dump)["monitors"]}
+        dump_open = time.perf_counter() - start
+        start = time.perf_counter()
+        for resource_id in ids:
+            by_id[resource_id]
+        dump_lookups = time.perf_counter() - start
+        del by_id
+
+        start = time.perf_counter()
+        with open_snapshot(directory) as snapshot:
+            collection = snapshot["monitors"]
+            snapshot_open = time.perf_counter() - start
+            start = time.perf_counter()
+            for resource_id in ids:
+                collection[resource_id]
+            snapshot_lookups = time.perf_counter() - start
+
+        tracemalloc.start()
+        with open(os.path.join(directory, "dump.json"), encoding="utf-8") as dump:
+            by_id = {item["id"]: item for item in json.load(dump)["monitors"]}
+        _, dump_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del by_id
+
+        tracemalloc.start()
+        with open_snapshot(directory) as snapshot:
+            for resource_id in ids:
+                snapshot["monitors"][resource_id]
+            _, snapshot_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        size = os.path.getsize(os.path.join(directory, f"monitors.{args.format}"))
+
+    print(f"{args.items} monitors, {args.lookups} lookups, {args.format} {size / 2**20:.1f} MiB")
+    for name, write, opened, lookups, peak in (
+        ("json.dump", dump_write, dump_open, dump_lookups, dump_peak),
+        ("snapshot", snapshot_write, snapshot_open, snapshot_lookups, snapshot_peak),
+    ):
+        print(
+            f"{name:>10}: write {write * 1e3:8.1f} ms  open {opened * 1e3:8.2f} ms"
+            f"  lookups {lookups * 1e3:7.2f} ms  peak {peak / 2**20:7.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Streaming list page benchmark.
+
+Compares the peak memory and the time to the first item of a large incidents page
+decoded at once and streamed by chunks:
+
+    python -m benchmarks.streaming --items 10000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator, Tuple
+
+from benchmarks.decoders import recorded_listing
+from betteruptime.api import _API_STREAM_CHUNK_SIZE
+from betteruptime.util.decoders import get_decoder
+from betteruptime.util.streaming import StreamedPage
+
+
+def measure(consume: Callable[[], Iterator[Any]]) -> Tuple[int, float, float]:
+    """
+    Peak traced memory, time to the first item and total time of `consume`.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    try:
+        for _ in consume():
+            if first is None:
+                first = time.perf_counter() - start
+        total = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, first or total, total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000, help="incidents in the page")
+    args = parser.parse_args()
+
+    content = recorded_listing(args.items)
+    decoder = get_decoder()
+
+    def chunks() -> Iterator[bytes]:
+        # The buffered mode needs the whole body, the streamed one only a chunk at a time
+        for start in range(0, len(content), _API_STREAM_CHUNK_SIZE):
+            yield content[start : start + _API_STREAM_CHUNK_SIZE]
+
+    def buffered() -> Iterator[Any]:
+        return iter(decoder(b"".join(chunks()))["data"])
+
+    def streamed() -> Iterator[Any]:
+        return iter(StreamedPage(chunks()))
+
+    print(f"{len(content) / 1e6:.1f} MB page, {args.items} incidents")
+    for name, consume in (("buffered", buffered), ("streamed", streamed)):
+        peak, first, total = measure(consume)
+        print(f"{name:>9}: peak {peak / 1e6:7.2f} MB, first item {first * 1e3:7.2f} ms, total {total * 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Client hot paths benchmark suite, run against the local stub API.
+
+Measures operations and requests per second, p50/p99 latency, traced allocations
+and peak RSS of `list_iter`, `get`, `create` and `update`, and saves them as JSON
+to compare runs across commits (see `benchmarks.compare`):
+
+    python -m benchmarks --ops 500 --latency 0.001 --output results.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import betteruptime
+from betteruptime.api.exceptions import BetterUptimeException
+from betteruptime.api.httpx_transport import HttpxTransport
+from tests.stub_server import StubAPI
+
+try:
+    import resource
+
+    _HAS_RESOURCE = True
+except ImportError:  # pragma: no cover - not available on Windows
+    _HAS_RESOURCE = False
+
+# Operation(client, monitor ids, operation index)
+Operation = Callable[[betteruptime.Client, List[str], int], Any]
+
+SCENARIOS: Dict[str, Operation] = {
+    "list_iter": lambda client, ids, i: sum(1 for _ in client.monitors.list_iter()),
+    "get": lambda client, ids, i: client.monitors.get(ids[i % len(ids)]),
+    "list_status_updates": lambda client, ids, i: client.status_pages("1").reports("1").status_updates.list(),
+    "create": lambda client, ids, i: client.heartbeats.create({"name": f"Heartbeat {i}", "period": 60, "grace": 30}),
+    "update": lambda client, ids, i: client.monitors.update({"paused": bool(i % 2)}, ids[i % len(ids)]),
+}
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Measures of a scenario.
+    """
+
+    scenario: str
+    ops: int
+    errors: int
+    requests: int
+    duration: float
+    ops_per_sec: float
+    requests_per_sec: float
+    p50_ms: float
+    p99_ms: float
+    traced_peak_kb: float
+    max_rss_kb: Optional[float]
+
+
+def percentile(values: List[float], ratio: float) -> float:
+    """
+    Nearest-rank percentile of `values`.
+    """
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(ratio * len(ordered)) - 1))] if ordered else 0.0
+
+
+def max_rss_kb() -> Optional[float]:
+    """
+    Peak resident set size of the process, in KiB.
+    """
+    if not _HAS_RESOURCE:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, KiB elsewhere
+    return max_rss / 1024 if sys.platform == "darwin" else float(max_rss)
+
+
+def run_scenario(
+    name: str, client: betteruptime.Client, stub: StubAPI, ops: int, workers: int, traced_ops: int
+) -> ScenarioResult:
+    """
+    Time `ops` operations of a scenario on `workers` threads, then trace the allocations of `traced_ops` more.
+    """
+    operation = SCENARIOS[name]
+    ids = list(stub.collections["monitors"]) or ["1"]
+    latencies: List[float] = []
+    errors: List[BetterUptimeException] = []
+
+    def timed(i: int) -> None:
+        start = time.perf_counter()
+        try:
+            operation(client, ids, i)
+        except BetterUptimeException as exc:
+            errors.append(exc)
+        latencies.append(time.perf_counter() - start)
+
+    requests_before = stub.requests
+    start = time.perf_counter()
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(timed, range(ops)))
+    else:
+        for i in range(ops):
+            timed(i)
+    duration = time.perf_counter() - start
+    requests = stub.requests - requests_before
+
+    # Tracing slows everything down, allocations are measured on a separate run
+    tracemalloc.start()
+    try:
+        for i in range(traced_ops):
+            try:
+                operation(client, ids, i)
+            except BetterUptimeException:
+                pass
+        _, traced_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return ScenarioResult(
+        scenario=name,
+        ops=ops,
+        errors=len(errors),
+        requests=requests,
+        duration=duration,
+        ops_per_sec=ops / duration if duration else 0.0,
+        requests_per_sec=requests / duration if duration else 0.0,
+        p50_ms=percentile(latencies, 0.50) * 1e3,
+        p99_ms=percentile(latencies, 0.99) * 1e3,
+        traced_peak_kb=traced_peak / 1024,
+        max_rss_kb=max_rss_kb(),
+    )
+
+
+def git_commit() -> Optional[str]:
+    """
+    Commit of the benchmarked tree, if it is a git checkout.
+    """
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.strip() or None
+
+
+def run_suite(
+    scenarios: List[str],
+    ops: int = 200,
+    workers: int = 1,
+    traced_ops: int = 10,
+    transport: str = "requests",
+    **stub_options: Any,
+) -> Dict[str, Any]:
+    """
+    Run the scenarios against a fresh stub API, return the machine readable report.
+    `transport` is `requests` (the client session) or `httpx` (:class:`HttpxTransport`).
+    """
+    http_transport = HttpxTransport(http2=False) if transport == "httpx" else None
+    with StubAPI(**stub_options) as stub, betteruptime.Client(
+        bearer_token="fake", api_url=stub.url, transport=http_transport
+    ) as client:
+        results = [run_scenario(name, client, stub, ops, workers, traced_ops) for name in scenarios]
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "betteruptime": betteruptime.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "config": dict(ops=ops, workers=workers, traced_ops=traced_ops, transport=transport, **stub_options),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help=f"scenarios to run, all by default: {', '.join(SCENARIOS)}")
+    parser.add_argument("--ops", type=int, default=200, help="operations per scenario")
+    parser.add_argument("--workers", type=int, default=1, help="threads sharing the client")
+    parser.add_argument("--traced-ops", type=int, default=10, help="operations traced for allocations")
+    parser.add_argument("--monitors", type=int, default=250, help="monitors served by the stub")
+    parser.add_argument("--per-page", type=int, default=50, help="items per list page")
+    parser.add_argument("--latency", type=float, default=0.0, help="stub response delay, in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 500 responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of 429 responses")
+    parser.add_argument("--compress", action="store_true", help="gzip the stub responses")
+    parser.add_argument("--transport", choices=["requests", "httpx"], default="requests", help="client transport")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    report = run_suite(
+        args.scenarios or list(SCENARIOS),
+        ops=args.ops,
+        workers=args.workers,
+        traced_ops=args.traced_ops,
+        transport=args.transport,
+        monitors=args.monitors,
+        per_page=args.per_page,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        compress=args.compress,
+    )
+    for result in report["results"]:
+        print(
+            f"{result['scenario']:>19}: {result['ops_per_sec']:9.1f} ops/s {result['requests_per_sec']:9.1f} req/s"
+            f"  p50 {result['p50_ms']:7.2f} ms  p99 {result['p99_ms']:7.2f} ms"
+            f"  alloc peak {result['traced_peak_kb']:8.1f} KiB  errors {result['errors']}"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+            output.write("\n")
@@ -0,0 +1,19 @@
+"""
+Import time benchmark tests
+"""
+from benchmarks.import_time import measure
+
+
+class TestImportTime:
+    """
+    Import time benchmark tests
+    """
+
+    def test_measure(self) -> None:
+        """
+        Test the import time benchmark measures the betteruptime modules.
+        """
+        duration, modules = measure("import betteruptime")
+        eager_duration, eager_modules = measure("import betteruptime.api.api_client")
+        assert duration >= 0 and eager_duration > 0
+        assert eager_modules > modules
@@ -0,0 +1,17 @@
+"""
+Resource path benchmark tests
+"""
+from benchmarks.paths import build_url_functions
+
+
+class TestPaths:
+    """
+    Resource path benchmark tests
+    """
+
+    def test_same_urls(self) -> None:
+        """
+        Test the compared url builders build the same url.
+        """
+        urls = {function() for function in build_url_functions().values()}
+        assert len(urls) == 1
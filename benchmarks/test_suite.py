@@ -0,0 +1,32 @@
+"""
+Benchmark suite tests
+"""
+import json
+import pathlib
+
+from benchmarks import compare
+from benchmarks.suite import SCENARIOS, run_suite
+
+
+class TestSuite:
+    """
+    Benchmark runner tests
+    """
+
+    def test_run_suite_and_compare(self, tmp_path: pathlib.Path) -> None:
+        """
+        Test a tiny run of every scenario and the comparison of two reports.
+        """
+        report = run_suite(list(SCENARIOS), ops=3, traced_ops=1, monitors=10, per_page=5)
+        assert [result["scenario"] for result in report["results"]] == list(SCENARIOS)
+        assert all(result["errors"] == 0 and result["p99_ms"] > 0 for result in report["results"])
+        assert report["results"][0]["requests"] == 3 * 2
+
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(report))
+        assert compare.main([str(baseline), str(baseline)]) == 0
+        for result in report["results"]:
+            result["ops_per_sec"] /= 2
+        slower = tmp_path / "slower.json"
+        slower.write_text(json.dumps(report))
+        assert compare.main([str(baseline), str(slower)]) == 1
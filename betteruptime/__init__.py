@@ -1,11 +1,87 @@
 """
 BetterUptime Client.
+
+Attributes are imported on first access, so `import betteruptime` stays cheap
+for programs using a single client or resource.
 """
 from __future__ import annotations
 
-from . import resources
-from .api import api_client, http_client
-from .api.api_client import Client
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
 from .version import version as __version__
 
-__all__ = ["Client", "api_client", "http_client", "resources", "__version__"]
+if TYPE_CHECKING:
+    from . import models, resources, snapshot
+    from .api import api_client, async_api_client, async_http_client, http_client
+    from .api.api_client import Client
+    from .api.async_api_client import AsyncClient
+    from .api.cache import ResponseCache
+    from .api.coalesce import RequestCoalescer
+    from .api.instrumentation import MetricsCollector, OpenTelemetryHook, RequestHook
+    from .api.rate_limit import RateLimiter
+    from .api.retry import RetryPolicy
+    from .resources.heartbeat_sender import HeartbeatSender
+    from .util.sync import FileCheckpointStore, MemoryCheckpointStore
+
+# Lazy attribute: (module, attribute), `None` for the module itself
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, Optional[str]]] = {
+    "AsyncClient": ("betteruptime.api.async_api_client", "AsyncClient"),
+    "Client": ("betteruptime.api.api_client", "Client"),
+    "FileCheckpointStore": ("betteruptime.util.sync", "FileCheckpointStore"),
+    "HeartbeatSender": ("betteruptime.resources.heartbeat_sender", "HeartbeatSender"),
+    "MemoryCheckpointStore": ("betteruptime.util.sync", "MemoryCheckpointStore"),
+    "MetricsCollector": ("betteruptime.api.instrumentation", "MetricsCollector"),
+    "OpenTelemetryHook": ("betteruptime.api.instrumentation", "OpenTelemetryHook"),
+    "RateLimiter": ("betteruptime.api.rate_limit", "RateLimiter"),
+    "RequestCoalescer": ("betteruptime.api.coalesce", "RequestCoalescer"),
+    "RequestHook": ("betteruptime.api.instrumentation", "RequestHook"),
+    "ResponseCache": ("betteruptime.api.cache", "ResponseCache"),
+    "RetryPolicy": ("betteruptime.api.retry", "RetryPolicy"),
+    "api_client": ("betteruptime.api.api_client", None),
+    "async_api_client": ("betteruptime.api.async_api_client", None),
+    "async_http_client": ("betteruptime.api.async_http_client", None),
+    "http_client": ("betteruptime.api.http_client", None),
+    "models": ("betteruptime.models", None),
+    "resources": ("betteruptime.resources", None),
+    "snapshot": ("betteruptime.snapshot", None),
+}
+
+__all__ = [
+    "AsyncClient",
+    "Client",
+    "FileCheckpointStore",
+    "HeartbeatSender",
+    "MemoryCheckpointStore",
+    "MetricsCollector",
+    "OpenTelemetryHook",
+    "RateLimiter",
+    "RequestCoalescer",
+    "RequestHook",
+    "ResponseCache",
+    "RetryPolicy",
+    "api_client",
+    "async_api_client",
+    "async_http_client",
+    "http_client",
+    "models",
+    "resources",
+    "snapshot",
+    "__version__",
+]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = import_module(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+    # Cached in the module namespace, later lookups skip `__getattr__`
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
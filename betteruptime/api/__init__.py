@@ -1,7 +1,7 @@
 """
 BetterUptime API
 """
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 # API settings
 _API_HOST: str = "https://betteruptime.com"
@@ -10,3 +10,21 @@ _API_PROXIES: Optional[Dict[str, str]] = None
 _API_TIMEOUT: float = 30.0
 _API_VERIFY: bool = True
 _API_VERSION: str = "v2"
+
+# Connection pool settings, see `requests.adapters.HTTPAdapter`
+_API_POOL_CONNECTIONS: int = 10
+_API_POOL_MAXSIZE: int = 10
+_API_POOL_BLOCK: bool = False
+
+# HTTP status codes BetterUptime documents as API errors, these are turned into `ApiError`
+# by the resources instead of raising a generic `HTTPError`.
+_API_ERROR_STATUS_CODES: Tuple[int, ...] = (400, 401, 403, 404, 409, 422, 429)
+
+# Bulk operations settings, keep it below the connection pool size
+_API_BULK_MAX_WORKERS: int = 8
+
+# Async API settings
+_API_MAX_CONCURRENCY: int = 100
+
+# Streamed list pages are read by chunks of this size
+_API_STREAM_CHUNK_SIZE: int = 64 * 1024
@@ -1,66 +1,113 @@
 """
 BetterUptime API Client
 """
-from typing import Dict, Union
+from __future__ import annotations
 
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, TypeVar, Union, cast
+
+from betteruptime.api.executor import ClientExecutor
 from betteruptime.api.http_client import HTTPClient
-from betteruptime.resources import (
-    EscalationPolicy,
-    Heartbeat,
-    HeartbeatGroup,
-    Incident,
-    Metadata,
-    Monitor,
-    MonitorGroup,
-    OnCallCalendar,
-    StatusPage,
-)
-
-BetterUptimeResource = Union[
-    EscalationPolicy,
-    Heartbeat,
-    HeartbeatGroup,
-    Incident,
-    Metadata,
-    Monitor,
-    MonitorGroup,
-    OnCallCalendar,
-    StatusPage,
-]
+
+if TYPE_CHECKING:
+    from betteruptime.resources.escalation_policies import EscalationPolicy
+    from betteruptime.resources.heartbeat_groups import HeartbeatGroup
+    from betteruptime.resources.heartbeats import Heartbeat
+    from betteruptime.resources.incidents import Incident
+    from betteruptime.resources.metadata import Metadata
+    from betteruptime.resources.monitor_groups import MonitorGroup
+    from betteruptime.resources.monitors import Monitor
+    from betteruptime.resources.on_call_calendar import OnCallCalendar
+    from betteruptime.resources.status_pages import StatusPage
+
+    BetterUptimeResource = Union[
+        EscalationPolicy,
+        Heartbeat,
+        HeartbeatGroup,
+        Incident,
+        Metadata,
+        MonitorGroup,
+        Monitor,
+        OnCallCalendar,
+        StatusPage,
+    ]
+
+ResourceT = TypeVar("ResourceT", bound="BetterUptimeResource")
 
 
 class Client:
     """
     BetterUptime API Client.
+
+    A client is thread-safe, share one between the threads of a process rather than
+    creating one per thread: they all send their requests through its session and
+    connection pool, sized with ``pool_maxsize``. Resources are stateless apart from
+    their ids, ``client.monitors('123')`` builds a new resource object for each call,
+    and the shared helpers (rate limiter, retry policy, response cache, coalescer,
+    metrics, monitor index) lock their own state. :meth:`executor` runs resource
+    methods on a thread pool sharing the client.
     """
 
     _http_client: HTTPClient
+    # Resources built on first access, by property name
     _resources: Dict[
         str,
         BetterUptimeResource,
-    ] = {}
-
-    _heartbeat_groups: HeartbeatGroup
-    _heartbeats: Heartbeat
-    _incidents: Incident
-    _metadata: Metadata
-    _monitor_groups: MonitorGroup
-    _monitors: Monitor
-    _on_calls: OnCallCalendar
-    _policies: EscalationPolicy
-    _status_pages: StatusPage
-
-    def __init__(self, bearer_token: str) -> None:
-        self._http_client = HTTPClient(bearer_token=bearer_token)
-        self._heartbeat_groups = HeartbeatGroup(self._http_client)
-        self._heartbeats = Heartbeat(self._http_client)
-        self._incidents = Incident(self._http_client)
-        self._metadata = Metadata(self._http_client)
-        self._monitor_groups = MonitorGroup(self._http_client)
-        self._monitors = Monitor(self._http_client)
-        self._on_calls = OnCallCalendar(self._http_client)
-        self._policies = EscalationPolicy(self._http_client)
-        self._status_pages = StatusPage(self._http_client)
+    ]
+
+    def __init__(self, bearer_token: str, **http_options: Any) -> None:
+        r"""
+        :param bearer_token: BetterUptime API token.
+        :param \*\*http_options: Optional arguments that :class:`HTTPClient` takes,
+            e.g. ``pool_maxsize=50`` to size this client's connection pool.
+        """
+        self._http_client = HTTPClient(bearer_token=bearer_token, **http_options)
+        self._resources = {}
+
+    def _resource(self, name: str, resource_class: Type[ResourceT]) -> ResourceT:
+        """
+        Resource `name`, built on first access.
+        """
+        resource = self._resources.get(name)
+        if resource is None:
+            # setdefault keeps a single instance when threads race on the first access
+            resource = self._resources.setdefault(name, resource_class(self._http_client))
+        return cast(ResourceT, resource)
+
+    def executor(self, max_workers: Optional[int] = None) -> ClientExecutor:
+        """
+        Thread pool running resource methods of this client, sharing its connection pool.
+        `max_workers` defaults to the client ``pool_maxsize``.
+
+            with client.executor(max_workers=8) as executor:
+                monitors = list(executor.map(client.monitors.get, monitor_ids))
+        """
+        return ClientExecutor(self, max_workers)
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and its pooled connections.
+        """
+        self._http_client.close()
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @property
+    def http_client(self) -> HTTPClient:
+        r"""Underlying HTTP client. Returns :class:`HTTPClient` object.
+
+        :rtype: betteruptime.api.http_client.HTTPClient
+        """
+        return self._http_client
 
     @property
     def heartbeat_groups(self) -> HeartbeatGroup:
@@ -68,7 +115,9 @@ class Client:
 
         :rtype: betteruptime.resources.heartbeat_groups.HeartbeatGroup
         """
-        return self._heartbeat_groups
+        from betteruptime.resources.heartbeat_groups import HeartbeatGroup
+
+        return self._resource("heartbeat_groups", HeartbeatGroup)
 
     @property
     def heartbeats(self) -> Heartbeat:
@@ -76,7 +125,9 @@ class Client:
 
         :rtype: betteruptime.resources.heartbeats.Heartbeat
         """
-        return self._heartbeats
+        from betteruptime.resources.heartbeats import Heartbeat
+
+        return self._resource("heartbeats", Heartbeat)
 
     @property
     def incidents(self) -> Incident:
@@ -84,7 +135,9 @@ class Client:
 
         :rtype: betteruptime.resources.incidents.Incident
         """
-        return self._incidents
+        from betteruptime.resources.incidents import Incident
+
+        return self._resource("incidents", Incident)
 
     @property
     def metadata(self) -> Metadata:
@@ -92,7 +145,9 @@ class Client:
 
         :rtype: betteruptime.resources.metadata.Metadata
         """
-        return self._metadata
+        from betteruptime.resources.metadata import Metadata
+
+        return self._resource("metadata", Metadata)
 
     @property
     def monitor_groups(self) -> MonitorGroup:
@@ -100,7 +155,9 @@ class Client:
 
         :rtype: betteruptime.resources.monitor_groups.MonitorGroup
         """
-        return self._monitor_groups
+        from betteruptime.resources.monitor_groups import MonitorGroup
+
+        return self._resource("monitor_groups", MonitorGroup)
 
     @property
     def monitors(self) -> Monitor:
@@ -108,7 +165,9 @@ class Client:
 
         :rtype: betteruptime.resources.monitor.Monitor
         """
-        return self._monitors
+        from betteruptime.resources.monitors import Monitor
+
+        return self._resource("monitors", Monitor)
 
     @property
     def on_calls(self) -> OnCallCalendar:
@@ -116,7 +175,9 @@ class Client:
 
         :rtype: betteruptime.resources.on_call_calendar.OnCallCalendar
         """
-        return self._on_calls
+        from betteruptime.resources.on_call_calendar import OnCallCalendar
+
+        return self._resource("on_calls", OnCallCalendar)
 
     @property
     def policies(self) -> EscalationPolicy:
@@ -124,7 +185,9 @@ class Client:
 
         :rtype: betteruptime.resources.escalation_policies.EscalationPolicy
         """
-        return self._policies
+        from betteruptime.resources.escalation_policies import EscalationPolicy
+
+        return self._resource("policies", EscalationPolicy)
 
     @property
     def status_pages(self) -> StatusPage:
@@ -132,4 +195,6 @@ class Client:
 
         :rtype: betteruptime.resources.status_pages.StatusPage
         """
-        return self._status_pages
+        from betteruptime.resources.status_pages import StatusPage
+
+        return self._resource("status_pages", StatusPage)
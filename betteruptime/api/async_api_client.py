@@ -0,0 +1,182 @@
+"""
+BetterUptime async API Client
+"""
+from __future__ import annotations
+
+from types import TracebackType
+from typing import Optional, Sequence, Type, Union
+
+from betteruptime.api import _API_HOST, _API_MAX_CONCURRENCY, _API_VERSION
+from betteruptime.api.async_http_client import AsyncHTTPClient, AsyncTransport
+from betteruptime.api.coalesce import RequestCoalescer
+from betteruptime.api.instrumentation import RequestHook
+from betteruptime.api.rate_limit import RateLimiter
+from betteruptime.api.retry import RetryPolicy
+from betteruptime.resources.aio import (
+    AsyncEscalationPolicy,
+    AsyncHeartbeat,
+    AsyncHeartbeatGroup,
+    AsyncIncident,
+    AsyncMetadata,
+    AsyncMonitor,
+    AsyncMonitorGroup,
+    AsyncOnCallCalendar,
+    AsyncStatusPage,
+)
+from betteruptime.util.decoders import Decoder
+
+
+class AsyncClient:
+    """
+    BetterUptime async API Client.
+    Exposes the same resources as :class:`betteruptime.Client` with awaitable methods:
+
+        async with betteruptime.AsyncClient(bearer_token="...") as client:
+            monitor = await client.monitors.get("123456")
+            async for heartbeat in client.heartbeats.list_iter():
+                ...
+    """
+
+    _http_client: AsyncHTTPClient
+
+    _heartbeat_groups: AsyncHeartbeatGroup
+    _heartbeats: AsyncHeartbeat
+    _incidents: AsyncIncident
+    _metadata: AsyncMetadata
+    _monitor_groups: AsyncMonitorGroup
+    _monitors: AsyncMonitor
+    _on_calls: AsyncOnCallCalendar
+    _policies: AsyncEscalationPolicy
+    _status_pages: AsyncStatusPage
+
+    def __init__(
+        self,
+        bearer_token: str,
+        transport: Optional[AsyncTransport] = None,
+        max_concurrency: int = _API_MAX_CONCURRENCY,
+        api_url: str = _API_HOST,
+        api_version: str = _API_VERSION,
+        rate_limiter: Optional[RateLimiter] = None,
+        decoder: Union[str, Decoder, None] = None,
+        hooks: Sequence[RequestHook] = (),
+        retry_policy: Optional[RetryPolicy] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+    ) -> None:
+        self._http_client = AsyncHTTPClient(
+            api_url=api_url,
+            api_version=api_version,
+            bearer_token=bearer_token,
+            transport=transport,
+            max_concurrency=max_concurrency,
+            rate_limiter=rate_limiter,
+            decoder=decoder,
+            hooks=hooks,
+            retry_policy=retry_policy,
+            coalescer=coalescer,
+        )
+        self._heartbeat_groups = AsyncHeartbeatGroup(self._http_client)
+        self._heartbeats = AsyncHeartbeat(self._http_client)
+        self._incidents = AsyncIncident(self._http_client)
+        self._metadata = AsyncMetadata(self._http_client)
+        self._monitor_groups = AsyncMonitorGroup(self._http_client)
+        self._monitors = AsyncMonitor(self._http_client)
+        self._on_calls = AsyncOnCallCalendar(self._http_client)
+        self._policies = AsyncEscalationPolicy(self._http_client)
+        self._status_pages = AsyncStatusPage(self._http_client)
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP transport.
+        """
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    @property
+    def http_client(self) -> AsyncHTTPClient:
+        r"""Underlying async HTTP client. Returns :class:`AsyncHTTPClient` object.
+
+        :rtype: betteruptime.api.async_http_client.AsyncHTTPClient
+        """
+        return self._http_client
+
+    @property
+    def heartbeat_groups(self) -> AsyncHeartbeatGroup:
+        r"""BetterUptime heartbeat groups resource. Returns :class:`AsyncHeartbeatGroup` object.
+
+        :rtype: betteruptime.resources.aio.heartbeat_groups.AsyncHeartbeatGroup
+        """
+        return self._heartbeat_groups
+
+    @property
+    def heartbeats(self) -> AsyncHeartbeat:
+        r"""BetterUptime heartbeats resource. Returns :class:`AsyncHeartbeat` object.
+
+        :rtype: betteruptime.resources.aio.heartbeats.AsyncHeartbeat
+        """
+        return self._heartbeats
+
+    @property
+    def incidents(self) -> AsyncIncident:
+        r"""BetterUptime incidents resource. Returns :class:`AsyncIncident` object.
+
+        :rtype: betteruptime.resources.aio.incidents.AsyncIncident
+        """
+        return self._incidents
+
+    @property
+    def metadata(self) -> AsyncMetadata:
+        r"""BetterUptime metadata resource. Returns :class:`AsyncMetadata` object.
+
+        :rtype: betteruptime.resources.aio.metadata.AsyncMetadata
+        """
+        return self._metadata
+
+    @property
+    def monitor_groups(self) -> AsyncMonitorGroup:
+        r"""BetterUptime monitor groups resource. Returns :class:`AsyncMonitorGroup` object.
+
+        :rtype: betteruptime.resources.aio.monitor_groups.AsyncMonitorGroup
+        """
+        return self._monitor_groups
+
+    @property
+    def monitors(self) -> AsyncMonitor:
+        r"""BetterUptime monitors resource. Returns :class:`AsyncMonitor` object.
+
+        :rtype: betteruptime.resources.aio.monitors.AsyncMonitor
+        """
+        return self._monitors
+
+    @property
+    def on_calls(self) -> AsyncOnCallCalendar:
+        r"""BetterUptime on-call calendar resource. Returns :class:`AsyncOnCallCalendar` object.
+
+        :rtype: betteruptime.resources.aio.on_call_calendar.AsyncOnCallCalendar
+        """
+        return self._on_calls
+
+    @property
+    def policies(self) -> AsyncEscalationPolicy:
+        r"""BetterUptime escalation policies resource. Returns :class:`AsyncEscalationPolicy` object.
+
+        :rtype: betteruptime.resources.aio.escalation_policies.AsyncEscalationPolicy
+        """
+        return self._policies
+
+    @property
+    def status_pages(self) -> AsyncStatusPage:
+        r"""BetterUptime status pages resource. Returns :class:`AsyncStatusPage` object.
+
+        :rtype: betteruptime.resources.aio.status_pages.AsyncStatusPage
+        """
+        return self._status_pages
@@ -0,0 +1,604 @@
+"""
+Async HTTP Client for BetterUptime API client.
+"""
+from __future__ import annotations
+
+# stdlib
+import asyncio
+import json as jsonlib
+import logging
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import TracebackType
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Type, Union
+
+import requests
+from yarl import URL
+
+# betteruptime
+from betteruptime.api import (
+    _API_ERROR_STATUS_CODES,
+    _API_HOST,
+    _API_MAX_CONCURRENCY,
+    _API_MAX_RETRIES,
+    _API_PROXIES,
+    _API_TIMEOUT,
+    _API_VERIFY,
+    _API_VERSION,
+)
+from betteruptime.api.coalesce import RequestCoalescer
+from betteruptime.api.exceptions import ClientError, HTTPError, HttpTimeout, ProxyError
+from betteruptime.api.http_client import _get_user_agent_header, _remove_context, _was_sent
+from betteruptime.api.instrumentation import RequestEvent, RequestHook, call_hooks, endpoint_template
+from betteruptime.api.rate_limit import RateLimiter
+from betteruptime.api.retry import RetryPolicy
+from betteruptime.util.compression import ACCEPT_ENCODING, wire_bytes
+from betteruptime.util.decoders import Decoder, get_decoder
+from betteruptime.util.format import construct_url
+
+try:
+    import httpx
+
+    _HAS_HTTPX = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_HTTPX = False
+
+logger: logging.Logger = logging.getLogger("betteruptime.api")
+
+
+class AsyncResponse:
+    """
+    Transport agnostic HTTP response returned by async transports.
+    The body is fully read, so it can be decoded outside of the transport.
+    """
+
+    __slots__ = ("status_code", "reason", "headers", "content", "url", "wire_bytes")
+
+    def __init__(
+        self,
+        status_code: int,
+        reason: str,
+        headers: Mapping[str, str],
+        content: bytes,
+        url: str,
+        wire_bytes: Optional[int] = None,
+    ) -> None:
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.url = url
+        #: Body size on the wire, before its content coding is decoded, when the transport measures it.
+        self.wire_bytes = wire_bytes
+
+    @property
+    def text(self) -> str:
+        """
+        Response body decoded as UTF-8.
+        """
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """
+        Decode the response body as JSON.
+
+        :raises json.JSONDecodeError: if the body is not valid JSON.
+        """
+        return jsonlib.loads(self.content)
+
+
+class AsyncTransport(ABC):
+    """
+    Abstract async transport, sends a single HTTP request and returns an :class:`AsyncResponse`.
+    Implementations must map their own exceptions to `ProxyError`, `ClientError` and `HttpTimeout`,
+    with ``sent=False`` when the connection failed, so the retry policy may retry any method.
+    """
+
+    #: Content codings the transport decodes, sent as the `Accept-Encoding` header.
+    accept_encoding: str = ACCEPT_ENCODING
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        timeout: float = _API_TIMEOUT,
+        allow_redirects: bool = True,
+    ) -> AsyncResponse:
+        """
+        Sends a request.
+        """
+
+    async def aclose(self) -> None:
+        """
+        Release the transport resources (connections, threads).
+        """
+
+
+class HttpxAsyncTransport(AsyncTransport):
+    """
+    Non-blocking transport based on 3rd party `httpx` module (`pip install betteruptime[async]`).
+    A single `httpx.AsyncClient` keeps the connections alive across requests.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = _API_MAX_CONCURRENCY,
+        proxies: Optional[Dict[str, str]] = _API_PROXIES,
+        verify: bool = _API_VERIFY,
+        max_retries: int = _API_MAX_RETRIES,
+    ) -> None:
+        if not _HAS_HTTPX:
+            raise ImportError(
+                "HttpxAsyncTransport requires the `httpx` package. Install it with 'pip install betteruptime[async]'."
+            )
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        # `requests` style proxies ({"https": "http://proxy:3128"}) are mapped to httpx mounts.
+        mounts = {
+            f"{scheme}://": httpx.AsyncHTTPTransport(proxy=proxy, retries=max_retries, verify=verify, limits=limits)
+            for scheme, proxy in (proxies or {}).items()
+        }
+        self._client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(retries=max_retries, verify=verify, limits=limits),
+            mounts=mounts,
+        )
+
+    @property
+    def accept_encoding(self) -> str:  # type: ignore[override]
+        """
+        Content codings `httpx` decodes: gzip and deflate, plus br and zstd when their decoders are installed.
+        """
+        return self._client.headers["Accept-Encoding"]
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        timeout: float = _API_TIMEOUT,
+        allow_redirects: bool = True,
+    ) -> AsyncResponse:
+        try:
+            result = await self._client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                json=json,
+                timeout=timeout,
+                follow_redirects=allow_redirects,
+            )
+        except httpx.ProxyError as exc:
+            raise _remove_context(ProxyError(method, url, exc)) from exc
+        except httpx.ConnectTimeout as exc:
+            raise _remove_context(HttpTimeout(method, url, timeout, sent=False)) from exc
+        except httpx.TimeoutException as exc:
+            raise _remove_context(HttpTimeout(method, url, timeout)) from exc
+        except httpx.ConnectError as exc:
+            raise _remove_context(ClientError(method, url, exc, sent=False)) from exc
+        except httpx.TransportError as exc:
+            raise _remove_context(ClientError(method, url, exc)) from exc
+
+        return AsyncResponse(
+            status_code=result.status_code,
+            reason=result.reason_phrase,
+            headers=result.headers,
+            content=result.content,
+            url=str(result.url),
+            wire_bytes=result.num_bytes_downloaded,
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class ThreadedAsyncTransport(AsyncTransport):
+    """
+    Fallback transport running a `requests` session in a bounded thread pool.
+    Used when `httpx` is not installed, the event loop is not blocked but each
+    in-flight request holds a worker thread.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = _API_MAX_CONCURRENCY,
+        proxies: Optional[Dict[str, str]] = _API_PROXIES,
+        verify: bool = _API_VERIFY,
+        max_retries: int = _API_MAX_RETRIES,
+    ) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="betteruptime")
+        self._session = requests.Session()
+        http_adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_connections,
+            max_retries=max_retries,
+        )
+        self._session.mount("https://", http_adapter)
+        self._session.mount("http://", http_adapter)
+        self._proxies = proxies
+        self._verify = verify
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        timeout: float = _API_TIMEOUT,
+        allow_redirects: bool = True,
+    ) -> AsyncResponse:
+        send = partial(
+            self._session.request,
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            json=json,
+            timeout=timeout,
+            allow_redirects=allow_redirects,
+            proxies=self._proxies,
+            verify=self._verify,
+        )
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, send)
+        except requests.exceptions.ProxyError as exc:
+            raise _remove_context(ProxyError(method, url, exc)) from exc
+        except requests.ConnectionError as exc:
+            raise _remove_context(ClientError(method, url, exc, sent=_was_sent(exc))) from exc
+        except requests.exceptions.Timeout as exc:
+            raise _remove_context(HttpTimeout(method, url, timeout, sent=_was_sent(exc))) from exc
+
+        return AsyncResponse(
+            status_code=result.status_code,
+            reason=result.reason,
+            headers=result.headers,
+            content=result.content,
+            url=result.url,
+            wire_bytes=wire_bytes(result),
+        )
+
+    async def aclose(self) -> None:
+        self._session.close()
+        self._executor.shutdown(wait=False)
+
+
+def default_async_transport(
+    max_connections: int = _API_MAX_CONCURRENCY,
+    proxies: Optional[Dict[str, str]] = _API_PROXIES,
+    verify: bool = _API_VERIFY,
+    max_retries: int = _API_MAX_RETRIES,
+) -> AsyncTransport:
+    """
+    Returns the best available async transport: `httpx` when installed, a thread pool otherwise.
+    """
+    if _HAS_HTTPX:
+        return HttpxAsyncTransport(
+            max_connections=max_connections,
+            proxies=proxies,
+            verify=verify,
+            max_retries=max_retries,
+        )
+
+    logger.debug("httpx is not installed, falling back to ThreadedAsyncTransport.")
+    return ThreadedAsyncTransport(
+        max_connections=max_connections,
+        proxies=proxies,
+        verify=verify,
+        max_retries=max_retries,
+    )
+
+
+class AsyncHTTPClient:
+    """
+    Async HTTP client, the actual I/O is delegated to a pluggable :class:`AsyncTransport`.
+    At most `max_concurrency` requests are in flight at the same time.
+    """
+
+    _bearer_token: Optional[str] = None
+
+    def __init__(
+        self,
+        api_url: str = _API_HOST,
+        api_version: str = _API_VERSION,
+        bearer_token: Optional[str] = None,
+        transport: Optional[AsyncTransport] = None,
+        max_concurrency: int = _API_MAX_CONCURRENCY,
+        rate_limiter: Optional[RateLimiter] = None,
+        decoder: Union[str, Decoder, None] = None,
+        hooks: Sequence[RequestHook] = (),
+        retry_policy: Optional[RetryPolicy] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+    ) -> None:
+        self.base_url: URL = URL(api_url.strip("/")) / "api" / api_version.strip("/")
+        self._bearer_token = bearer_token
+        self._headers: Dict[str, str] = {
+            "Accept": "application/json",
+            "User-Agent": _get_user_agent_header(),
+            "Authorization": f"Bearer {self._bearer_token}",
+        }
+        # The retry policy replaces the connection retries of the transport, they would bypass its budget
+        self._transport: AsyncTransport = transport or default_async_transport(
+            max_connections=max_concurrency, max_retries=0 if retry_policy is not None else _API_MAX_RETRIES
+        )
+        self._headers["Accept-Encoding"] = self._transport.accept_encoding
+        self._max_concurrency = max_concurrency
+        # Created lazily: before python 3.10 a semaphore binds to the event loop current at creation time.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._rate_limiter = rate_limiter
+        self._decoder = get_decoder(decoder)
+        self._hooks: Tuple[RequestHook, ...] = tuple(hooks)
+        self._retry_policy = retry_policy
+        self._coalescer = coalescer
+
+    @property
+    def transport(self) -> AsyncTransport:
+        """
+        transport property getter.
+        """
+        return self._transport
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """
+        rate_limiter property getter.
+        """
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """
+        retry_policy property getter.
+        """
+        return self._retry_policy
+
+    @property
+    def coalescer(self) -> Optional[RequestCoalescer]:
+        """
+        coalescer property getter.
+        """
+        return self._coalescer
+
+    @property
+    def hooks(self) -> Tuple[RequestHook, ...]:
+        """
+        hooks property getter.
+        """
+        return self._hooks
+
+    @property
+    def decoder(self) -> Decoder:
+        """
+        decoder property getter.
+        """
+        return self._decoder
+
+    def json(self, response: AsyncResponse) -> Any:
+        """
+        Decode a response body as JSON with the client decoder.
+        """
+        return self._decoder(response.content)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        timeout: float = _API_TIMEOUT,
+        allow_redirects: bool = True,
+    ) -> AsyncResponse:
+        """
+        Sends a request.
+        Returns :class:`AsyncResponse` object.
+
+        :param method: method for the request.
+        :param url: URL for the request.
+        :param headers: (optional) Dictionary of HTTP Headers to send with the request.
+        :param params: (optional) Dictionary to be sent in the query string.
+        :param json: (optional) json to send in the body of the request.
+        :param timeout: (optional) How long to wait for the server to send data before giving up.
+        :param allow_redirects: (optional) Boolean. Enable/disable redirection. Defaults to ``True``.
+        :rtype: AsyncResponse
+        """
+        coalescer = self._coalescer
+        if coalescer is not None and method == "GET":
+            return await coalescer.do_async(
+                coalescer.key(method, url, params, headers),
+                partial(self._request, method, url, headers, params, json, timeout, allow_redirects),
+            )
+        return await self._request(method, url, headers, params, json, timeout, allow_redirects)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        json: Any,
+        timeout: float,
+        allow_redirects: bool,
+    ) -> AsyncResponse:
+        """
+        Send a request through the rate limiter and the retry policy, see :meth:`request`.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        event: Optional[RequestEvent] = None
+        if self._hooks:
+            base_url = str(self.base_url)
+            path = url[len(base_url) :] if url.startswith(base_url) else str(URL(url).path)
+            event = RequestEvent(method=method, url=url, endpoint=endpoint_template(path.split("?", 1)[0]))
+            call_hooks(self._hooks, "before_send", event)
+
+        request_headers = dict(self._headers)
+        if headers:
+            request_headers.update(headers)
+
+        retry_policy = self._retry_policy
+        try:
+            attempt = 0
+            retries = 0
+            while True:
+                if retry_policy is not None:
+                    retry_policy.before_request(retry=attempt + retries > 0)
+
+                try:
+                    if self._rate_limiter is not None:
+                        await self._rate_limiter.acquire_async()
+                    async with self._semaphore:
+                        result = await self._transport.request(
+                            method=method,
+                            url=url,
+                            headers=request_headers,
+                            params=params,
+                            json=json,
+                            timeout=timeout,
+                            allow_redirects=allow_redirects,
+                        )
+                except (ClientError, HttpTimeout) as exc:
+                    if retry_policy is None:
+                        raise
+                    retry_policy.record(failure=True)
+                    if not retry_policy.should_retry(method, retries, sent=exc.sent, headers=request_headers):
+                        raise
+                    await asyncio.sleep(retry_policy.backoff(retries))
+                    retries += 1
+                    continue
+                except BaseException:
+                    # Proxy errors and cancellations: the half-open circuit must not wait for them
+                    if retry_policy is not None:
+                        retry_policy.release_trial()
+                    raise
+
+                if retry_policy is not None:
+                    retry_policy.record(failure=retry_policy.is_failure(result.status_code))
+                if self._rate_limiter is not None:
+                    self._rate_limiter.update(result.status_code, result.headers)
+                    if self._rate_limiter.should_retry(result.status_code, attempt):
+                        self._rate_limiter.backoff(result.headers, attempt)
+                        attempt += 1
+                        continue
+                if retry_policy is None or not retry_policy.should_retry(
+                    method, retries, status_code=result.status_code, headers=request_headers
+                ):
+                    break
+                await asyncio.sleep(retry_policy.backoff(retries))
+                retries += 1
+
+            if event is not None:
+                event.status_code = result.status_code
+                event.retries = attempt + retries
+                # Transports serialize the body themselves, its size is measured on a compact encoding
+                event.request_bytes = (
+                    len(jsonlib.dumps(json, separators=(",", ":")).encode()) if json is not None else 0
+                )
+                event.response_bytes = len(result.content)
+                event.request_wire_bytes = event.request_bytes
+                event.response_wire_bytes = result.wire_bytes if result.wire_bytes is not None else event.response_bytes
+
+            if result.status_code >= 400 and result.status_code not in _API_ERROR_STATUS_CODES:
+                raise HTTPError(result.status_code, result.reason)
+        except BaseException as exc:
+            # Cancellations and unmapped transport errors also end the request for the hooks
+            if event is not None:
+                event.elapsed = time.perf_counter() - event.started_at
+                event.error = exc
+                call_hooks(self._hooks, "on_error", event)
+            raise
+
+        if event is not None:
+            event.elapsed = time.perf_counter() - event.started_at
+            call_hooks(self._hooks, "after_response", event)
+        return result
+
+    async def get(self, path: Union[URL, str], **kwargs: Any) -> AsyncResponse:
+        r"""Sends a GET request. Returns :class:`AsyncResponse` object.
+
+        :param path: PATH for the request.
+        :param \*\*kwargs: Optional arguments that ``request`` takes.
+        :rtype: AsyncResponse
+        """
+
+        kwargs.setdefault("allow_redirects", True)
+        return await self.request("GET", construct_url(self.base_url, path), **kwargs)
+
+    async def head(self, path: Union[URL, str], **kwargs: Any) -> AsyncResponse:
+        r"""Sends a HEAD request. Returns :class:`AsyncResponse` object.
+
+        :param path: PATH for the request.
+        :param \*\*kwargs: Optional arguments that ``request`` takes.
+        :rtype: AsyncResponse
+        """
+
+        kwargs.setdefault("allow_redirects", False)
+        return await self.request("HEAD", construct_url(self.base_url, path), **kwargs)
+
+    async def post(self, path: Union[URL, str], json: Any = None, **kwargs: Any) -> AsyncResponse:
+        r"""Sends a POST request. Returns :class:`AsyncResponse` object.
+
+        :param path: PATH for the request.
+        :param json: (optional) json to send in the body of the request.
+        :param \*\*kwargs: Optional arguments that ``request`` takes.
+        :rtype: AsyncResponse
+        """
+
+        return await self.request("POST", construct_url(self.base_url, path), json=json, **kwargs)
+
+    async def put(self, path: Union[URL, str], json: Any = None, **kwargs: Any) -> AsyncResponse:
+        r"""Sends a PUT request. Returns :class:`AsyncResponse` object.
+
+        :param path: PATH for the request.
+        :param json: (optional) json to send in the body of the request.
+        :param \*\*kwargs: Optional arguments that ``request`` takes.
+        :rtype: AsyncResponse
+        """
+
+        return await self.request("PUT", construct_url(self.base_url, path), json=json, **kwargs)
+
+    async def patch(self, path: Union[URL, str], json: Any = None, **kwargs: Any) -> AsyncResponse:
+        r"""Sends a PATCH request. Returns :class:`AsyncResponse` object.
+
+        :param path: PATH for the request.
+        :param json: (optional) json to send in the body of the request.
+        :param \*\*kwargs: Optional arguments that ``request`` takes.
+        :rtype: AsyncResponse
+        """
+
+        return await self.request("PATCH", construct_url(self.base_url, path), json=json, **kwargs)
+
+    async def delete(self, path: Union[URL, str], **kwargs: Any) -> AsyncResponse:
+        r"""Sends a DELETE request. Returns :class:`AsyncResponse` object.
+
+        :param path: PATH for the request.
+        :param \*\*kwargs: Optional arguments that ``request`` takes.
+        :rtype: AsyncResponse
+        """
+
+        return await self.request("DELETE", construct_url(self.base_url, path), **kwargs)
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying transport.
+        """
+        await self._transport.aclose()
+
+    async def __aenter__(self) -> AsyncHTTPClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
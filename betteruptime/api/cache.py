@@ -0,0 +1,159 @@
+"""
+Conditional GET response cache for BetterUptime API client.
+"""
+from __future__ import annotations
+
+# stdlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+import requests
+
+CacheKey = Tuple[Hashable, ...]
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """
+    Snapshot of a :class:`ResponseCache` activity.
+    """
+
+    #: Requests answered `304 Not Modified` and served from the cache.
+    hits: int
+    #: Cacheable requests that downloaded a full response.
+    misses: int
+    #: Requests that skipped the cache on purpose.
+    bypassed: int
+    #: Entries dropped to stay under `maxsize`.
+    evictions: int
+    #: Entries currently cached.
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Share of cacheable requests served from the cache.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CachedResponse:
+    """
+    A cached response and the validators used to revalidate it.
+    """
+
+    __slots__ = ("response", "etag", "last_modified")
+
+    def __init__(self, response: requests.Response, etag: Optional[str], last_modified: Optional[str]) -> None:
+        self.response = response
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Headers asking the API to answer `304 Not Modified` when the resource did not change.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of GET responses keyed by method and URL.
+
+    Cached responses are always revalidated with `If-None-Match` / `If-Modified-Since`,
+    on `304 Not Modified` the cached response is returned and its body decoded again, so every
+    caller gets its own payload.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize < 1:
+            raise ValueError("ResponseCache maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bypassed = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> ResponseCacheStats:
+        """
+        Current activity counters.
+        """
+        with self._lock:
+            return ResponseCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                bypassed=self._bypassed,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    @staticmethod
+    def key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> CacheKey:
+        """
+        Cache key of a request.
+        """
+        query = tuple(sorted((str(name), str(value)) for name, value in (params or {}).items()))
+        return (method.upper(), url, query)
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        """
+        Entry stored under `key`, marked as most recently used.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def hit(self, entry: CachedResponse) -> requests.Response:
+        """
+        Count a `304 Not Modified` answer and return the cached response.
+        """
+        with self._lock:
+            self._hits += 1
+        return entry.response
+
+    def bypass(self) -> None:
+        """
+        Count a request that skipped the cache.
+        """
+        with self._lock:
+            self._bypassed += 1
+
+    def store(self, key: CacheKey, response: requests.Response) -> None:
+        """
+        Count a full download and keep the response when it can be revalidated later.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._lock:
+            self._misses += 1
+            if response.status_code != 200 or not (etag or last_modified):
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = CachedResponse(response, etag, last_modified)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drop every entry.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,171 @@
+"""
+Request coalescing for BetterUptime API client.
+"""
+from __future__ import annotations
+
+# stdlib
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple, TypeVar
+
+from betteruptime.api.cache import CacheKey, ResponseCache
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RequestCoalescerStats:
+    """
+    Snapshot of a :class:`RequestCoalescer` activity.
+    """
+
+    #: Requests that went through the coalescer.
+    requests: int
+    #: Requests answered by an identical request already in flight.
+    coalesced: int
+    #: Requests currently in flight.
+    in_flight: int
+
+    @property
+    def dedup_ratio(self) -> float:
+        """
+        Share of requests that did not reach the API.
+        """
+        return self.coalesced / self.requests if self.requests else 0.0
+
+
+class _Call:
+    """
+    An in-flight request shared by its callers.
+    """
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _LeaderCancelled(Exception):
+    """
+    The leader of an async call was cancelled, its followers send the call again.
+    """
+
+
+class RequestCoalescer:
+    """
+    Single-flight layer: identical GET requests sent at the same time share one API call.
+
+    The first caller sends the request, the callers arriving while it is in flight wait for
+    its response (or its error) instead of sending their own. The response is shared between
+    callers, each one decodes its own payload from it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[CacheKey, _Call] = {}
+        self._async_calls: Dict[Tuple[int, CacheKey], asyncio.Future[Any]] = {}
+        self._requests = 0
+        self._coalesced = 0
+
+    @property
+    def stats(self) -> RequestCoalescerStats:
+        """
+        Current activity counters.
+        """
+        with self._lock:
+            return RequestCoalescerStats(
+                requests=self._requests,
+                coalesced=self._coalesced,
+                in_flight=len(self._calls) + len(self._async_calls),
+            )
+
+    @staticmethod
+    def key(
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> CacheKey:
+        """
+        Coalescing key of a request: requests sharing it get the same response.
+        """
+        header_items = tuple(sorted((name.lower(), value) for name, value in (headers or {}).items()))
+        return ResponseCache.key(method, url, params) + (header_items,)
+
+    def do(self, key: CacheKey, send: Callable[[], T]) -> T:
+        """
+        Call `send`, unless a call with the same `key` is in flight: then wait for its outcome.
+        """
+        with self._lock:
+            self._requests += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            result: T = call.result
+            return result
+
+        try:
+            result = send()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        else:
+            call.result = result
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return result
+
+    async def do_async(self, key: CacheKey, send: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await `send()`, unless a call with the same `key` is in flight in this event loop: then await its outcome.
+        """
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        with self._lock:
+            self._requests += 1
+        while True:
+            with self._lock:
+                future = self._async_calls.get(loop_key)
+                leader = future is None
+                if future is None:
+                    future = self._async_calls[loop_key] = loop.create_future()
+                else:
+                    self._coalesced += 1
+            if leader:
+                break
+            try:
+                # Shielded: a cancelled follower must not cancel the leader request
+                result: T = await asyncio.shield(future)
+                return result
+            except _LeaderCancelled:
+                # The first follower sends the call again, the others follow it
+                with self._lock:
+                    self._coalesced -= 1
+
+        try:
+            result = await send()
+        except BaseException as exc:
+            # The caller cancellation, e.g. its own timeout, is not shared with the followers
+            future.set_exception(_LeaderCancelled() if isinstance(exc, asyncio.CancelledError) else exc)
+            # Mark the exception as retrieved, there may be no follower
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._async_calls[loop_key]
+        return result
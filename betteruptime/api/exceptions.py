@@ -30,37 +30,42 @@ class ProxyError(BetterUptimeException):
 class ClientError(BetterUptimeException):
     """
     HTTP connection to BetterUptime endpoint is not possible.
+    `sent` is `False` when the request surely never reached the server (connection refused).
     """
 
-    def __init__(self, method: str, url: str, exception: Exception):
+    def __init__(self, method: str, url: str, exception: Exception, sent: bool = True):
         message = (
             f"Could not request {method} {url}: {exception}. "
             "Please check the network connection or try again later. "
         )
         super().__init__(message)
+        self.sent = sent
 
 
 class HttpTimeout(BetterUptimeException):
     """
     HTTP connection timeout.
+    `sent` is `False` when the connection timed out, before the request was sent.
     """
 
-    def __init__(self, method: str, url: str, timeout: float):
+    def __init__(self, method: str, url: str, timeout: float, sent: bool = True):
         message = (
             f"{method} {url} timed out after {timeout}. "
             "Please try again later. "
             "If the problem persists, please contact support@BetterUptimehq.com"
         )
         super().__init__(message)
+        self.sent = sent
 
 
 class HttpBackoff(BetterUptimeException):
     """
-    Backing off after too many timeouts.
+    Backing off after too many timeouts or server errors.
     """
 
     def __init__(self, backoff_period: float):
-        message = f"Too many timeouts. Won't try again for {backoff_period} seconds. "
+        self.backoff_period = backoff_period
+        message = f"Too many timeouts or server errors. Won't try again for {backoff_period} seconds. "
         super().__init__(message)
 
 
@@ -0,0 +1,45 @@
+"""
+Thread pool running BetterUptime API calls.
+"""
+from __future__ import annotations
+
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from betteruptime.api.api_client import Client
+
+T = TypeVar("T")
+
+
+class ClientExecutor(ThreadPoolExecutor):
+    """
+    Thread pool running any resource method of a :class:`Client`, sharing its session and
+    connection pool. Built by :meth:`Client.executor`:
+
+        with client.executor(max_workers=8) as executor:
+            monitors = list(executor.map(client.monitors.get, monitor_ids))
+            future = executor.submit(client.heartbeats.list)
+
+    Calls run in a copy of the submitter context, so `HTTPClient.bypass_cache()` blocks
+    apply to the calls submitted from them. Shutting the pool down leaves the client open.
+    """
+
+    def __init__(self, client: Client, max_workers: Optional[int] = None) -> None:
+        """
+        :param client: Client whose resources are called.
+        :param max_workers: (optional) Threads of the pool, the client ``pool_maxsize`` by default so
+            every thread keeps its connection alive.
+        """
+        super().__init__(
+            max_workers=max_workers or client.http_client.pool_maxsize, thread_name_prefix="betteruptime-executor"
+        )
+        self.client = client
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> Future[T]:  # type: ignore[override]
+        """
+        Schedule `fn(*args, **kwargs)`, e.g. ``executor.submit(client.monitors.update, payload, "123")``.
+        """
+        context = contextvars.copy_context()
+        return super().submit(context.run, fn, *args, **kwargs)
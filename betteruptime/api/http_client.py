@@ -1,23 +1,58 @@
 """
 HTTP Client for BetterUptime API client.
 """
+from __future__ import annotations
+
 # stdlib
 import logging
 import platform
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from http.cookiejar import DefaultCookiePolicy
 from threading import Lock
-from typing import Any, Dict, Optional
+from types import TracebackType
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple, Type, TypeVar, Union
+from urllib.parse import urlsplit
 
 import requests
+from urllib3.exceptions import NewConnectionError
 from yarl import URL
 
 # betteruptime
-from betteruptime.api import _API_HOST, _API_MAX_RETRIES, _API_PROXIES, _API_TIMEOUT, _API_VERIFY, _API_VERSION
-from betteruptime.api.exceptions import ClientError, HTTPError, HttpTimeout, ProxyError
+from betteruptime.api import (
+    _API_ERROR_STATUS_CODES,
+    _API_HOST,
+    _API_MAX_RETRIES,
+    _API_POOL_BLOCK,
+    _API_POOL_CONNECTIONS,
+    _API_POOL_MAXSIZE,
+    _API_PROXIES,
+    _API_STREAM_CHUNK_SIZE,
+    _API_TIMEOUT,
+    _API_VERIFY,
+    _API_VERSION,
+)
+from betteruptime.api.cache import CachedResponse, CacheKey, ResponseCache
+from betteruptime.api.coalesce import RequestCoalescer
+from betteruptime.api.exceptions import ClientError, HttpBackoff, HTTPError, HttpTimeout, ProxyError
+from betteruptime.api.instrumentation import RequestEvent, RequestHook, call_hooks, endpoint_template
+from betteruptime.api.rate_limit import RateLimiter
+from betteruptime.api.retry import RetryPolicy
+from betteruptime.api.transport import ConnectError, HTTPTransport
+from betteruptime.util.compression import ACCEPT_ENCODING, encode_json, wire_bytes
+from betteruptime.util.decoders import Decoder, get_decoder
 from betteruptime.util.format import construct_url
+from betteruptime.util.projection import Fields, projection_decoder
+from betteruptime.util.streaming import StreamedPage
 from betteruptime.version import version as __version__
 
 logger: logging.Logger = logging.getLogger("betteruptime.api")
 
+# Set by `HTTPClient.bypass_cache()`
+_bypass_cache: ContextVar[bool] = ContextVar("betteruptime_bypass_cache", default=False)
+
 
 def _get_user_agent_header() -> str:
     """
@@ -30,39 +65,365 @@ def _get_user_agent_header() -> str:
     )
 
 
-def _remove_context(exc: Exception) -> Exception:
+ExceptionT = TypeVar("ExceptionT", bound=Exception)
+
+
+def _remove_context(exc: ExceptionT) -> ExceptionT:
     """Python3: remove context from chained exceptions to prevent leaking API keys in tracebacks."""
     exc.__cause__ = None
     return exc
 
 
+def _was_sent(exc: requests.RequestException) -> bool:
+    """
+    Whether a failed request may have reached the server: refused connections and connect timeouts surely did not.
+    """
+    if isinstance(exc, (requests.exceptions.ConnectTimeout, ConnectError)):
+        return False
+    reason = getattr(exc.args[0] if exc.args else None, "reason", None)
+    return not isinstance(reason, NewConnectionError)
+
+
+def _observe(event: RequestEvent, response: requests.Response, stream: bool) -> None:
+    """
+    Record the final response of a request on its hooks event.
+    """
+    event.elapsed = time.perf_counter() - event.started_at
+    event.status_code = response.status_code
+    # Retries performed by the urllib3 adapter, on top of the rate limiter ones
+    retries = getattr(response.raw, "retries", None)
+    event.retries += len(getattr(retries, "history", None) or ())
+    body = response.request.body if response.request is not None else None
+    event.request_wire_bytes = len(body) if body else 0
+    # Already set to the uncompressed size of gzipped bodies
+    event.request_bytes = event.request_bytes or event.request_wire_bytes
+    if stream:
+        event.response_bytes = event.response_wire_bytes = int(response.headers.get("Content-Length") or 0)
+    else:
+        event.response_bytes = len(response.content or b"")
+        event.response_wire_bytes = wire_bytes(response)
+
+
 class HTTPClient:
     """
-    HTTP client based on 3rd party `requests` module, using a single session.
-    This allows us to keep the session alive to spare some execution time.
+    HTTP client based on 3rd party `requests` module, using a single session per instance.
+    This allows us to keep the session alive to spare some execution time, while clients
+    created with different bearer tokens never share headers nor a connection pool.
+
+    The client is thread-safe: its headers and settings are never changed after creation,
+    the session is created once under a lock and does not store cookies, and every request
+    keeps its state (headers, hooks event, retries) local to the calling thread.
     """
 
     _bearer_token: Optional[str] = None
-    _headers: Dict[str, str] = {
-        "Accept": "application/json",
-        "User-Agent": _get_user_agent_header(),
-    }
-    _session: Optional[requests.Session] = None
-    _session_lock: Lock = Lock()
 
     def __init__(
         self,
         api_url: str = _API_HOST,
         api_version: str = _API_VERSION,
         bearer_token: Optional[str] = None,
+        pool_connections: int = _API_POOL_CONNECTIONS,
+        pool_maxsize: int = _API_POOL_MAXSIZE,
+        pool_block: bool = _API_POOL_BLOCK,
+        max_retries: int = _API_MAX_RETRIES,
+        keep_alive: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        decoder: Union[str, Decoder, None] = None,
+        hooks: Sequence[RequestHook] = (),
+        retry_policy: Optional[RetryPolicy] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        transport: Optional[HTTPTransport] = None,
+        compress_requests: Optional[int] = None,
+        sparse_fieldsets: bool = False,
     ) -> None:
+        """
+        :param api_url: (optional) BetterUptime API URL.
+        :param api_version: (optional) BetterUptime API version.
+        :param bearer_token: (optional) BetterUptime API token.
+        :param pool_connections: (optional) Number of hosts to keep a connection pool for.
+        :param pool_maxsize: (optional) Maximum number of connections kept alive per host.
+        :param pool_block: (optional) When ``True``, wait for a free connection once ``pool_maxsize``
+            connections are in use instead of opening a throw-away connection.
+        :param max_retries: (optional) Number of retries on connection errors.
+        :param keep_alive: (optional) When ``False``, ask the server to close every connection after use.
+        :param rate_limiter: (optional) :class:`RateLimiter` queuing requests and retrying 429/503 responses.
+        :param response_cache: (optional) :class:`ResponseCache` revalidating GET responses with ETags.
+        :param decoder: (optional) JSON decoder, ``"orjson"``, ``"msgspec"``, ``"json"`` or a callable
+            taking the raw body. Defaults to the fastest installed backend.
+        :param hooks: (optional) :class:`RequestHook` objects notified of every request,
+            e.g. a :class:`MetricsCollector`.
+        :param retry_policy: (optional) :class:`RetryPolicy` retrying server errors, timeouts and
+            connection errors with a backoff. It replaces the ``max_retries`` connection retries.
+        :param coalescer: (optional) :class:`RequestCoalescer` sharing one API call between identical
+            GET requests sent at the same time.
+        :param transport: (optional) :class:`HTTPTransport` sending the requests instead of the client
+            `requests` session, e.g. an :class:`~betteruptime.api.httpx_transport.HttpxTransport` multiplexing them over HTTP/2.
+        :param compress_requests: (optional) Gzip the JSON request bodies of at least this many bytes,
+            e.g. ``64 * 1024`` for bulk definitions. Disabled by default.
+        :param sparse_fieldsets: (optional) Ask the API for the requested ``fields`` only, with JSON:API
+            ``fields[type]`` query parameters. Otherwise the payloads are projected while decoded.
+        """
         self.base_url: URL = URL(api_url.strip("/")) / "api" / api_version.strip("/")
         self._bearer_token = bearer_token
-        self._headers.update({"Authorization": f"Bearer {self._bearer_token}"})
+        self._headers: Dict[str, str] = {
+            "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "User-Agent": _get_user_agent_header(),
+            "Authorization": f"Bearer {self._bearer_token}",
+        }
+        if not keep_alive:
+            self._headers["Connection"] = "close"
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._max_retries = max_retries
+        self._session: Optional[requests.Session] = None
+        self._session_lock: Lock = Lock()
+        self._rate_limiter = rate_limiter
+        self._response_cache = response_cache
+        self._decoder = get_decoder(decoder)
+        self._hooks: Tuple[RequestHook, ...] = tuple(hooks)
+        self._retry_policy = retry_policy
+        self._coalescer = coalescer
+        self._transport = transport
+        self._compress_requests = compress_requests
+        self._sparse_fieldsets = sparse_fieldsets
+
+    @property
+    def pool_maxsize(self) -> int:
+        """
+        pool_maxsize property getter.
+        """
+        return self._pool_maxsize
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """
+        rate_limiter property getter.
+        """
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """
+        retry_policy property getter.
+        """
+        return self._retry_policy
+
+    @property
+    def transport(self) -> Optional[HTTPTransport]:
+        """
+        transport property getter.
+        """
+        return self._transport
+
+    @property
+    def sparse_fieldsets(self) -> bool:
+        """
+        sparse_fieldsets property getter.
+        """
+        return self._sparse_fieldsets
+
+    @property
+    def coalescer(self) -> Optional[RequestCoalescer]:
+        """
+        coalescer property getter.
+        """
+        return self._coalescer
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """
+        response_cache property getter.
+        """
+        return self._response_cache
+
+    @staticmethod
+    @contextmanager
+    def bypass_cache() -> Iterator[None]:
+        """
+        Skip the response cache for the requests sent in this block (by the current thread or task).
+        """
+        token = _bypass_cache.set(True)
+        try:
+            yield
+        finally:
+            _bypass_cache.reset(token)
+
+    @property
+    def hooks(self) -> Tuple[RequestHook, ...]:
+        """
+        hooks property getter.
+        """
+        return self._hooks
+
+    @property
+    def decoder(self) -> Decoder:
+        """
+        decoder property getter.
+        """
+        return self._decoder
+
+    def json(self, response: requests.Response, fields: Optional[Fields] = None) -> Any:
+        """
+        Decode a response body as JSON. Every call decodes a new payload, so callers sharing
+        a response (response cache hits, coalesced requests) may modify theirs freely.
+        With `fields`, the items only keep these attributes, see :func:`projection_decoder`.
+        """
+        if fields is not None:
+            return projection_decoder(fields, self._decoder)(response.content)
+        return self._decoder(response.content)
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        `requests` session of this client, created on first use.
+        """
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+                session = self._session
+        return session
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a session whose connection pool is sized after this client settings.
+        """
+        session = requests.Session()
+        http_adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block,
+            # The retry policy owns every retry when configured
+            max_retries=0 if self._retry_policy is not None else self._max_retries,
+        )
+        session.mount("https://", http_adapter)
+        session.mount("http://", http_adapter)
+        session.headers.update(self._headers)
+        # The API authenticates with the bearer token: never store cookies, the cookie jar
+        # would be the only session state updated by the responses of concurrent requests
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    def close(self) -> None:
+        """
+        Close the session, or the transport, and its pooled connections.
+        """
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+        if self._transport is not None:
+            self._transport.close()
+
+    def __enter__(self) -> HTTPClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _send(self, method: str, url: str, event: Optional[RequestEvent] = None, **kwargs: Any) -> requests.Response:
+        """
+        Send a request through the rate limiter and the retry policy.
+        Throttled responses, server errors and network errors are sent again after a backoff.
+        """
+        attempt = 0
+        retries = 0
+        retry_policy = self._retry_policy
+        while True:
+            if retry_policy is not None:
+                retry_policy.before_request(retry=attempt + retries > 0)
+
+            try:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
+                result = self._request_once(method, url, **kwargs)
+            except (requests.ConnectionError, requests.exceptions.Timeout) as exc:
+                if retry_policy is None:
+                    raise
+                if isinstance(exc, requests.exceptions.ProxyError):
+                    retry_policy.release_trial()
+                    raise
+                retry_policy.record(failure=True)
+                if not retry_policy.should_retry(method, retries, sent=_was_sent(exc), headers=kwargs.get("headers")):
+                    raise
+                time.sleep(retry_policy.backoff(retries))
+                retries += 1
+                if event is not None:
+                    event.retries += 1
+                continue
+            except BaseException:
+                # Neither a success nor an API failure, the half-open circuit must not wait for it
+                if retry_policy is not None:
+                    retry_policy.release_trial()
+                raise
+
+            if retry_policy is not None:
+                retry_policy.record(failure=retry_policy.is_failure(result.status_code))
+            if self._rate_limiter is not None:
+                self._rate_limiter.update(result.status_code, result.headers)
+                if self._rate_limiter.should_retry(result.status_code, attempt):
+                    if kwargs.get("stream"):
+                        result.close()
+                    self._rate_limiter.backoff(result.headers, attempt)
+                    attempt += 1
+                    if event is not None:
+                        event.retries += 1
+                    continue
+            if retry_policy is None or not retry_policy.should_retry(
+                method, retries, status_code=result.status_code, headers=kwargs.get("headers")
+            ):
+                return result
+            if kwargs.get("stream"):
+                result.close()
+            time.sleep(retry_policy.backoff(retries))
+            retries += 1
+            if event is not None:
+                event.retries += 1
+
+    def _request_once(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request once, with the session or the transport.
+        """
+        transport = self._transport
+        if transport is None:
+            return self.session.request(method=method, url=url, **kwargs)
+        return transport.request(
+            method,
+            url,
+            headers={**self._headers, "Accept-Encoding": transport.accept_encoding, **(kwargs.get("headers") or {})},
+            params=kwargs.get("params"),
+            json=kwargs.get("json"),
+            data=kwargs.get("data"),
+            timeout=kwargs.get("timeout", _API_TIMEOUT),
+            allow_redirects=kwargs.get("allow_redirects", True),
+            stream=kwargs.get("stream", False),
+        )
+
+    def stream_page(self, response: requests.Response) -> StreamedPage:
+        """
+        Items of a streamed list page response, decoded while the body is read.
+        The response is closed once the page is consumed or closed.
+        """
+        return StreamedPage(self._iter_content(response), close=response.close)
+
+    @staticmethod
+    def _iter_content(response: requests.Response) -> Iterator[bytes]:
+        try:
+            yield from response.iter_content(chunk_size=_API_STREAM_CHUNK_SIZE)
+        except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as exc:
+            raise _remove_context(ClientError(response.request.method or "GET", response.url, exc)) from exc
 
-    @classmethod
     def request(
-        cls,
+        self,
         method: str,
         url: str,
         headers: Optional[Dict[str, str]] = None,
@@ -72,7 +433,8 @@ class HTTPClient:
         allow_redirects: bool = True,
         proxies: Optional[Dict[str, str]] = _API_PROXIES,
         verify: bool = _API_VERIFY,
-        max_retries: int = _API_MAX_RETRIES,
+        cache: bool = True,
+        stream: bool = False,
     ) -> requests.Response:
         """
         Sends a request.
@@ -103,50 +465,150 @@ class HTTPClient:
             certificates, which will make your application vulnerable to
             man-in-the-middle (MitM) attacks. Setting verify to ``False``
             may be useful during local development or testing.
+        :param cache: (optional) boolean, set to ``False`` to skip the response cache for this request.
+        :param stream: (optional) boolean, if ``False``, the response content will be immediately downloaded.
+            Streamed responses are never cached.
         :rtype: requests.Response
         """
-        try:
-            with cls._session_lock:
-                if cls._session is None:
-                    cls._session = requests.Session()
-                    http_adapter = requests.adapters.HTTPAdapter(max_retries=max_retries)
-                    cls._session.mount("https://", http_adapter)
-                    cls._session.headers.update(cls._headers)
-
-            result = cls._session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                json=json,
-                timeout=timeout,
-                allow_redirects=allow_redirects,
-                proxies=proxies,
-                verify=verify,
+        coalescer = self._coalescer
+        if coalescer is not None and method == "GET" and not stream:
+            key = coalescer.key(method, url, params, headers) + (cache and not _bypass_cache.get(),)
+            return coalescer.do(
+                key,
+                partial(
+                    self._request, method, url, headers, params, json, timeout, allow_redirects, proxies, verify, cache
+                ),
             )
+        return self._request(
+            method, url, headers, params, json, timeout, allow_redirects, proxies, verify, cache, stream
+        )
 
-            result.raise_for_status()
-        except requests.exceptions.ProxyError as exc:
-            raise _remove_context(ProxyError(method, url, exc)) from exc
-        except requests.ConnectionError as exc:
-            raise _remove_context(ClientError(method, url, exc)) from exc
-        except requests.exceptions.Timeout as exc:
-            raise _remove_context(HttpTimeout(method, url, timeout)) from exc
-        except requests.exceptions.HTTPError as exc:
-            if exc.response.status_code in (400, 401, 403, 404, 409, 422, 429):
-                # This gets caught afterwards and raises an ApiError exception
-                pass
-            else:
-                raise _remove_context(HTTPError(exc.response.status_code, result.reason)) from exc
-        except TypeError as exc:
-            raise TypeError(
-                "Your installed version of `requests` library seems not compatible with"
-                "BetterUptime's usage. We recommend upgrading it ('pip install -U requests')."
-            ) from exc
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        json: Any,
+        timeout: float,
+        allow_redirects: bool,
+        proxies: Optional[Dict[str, str]],
+        verify: bool,
+        cache: bool,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send a request through the response cache, the rate limiter and the retry policy, see :meth:`request`.
+        """
+        event: Optional[RequestEvent] = None
+        if self._hooks:
+            event = RequestEvent(method=method, url=url, endpoint=self._endpoint(url))
+            call_hooks(self._hooks, "before_send", event)
 
+        try:
+            response_cache = self._response_cache
+            cache_key: Optional[CacheKey] = None
+            cached: Optional[CachedResponse] = None
+            if response_cache is not None and method == "GET" and not stream:
+                if cache and not _bypass_cache.get():
+                    cache_key = response_cache.key(method, url, params)
+                    cached = response_cache.get(cache_key)
+                    if cached is not None:
+                        headers = {**(headers or {}), **cached.conditional_headers()}
+                else:
+                    response_cache.bypass()
+
+            data: Optional[bytes] = None
+            if json is not None and self._compress_requests is not None:
+                data, body_headers, size = encode_json(json, self._compress_requests)
+                headers = {**body_headers, **(headers or {})}
+                json = None
+                if event is not None:
+                    event.request_bytes = size
+
+            try:
+                result = self._send(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    params=params,
+                    json=json,
+                    data=data,
+                    timeout=timeout,
+                    allow_redirects=allow_redirects,
+                    proxies=proxies,
+                    verify=verify,
+                    stream=stream,
+                    event=event,
+                )
+                if event is not None:
+                    _observe(event, result, stream)
+
+                if response_cache is not None and cache_key is not None:
+                    if cached is not None and result.status_code == 304:
+                        result = response_cache.hit(cached)
+                    else:
+                        response_cache.store(cache_key, result)
+
+                result.raise_for_status()
+            except HttpBackoff as exc:
+                raise self._failed(event, exc)
+            except requests.exceptions.ProxyError as exc:
+                raise self._failed(event, ProxyError(method, url, exc)) from exc
+            except requests.ConnectionError as exc:
+                raise self._failed(event, ClientError(method, url, exc, sent=_was_sent(exc))) from exc
+            except requests.exceptions.Timeout as exc:
+                raise self._failed(event, HttpTimeout(method, url, timeout, sent=_was_sent(exc))) from exc
+            except requests.exceptions.HTTPError as exc:
+                if exc.response.status_code in _API_ERROR_STATUS_CODES:
+                    # This gets caught afterwards and raises an ApiError exception
+                    pass
+                else:
+                    raise self._failed(event, HTTPError(exc.response.status_code, result.reason)) from exc
+            except TypeError as exc:
+                raise self._failed(
+                    event,
+                    TypeError(
+                        "Your installed version of `requests` library seems not compatible with"
+                        "BetterUptime's usage. We recommend upgrading it ('pip install -U requests')."
+                    ),
+                ) from exc
+        except BaseException as exc:
+            # Unmapped errors and interruptions still end the request for the hooks
+            if event is not None and event.error is None:
+                self._notify_error(event, exc)
+            raise
+
+        if event is not None:
+            call_hooks(self._hooks, "after_response", event)
         return result
 
-    def get(self, path: URL, **kwargs: Any) -> requests.Response:
+    def _endpoint(self, url: str) -> str:
+        """
+        Templated path of `url` relative to the API base url, e.g. `monitors/{id}`.
+        """
+        base_url = str(self.base_url)
+        path = url[len(base_url) :] if url.startswith(base_url) else urlsplit(url).path
+        return endpoint_template(path.split("?", 1)[0])
+
+    def _failed(self, event: Optional[RequestEvent], error: ExceptionT) -> ExceptionT:
+        """
+        Notify the hooks of a request `error`, then return it ready to be raised.
+        """
+        if event is not None:
+            self._notify_error(event, error)
+        return _remove_context(error)
+
+    def _notify_error(self, event: RequestEvent, error: BaseException) -> None:
+        """
+        Notify the hooks of a request `error`.
+        """
+        if event.elapsed is None:
+            event.elapsed = time.perf_counter() - event.started_at
+        event.error = error
+        call_hooks(self._hooks, "on_error", event)
+
+    def get(self, path: Union[URL, str], **kwargs: Any) -> requests.Response:
         r"""Sends a GET request. Returns :class:`Response` object.
 
         :param path: PATH for the request.
@@ -157,7 +619,7 @@ class HTTPClient:
         kwargs.setdefault("allow_redirects", True)
         return self.request("GET", construct_url(self.base_url, path), **kwargs)
 
-    def options(self, path: URL, **kwargs: Any) -> requests.Response:
+    def options(self, path: Union[URL, str], **kwargs: Any) -> requests.Response:
         r"""Sends a OPTIONS request. Returns :class:`Response` object.
 
         :param path: UPATHRL for the request.
@@ -168,7 +630,7 @@ class HTTPClient:
         kwargs.setdefault("allow_redirects", True)
         return self.request("OPTIONS", construct_url(self.base_url, path), **kwargs)
 
-    def head(self, path: URL, **kwargs: Any) -> requests.Response:
+    def head(self, path: Union[URL, str], **kwargs: Any) -> requests.Response:
         r"""Sends a HEAD request. Returns :class:`Response` object.
 
         :param path: PATH for the request.
@@ -179,7 +641,7 @@ class HTTPClient:
         kwargs.setdefault("allow_redirects", False)
         return self.request("HEAD", construct_url(self.base_url, path), **kwargs)
 
-    def post(self, path: URL, json: Any = None, **kwargs: Any) -> requests.Response:
+    def post(self, path: Union[URL, str], json: Any = None, **kwargs: Any) -> requests.Response:
         r"""Sends a POST request. Returns :class:`Response` object.
 
         :param path: PATH for the request.
@@ -190,7 +652,7 @@ class HTTPClient:
 
         return self.request("POST", construct_url(self.base_url, path), json=json, **kwargs)
 
-    def put(self, path: URL, json: Any = None, **kwargs: Any) -> requests.Response:
+    def put(self, path: Union[URL, str], json: Any = None, **kwargs: Any) -> requests.Response:
         r"""Sends a PUT request. Returns :class:`Response` object.
 
         :param path: PATH for the request.
@@ -202,7 +664,7 @@ class HTTPClient:
 
         return self.request("PUT", construct_url(self.base_url, path), json=json, **kwargs)
 
-    def patch(self, path: URL, json: Any = None, **kwargs: Any) -> requests.Response:
+    def patch(self, path: Union[URL, str], json: Any = None, **kwargs: Any) -> requests.Response:
         r"""Sends a PATCH request. Returns :class:`Response` object.
 
         :param path: PATH for the request.
@@ -214,7 +676,7 @@ class HTTPClient:
 
         return self.request("PATCH", construct_url(self.base_url, path), json=json, **kwargs)
 
-    def delete(self, path: URL, **kwargs: Any) -> requests.Response:
+    def delete(self, path: Union[URL, str], **kwargs: Any) -> requests.Response:
         r"""Sends a DELETE request. Returns :class:`Response` object.
 
         :param path: PATH for the request.
@@ -0,0 +1,189 @@
+"""
+HTTP/2 capable transport for BetterUptime API client, based on `httpx`.
+"""
+from __future__ import annotations
+
+# stdlib
+import threading
+from typing import Any, Dict, Iterator, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# betteruptime
+from betteruptime.api import _API_MAX_RETRIES, _API_POOL_MAXSIZE, _API_PROXIES, _API_TIMEOUT, _API_VERIFY
+from betteruptime.api.transport import ConnectError, HTTPTransport
+from betteruptime.util.compression import WIRE_BYTES
+
+try:
+    import httpx
+
+    _HAS_HTTPX = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_HTTPX = False
+
+
+class _StreamedBody:
+    """
+    `requests.Response.raw` stand-in reading a streamed `httpx` response.
+    """
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._response = response
+
+    def stream(self, amt: int = 65536, decode_content: bool = True) -> Iterator[bytes]:
+        try:
+            yield from self._response.iter_bytes(amt)
+        except httpx.TransportError as exc:
+            raise requests.ConnectionError(str(exc)) from exc
+        finally:
+            self._response.close()
+
+    def close(self) -> None:
+        self._response.close()
+
+
+class HttpxTransport(HTTPTransport):
+    """
+    Transport based on 3rd party `httpx` module (`pip install betteruptime[http2]`).
+
+    With `http2`, concurrent requests to the API are multiplexed over a single HTTP/2
+    connection instead of opening one connection, and one TLS handshake, per request
+    in flight. The client is thread-safe, share it between the threads of a process.
+    TLS verification and proxies are set once for the transport.
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: int = _API_POOL_MAXSIZE,
+        proxies: Optional[Dict[str, str]] = _API_PROXIES,
+        verify: bool = _API_VERIFY,
+        max_retries: int = _API_MAX_RETRIES,
+    ) -> None:
+        """
+        :param http2: Negotiate HTTP/2 with the API (requires the `h2` package), HTTP/1.1 otherwise.
+        :param max_connections: Maximum number of connections, HTTP/2 needs only one per host.
+        :param proxies: (optional) `requests` style proxies, e.g. ``{"https": "http://proxy:3128"}``.
+        :param verify: Verify the server TLS certificate.
+        :param max_retries: Number of retries on connection errors.
+        """
+        if not _HAS_HTTPX:
+            raise ImportError(
+                "HttpxTransport requires the `httpx` package. Install it with 'pip install betteruptime[http2]'."
+            )
+        self.http2 = http2
+        self._max_connections = max_connections
+        self._proxies = proxies
+        self._verify = verify
+        self._max_retries = max_retries
+        self._client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+        if http2:
+            # Fail at configuration time rather than on the first request
+            self._create_client().close()
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        `httpx` client of this transport, created on first use.
+        """
+        client = self._client
+        if client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._create_client()
+                client = self._client
+        return client
+
+    @property
+    def accept_encoding(self) -> str:  # type: ignore[override]
+        """
+        Content codings `httpx` decodes: gzip and deflate, plus br and zstd when their decoders are installed.
+        """
+        return self.client.headers["Accept-Encoding"]
+
+    def _create_client(self) -> httpx.Client:
+        limits = httpx.Limits(max_connections=self._max_connections, max_keepalive_connections=self._max_connections)
+        options: Dict[str, Any] = {
+            "http2": self.http2,
+            "verify": self._verify,
+            "limits": limits,
+            "retries": self._max_retries,
+        }
+        try:
+            return httpx.Client(
+                transport=httpx.HTTPTransport(**options),
+                mounts={
+                    f"{scheme}://": httpx.HTTPTransport(proxy=proxy, **options)
+                    for scheme, proxy in (self._proxies or {}).items()
+                },
+            )
+        except ImportError as exc:
+            raise ImportError(
+                "HTTP/2 requires the `h2` package. Install it with 'pip install betteruptime[http2]'."
+            ) from exc
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        data: Optional[bytes] = None,
+        timeout: float = _API_TIMEOUT,
+        allow_redirects: bool = True,
+        stream: bool = False,
+    ) -> requests.Response:
+        client = self.client
+        request = client.build_request(
+            method, url, headers=headers, params=params, json=json, content=data, timeout=timeout
+        )
+        try:
+            response = client.send(request, stream=stream, follow_redirects=allow_redirects)
+        except httpx.ProxyError as exc:
+            raise requests.exceptions.ProxyError(str(exc)) from exc
+        except httpx.ConnectTimeout as exc:
+            raise requests.exceptions.ConnectTimeout(str(exc)) from exc
+        except httpx.TimeoutException as exc:
+            raise requests.exceptions.ReadTimeout(str(exc)) from exc
+        except httpx.ConnectError as exc:
+            raise ConnectError(str(exc)) from exc
+        except httpx.TransportError as exc:
+            raise requests.ConnectionError(str(exc)) from exc
+        return self._to_requests_response(request, response, stream)
+
+    @staticmethod
+    def _to_requests_response(request: httpx.Request, response: httpx.Response, stream: bool) -> requests.Response:
+        """
+        `requests.Response` view of an `httpx` response, the body is read unless `stream` is set.
+        """
+        prepared = requests.PreparedRequest()
+        prepared.method = request.method
+        prepared.url = str(request.url)
+        prepared.headers = CaseInsensitiveDict(request.headers)
+        prepared.body = request.content or None
+
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.headers = CaseInsensitiveDict(response.headers)
+        result.encoding = get_encoding_from_headers(result.headers)
+        result.url = str(response.url)
+        result.request = prepared
+        if stream:
+            result.raw = _StreamedBody(response)
+        else:
+            result._content = response.content
+            result._content_consumed = True  # type: ignore[attr-defined]
+            result.elapsed = response.elapsed
+            result.__dict__[WIRE_BYTES] = response.num_bytes_downloaded
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
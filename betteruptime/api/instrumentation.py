@@ -0,0 +1,352 @@
+"""
+Request instrumentation hooks and metrics for BetterUptime API client.
+"""
+from __future__ import annotations
+
+import bisect
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from betteruptime.version import version as __version__
+
+logger: logging.Logger = logging.getLogger("betteruptime.api")
+
+_ID_SEGMENT = re.compile(r"^\d+$")
+
+
+@lru_cache(maxsize=1024)
+def endpoint_template(path: str) -> str:
+    """
+    Path with its resource ids replaced by `{id}`, e.g. `monitors/123456` becomes `monitors/{id}`.
+    """
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.strip("/").split("/"))
+
+
+@dataclass
+class RequestEvent:
+    """
+    A request, as seen by the hooks. Response fields are set before `after_response` and `on_error`.
+    """
+
+    #: HTTP method.
+    method: str
+    #: Full request URL.
+    url: str
+    #: Templated path relative to the API base url, e.g. `monitors/{id}`.
+    endpoint: str
+    #: `time.perf_counter()` when the request started.
+    started_at: float = field(default_factory=time.perf_counter)
+    #: Status code of the final response, `None` when no response was received.
+    status_code: Optional[int] = None
+    #: Seconds from the start of the request to the final response or error, retries included.
+    elapsed: Optional[float] = None
+    #: Request body size, before compression.
+    request_bytes: int = 0
+    #: Response body size, decoded.
+    response_bytes: int = 0
+    #: Request body size on the wire, compressed when the body was gzipped.
+    request_wire_bytes: int = 0
+    #: Response body size on the wire, before its content coding is decoded.
+    response_wire_bytes: int = 0
+    #: Retries performed by the connection adapter and the rate limiter.
+    retries: int = 0
+    #: Exception raised to the caller.
+    error: Optional[BaseException] = None
+
+
+class RequestHook:
+    """
+    Base class of request hooks, called by the HTTP clients for every request.
+    Override the methods you need, exceptions raised by hooks are logged and ignored.
+    """
+
+    def before_send(self, event: RequestEvent) -> None:
+        """
+        Called before the request is sent.
+        """
+
+    def after_response(self, event: RequestEvent) -> None:
+        """
+        Called once the final response was received, retries included.
+        """
+
+    def on_error(self, event: RequestEvent) -> None:
+        """
+        Called when the request raises, e.g. a connection error or an unexpected HTTP error status.
+        """
+
+
+def call_hooks(hooks: Iterable[RequestHook], name: str, event: RequestEvent) -> None:
+    """
+    Call the `name` method of every hook, logging their exceptions.
+    """
+    for hook in hooks:
+        try:
+            getattr(hook, name)(event)
+        except Exception:
+            logger.exception("BetterUptime request hook %r failed in %s.", hook, name)
+
+
+@dataclass(frozen=True)
+class EndpointStats:
+    """
+    Snapshot of the requests sent to an endpoint.
+    """
+
+    method: str
+    endpoint: str
+    requests: int
+    errors: int
+    retries: int
+    request_bytes: int
+    response_bytes: int
+    #: Total seconds spent in these requests.
+    total_time: float
+    request_wire_bytes: int = 0
+    response_wire_bytes: int = 0
+
+    @property
+    def mean_latency(self) -> float:
+        """
+        Mean request duration, in seconds.
+        """
+        return self.total_time / self.requests if self.requests else 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        """
+        Decoded response bytes per byte received on the wire, 1.0 for uncompressed responses.
+        """
+        return self.response_bytes / self.response_wire_bytes if self.response_wire_bytes else 1.0
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int) -> None:
+        # One more bucket for +Inf
+        self.counts = [0] * (buckets + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+EndpointKey = Tuple[str, str]
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class MetricsCollector(RequestHook):
+    """
+    Aggregates per-endpoint request counters, latency histograms and an in-flight gauge.
+
+        metrics = MetricsCollector()
+        client = betteruptime.Client(bearer_token="...", hooks=[metrics])
+        print(metrics.to_prometheus())
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "betteruptime_client") -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._statuses: Dict[Tuple[str, str, str], int] = {}
+        self._latencies: Dict[EndpointKey, _Histogram] = {}
+        self._errors: Dict[EndpointKey, int] = {}
+        self._retries: Dict[EndpointKey, int] = {}
+        self._request_bytes: Dict[EndpointKey, int] = {}
+        self._response_bytes: Dict[EndpointKey, int] = {}
+        self._request_wire_bytes: Dict[EndpointKey, int] = {}
+        self._response_wire_bytes: Dict[EndpointKey, int] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Requests currently in flight.
+        """
+        return self._in_flight
+
+    def before_send(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._in_flight += 1
+
+    def after_response(self, event: RequestEvent) -> None:
+        self._record(event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        self._record(event)
+
+    def _record(self, event: RequestEvent) -> None:
+        key = (event.method, event.endpoint)
+        status = str(event.status_code) if event.status_code is not None else "error"
+        elapsed = event.elapsed or 0.0
+        with self._lock:
+            self._in_flight -= 1
+            self._statuses[key + (status,)] = self._statuses.get(key + (status,), 0) + 1
+            histogram = self._latencies.get(key)
+            if histogram is None:
+                histogram = self._latencies[key] = _Histogram(len(self.buckets))
+            histogram.counts[bisect.bisect_left(self.buckets, elapsed)] += 1
+            histogram.sum += elapsed
+            histogram.count += 1
+            if event.error is not None:
+                self._errors[key] = self._errors.get(key, 0) + 1
+            self._retries[key] = self._retries.get(key, 0) + event.retries
+            self._request_bytes[key] = self._request_bytes.get(key, 0) + event.request_bytes
+            self._response_bytes[key] = self._response_bytes.get(key, 0) + event.response_bytes
+            self._request_wire_bytes[key] = self._request_wire_bytes.get(key, 0) + event.request_wire_bytes
+            self._response_wire_bytes[key] = self._response_wire_bytes.get(key, 0) + event.response_wire_bytes
+
+    def endpoints(self) -> List[EndpointStats]:
+        """
+        Per-endpoint snapshot, busiest endpoints first.
+        """
+        with self._lock:
+            stats = [
+                EndpointStats(
+                    method=method,
+                    endpoint=endpoint,
+                    requests=histogram.count,
+                    errors=self._errors.get((method, endpoint), 0),
+                    retries=self._retries[(method, endpoint)],
+                    request_bytes=self._request_bytes[(method, endpoint)],
+                    response_bytes=self._response_bytes[(method, endpoint)],
+                    total_time=histogram.sum,
+                    request_wire_bytes=self._request_wire_bytes[(method, endpoint)],
+                    response_wire_bytes=self._response_wire_bytes[(method, endpoint)],
+                )
+                for (method, endpoint), histogram in self._latencies.items()
+            ]
+        return sorted(stats, key=lambda endpoint: endpoint.requests, reverse=True)
+
+    def reset(self) -> None:
+        """
+        Drop every measure, the in-flight gauge excepted.
+        """
+        with self._lock:
+            for measures in (
+                self._statuses,
+                self._latencies,
+                self._errors,
+                self._retries,
+                self._request_bytes,
+                self._response_bytes,
+                self._request_wire_bytes,
+                self._response_wire_bytes,
+            ):
+                measures.clear()
+
+    def to_prometheus(self) -> str:
+        """
+        Snapshot in the Prometheus text exposition format.
+        """
+        name = self.prefix
+        lines: List[str] = []
+
+        def metric(suffix: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name}_{suffix} {help_text}")
+            lines.append(f"# TYPE {name}_{suffix} {kind}")
+
+        with self._lock:
+            metric("requests_total", "counter", "Requests sent, by endpoint and status.")
+            for (method, endpoint, status), count in sorted(self._statuses.items()):
+                lines.append(f"{name}_requests_total{_labels(method=method, endpoint=endpoint, status=status)} {count}")
+
+            metric("request_duration_seconds", "histogram", "Request duration, retries included.")
+            for (method, endpoint), histogram in sorted(self._latencies.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), histogram.counts):
+                    cumulative += count
+                    labels = _labels(method=method, endpoint=endpoint, le=_format_number(bound))
+                    lines.append(f"{name}_request_duration_seconds_bucket{labels} {cumulative}")
+                labels = _labels(method=method, endpoint=endpoint)
+                lines.append(f"{name}_request_duration_seconds_sum{labels} {histogram.sum!r}")
+                lines.append(f"{name}_request_duration_seconds_count{labels} {histogram.count}")
+
+            for suffix, help_text, measures in (
+                ("retries_total", "Retries performed by the connection adapter and the rate limiter.", self._retries),
+                ("request_bytes_total", "Request bodies size, before compression.", self._request_bytes),
+                ("response_bytes_total", "Response bodies size, decoded.", self._response_bytes),
+                ("request_wire_bytes_total", "Request bodies size on the wire.", self._request_wire_bytes),
+                ("response_wire_bytes_total", "Response bodies size on the wire.", self._response_wire_bytes),
+            ):
+                metric(suffix, "counter", help_text)
+                for (method, endpoint), value in sorted(measures.items()):
+                    lines.append(f"{name}_{suffix}{_labels(method=method, endpoint=endpoint)} {value}")
+
+            metric("requests_in_flight", "gauge", "Requests currently in flight.")
+            lines.append(f"{name}_requests_in_flight {self._in_flight}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+class OpenTelemetryHook(RequestHook):
+    """
+    Records the requests with OpenTelemetry metrics instruments, following the HTTP client semantic conventions.
+    Requires the `opentelemetry-api` package.
+    """
+
+    def __init__(self, meter_provider: Optional[Any] = None) -> None:
+        # Imported here rather than at module level, it is slow to import and only used by this hook
+        try:
+            from opentelemetry import metrics as otel_metrics
+        except ImportError:  # pragma: no cover - optional dependency
+            raise ImportError(
+                "OpenTelemetryHook requires the `opentelemetry-api` package."
+                " Install it with 'pip install betteruptime[opentelemetry]'."
+            ) from None
+        meter = otel_metrics.get_meter("betteruptime", __version__, meter_provider=meter_provider)
+        self._duration = meter.create_histogram(
+            "http.client.request.duration", unit="s", description="Duration of HTTP client requests."
+        )
+        self._active = meter.create_up_down_counter(
+            "http.client.active_requests", unit="{request}", description="Number of active HTTP requests."
+        )
+        self._retries = meter.create_counter(
+            "betteruptime.client.retries", unit="{retry}", description="Retries of the BetterUptime requests."
+        )
+        self._request_size = meter.create_counter(
+            "http.client.request.body.size", unit="By", description="Size of HTTP client request bodies."
+        )
+        self._response_size = meter.create_counter(
+            "http.client.response.body.size", unit="By", description="Size of HTTP client response bodies."
+        )
+
+    def before_send(self, event: RequestEvent) -> None:
+        self._active.add(1, {"http.request.method": event.method, "url.template": event.endpoint})
+
+    def after_response(self, event: RequestEvent) -> None:
+        self._record(event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        self._record(event)
+
+    def _record(self, event: RequestEvent) -> None:
+        base = {"http.request.method": event.method, "url.template": event.endpoint}
+        self._active.add(-1, base)
+        attributes: Dict[str, Any] = dict(base)
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        if event.error is not None:
+            attributes["error.type"] = type(event.error).__name__
+        self._duration.record(event.elapsed or 0.0, attributes)
+        if event.retries:
+            self._retries.add(event.retries, attributes)
+        # The semantic conventions measure the bodies as transferred, compressed
+        self._request_size.add(event.request_wire_bytes, attributes)
+        self._response_size.add(event.response_wire_bytes, attributes)
@@ -0,0 +1,290 @@
+"""
+Client side rate limiting for BetterUptime API client.
+"""
+from __future__ import annotations
+
+# stdlib
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional, Tuple
+
+logger: logging.Logger = logging.getLogger("betteruptime.api")
+
+# Reset headers above this value are epoch timestamps rather than a delay in seconds.
+_EPOCH_THRESHOLD: float = 1e9
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """
+    Snapshot of a :class:`RateLimiter` activity.
+    """
+
+    #: Requests currently waiting for a token.
+    queue_depth: int
+    #: Highest number of requests waiting at the same time.
+    max_queue_depth: int
+    #: Requests that went through the limiter.
+    requests: int
+    #: Requests that had to wait for a token.
+    delayed: int
+    #: Cumulated time spent waiting for tokens, in seconds.
+    total_wait: float
+    #: Responses with a retryable status code (429, 503).
+    throttled: int
+    #: Requests sent again after a retryable status code.
+    retries: int
+
+    @property
+    def mean_wait(self) -> float:
+        """
+        Mean time a request waited for a token, in seconds.
+        """
+        return self.total_wait / self.requests if self.requests else 0.0
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every request of a client.
+
+    Tokens are refilled at `rate` per second up to `burst`. A request that finds the bucket
+    empty reserves the next token and waits for it, so requests are queued in arrival order
+    instead of failing. The bucket learns from `RateLimit-*` / `X-RateLimit-*` response headers
+    and is paused for the `Retry-After` delay when the API answers 429 or 503.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        jitter: float = 0.1,
+        retry_statuses: Tuple[int, ...] = (429, 503),
+    ) -> None:
+        """
+        :param rate: Requests per second allowed once the burst is consumed.
+        :param burst: Requests that can be sent at once when the bucket is full.
+        :param max_retries: Times a request is sent again after a retryable status code.
+        :param backoff_factor: Base delay of the exponential backoff, used without `Retry-After`.
+        :param max_backoff: Upper bound of any backoff delay, in seconds.
+        :param jitter: Random share added to the `Retry-After` delay to spread retries.
+        :param retry_statuses: Status codes that pause the bucket and are retried.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("RateLimiter rate must be positive and burst at least 1.")
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = retry_statuses
+
+        self._lock = threading.Lock()
+        self._tokens: float = float(burst)
+        self._updated_at: float = time.monotonic()
+        self._paused_until: float = 0.0
+
+        self._queue_depth = 0
+        self._max_queue_depth = 0
+        self._requests = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._throttled = 0
+        self._retries = 0
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """
+        Current activity counters.
+        """
+        with self._lock:
+            return RateLimiterStats(
+                queue_depth=self._queue_depth,
+                max_queue_depth=self._max_queue_depth,
+                requests=self._requests,
+                delayed=self._delayed,
+                total_wait=self._total_wait,
+                throttled=self._throttled,
+                retries=self._retries,
+            )
+
+    @property
+    def expected_wait(self) -> float:
+        """
+        Time a request issued now would wait for a token, in seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return self._delay_for_next_token(now)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def _delay_for_next_token(self, now: float) -> float:
+        delay = (1.0 - self._tokens) / self.rate if self._tokens < 1.0 else 0.0
+        return max(delay, self._paused_until - now, 0.0)
+
+    def reserve(self) -> float:
+        """
+        Take a token, possibly in advance. Returns how long the caller must wait before sending.
+        A positive delay counts the caller in the queue until :meth:`release` is called.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            delay = self._delay_for_next_token(now)
+            # The bucket may go negative: it is how later callers queue behind this reservation.
+            self._tokens -= 1.0
+            self._requests += 1
+            if delay > 0:
+                self._delayed += 1
+                self._total_wait += delay
+                self._queue_depth += 1
+                self._max_queue_depth = max(self._max_queue_depth, self._queue_depth)
+            return delay
+
+    def release(self) -> None:
+        """
+        Remove a caller that waited for its reservation from the queue.
+        """
+        with self._lock:
+            self._queue_depth -= 1
+
+    def acquire(self) -> float:
+        """
+        Block until a token is available. Returns the time waited, in seconds.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            try:
+                time.sleep(delay)
+            finally:
+                self.release()
+        return delay
+
+    async def acquire_async(self) -> float:
+        """
+        Wait without blocking the event loop until a token is available. Returns the time waited, in seconds.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self.release()
+        return delay
+
+    def pause(self, delay: float) -> None:
+        """
+        Hold every request for `delay` seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + delay)
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+
+    def update(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        Learn from a response rate limit headers.
+        """
+        limit = _header_number(headers, "RateLimit-Limit", "X-RateLimit-Limit")
+        remaining = _header_number(headers, "RateLimit-Remaining", "X-RateLimit-Remaining")
+        reset = _header_number(headers, "RateLimit-Reset", "X-RateLimit-Reset")
+        window = _policy_window(headers.get("RateLimit-Policy"))
+
+        if reset is not None and reset > _EPOCH_THRESHOLD:
+            reset = max(reset - time.time(), 0.0)
+
+        with self._lock:
+            if limit is not None and limit >= 1 and window:
+                self.rate = limit / window
+                self.burst = int(limit)
+            if remaining is not None:
+                self._refill(time.monotonic())
+                self._tokens = min(self._tokens, remaining)
+
+        if remaining == 0 and reset:
+            self.pause(min(reset, self.max_backoff))
+
+        if status_code in self.retry_statuses:
+            with self._lock:
+                self._throttled += 1
+
+    def should_retry(self, status_code: int, attempt: int) -> bool:
+        """
+        Whether a response with `status_code` must be sent again, `attempt` retries were already made.
+        """
+        return status_code in self.retry_statuses and attempt < self.max_retries
+
+    def backoff(self, headers: Mapping[str, str], attempt: int) -> float:
+        """
+        Pause the bucket before retry number `attempt` + 1 and count the retry.
+        The delay is the `Retry-After` header plus jitter, or a jittered exponential backoff without it.
+        """
+        retry_after = _retry_after(headers.get("Retry-After"))
+        if retry_after is not None:
+            delay = retry_after * (1.0 + random.uniform(0.0, self.jitter))
+        else:
+            delay = random.uniform(0.0, self.backoff_factor * (2**attempt))
+        delay = min(delay, self.max_backoff)
+
+        logger.debug("Rate limited by BetterUptime, retrying in %.2f seconds.", delay)
+        with self._lock:
+            self._retries += 1
+        self.pause(delay)
+        return delay
+
+
+def _header_number(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    """
+    First header of `names` parsed as a number, `None` when missing or invalid.
+    """
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value.split(",")[0].strip())
+            except ValueError:
+                return None
+    return None
+
+
+def _policy_window(policy: Optional[str]) -> Optional[float]:
+    """
+    Window in seconds of a `RateLimit-Policy: 100;w=60` header.
+    """
+    if not policy:
+        return None
+    match = re.search(r";\s*w=(\d+(?:\.\d+)?)", policy)
+    return float(match.group(1)) if match else None
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    `Retry-After` header in seconds, it can either be a delay or an HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
@@ -0,0 +1,231 @@
+"""
+Retry policy for BetterUptime API client.
+"""
+from __future__ import annotations
+
+# stdlib
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import FrozenSet, Mapping, Optional, Tuple
+
+from betteruptime.api.exceptions import HttpBackoff
+
+logger: logging.Logger = logging.getLogger("betteruptime.api")
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half-open"
+
+
+@dataclass(frozen=True)
+class RetryPolicyStats:
+    """
+    Snapshot of a :class:`RetryPolicy` activity.
+    """
+
+    #: Requests that went through the policy, retries excluded.
+    requests: int
+    #: Requests sent again after an error.
+    retries: int
+    #: Retries refused because the retry budget was spent.
+    budget_exhausted: int
+    #: `closed`, `open` or `half-open`.
+    circuit_state: str
+    #: Times the circuit breaker opened.
+    circuit_opened: int
+    #: Requests failed fast while the circuit was open.
+    short_circuited: int
+
+
+class RetryPolicy:
+    """
+    Retries failed requests with a jittered exponential backoff.
+
+    Idempotent methods are retried after connection errors, timeouts and `retry_statuses`.
+    Other methods (`POST`, `PATCH`) are only retried when the request surely never reached
+    the server, or when it carries an `Idempotency-Key` header. A retry budget caps retries
+    to a share of the traffic, and a circuit breaker fails fast with :class:`HttpBackoff`
+    after `failure_threshold` consecutive server errors or timeouts.
+
+    429 and 503 responses are left to the :class:`RateLimiter`, which follows `Retry-After`.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: Tuple[int, ...] = (500, 502, 504),
+        idempotent_methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}),
+        budget_ratio: float = 0.2,
+        min_retries_per_window: int = 10,
+        budget_window: float = 10.0,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+    ) -> None:
+        """
+        :param max_retries: Times a single request is sent again.
+        :param backoff_factor: Base delay of the exponential backoff, the delay before retry `n`
+            is drawn in `[0, backoff_factor * 2 ** n]` ("full jitter").
+        :param max_backoff: Upper bound of a backoff delay, in seconds.
+        :param retry_statuses: Status codes retried for idempotent methods.
+        :param idempotent_methods: Methods that can safely be sent again after a response or a timeout.
+        :param budget_ratio: Retries allowed per request sent, over a `budget_window`.
+        :param min_retries_per_window: Retries always allowed per `budget_window`, for low traffic.
+        :param budget_window: Length of the retry budget window, in seconds.
+        :param failure_threshold: Consecutive server errors or timeouts opening the circuit, 0 disables it.
+        :param recovery_time: Seconds the circuit stays open before a trial request is let through.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+        self.idempotent_methods = idempotent_methods
+        self.budget_ratio = budget_ratio
+        self.min_retries_per_window = min_retries_per_window
+        self.budget_window = budget_window
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+
+        self._lock = threading.Lock()
+        self._window_started_at = time.monotonic()
+        self._window_requests = 0
+        self._window_retries = 0
+        self._consecutive_failures = 0
+        self._circuit_state = CIRCUIT_CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+        self._requests = 0
+        self._retries = 0
+        self._budget_exhausted = 0
+        self._circuit_opened = 0
+        self._short_circuited = 0
+
+    @property
+    def stats(self) -> RetryPolicyStats:
+        """
+        Current activity counters.
+        """
+        with self._lock:
+            return RetryPolicyStats(
+                requests=self._requests,
+                retries=self._retries,
+                budget_exhausted=self._budget_exhausted,
+                circuit_state=self._circuit_state,
+                circuit_opened=self._circuit_opened,
+                short_circuited=self._short_circuited,
+            )
+
+    def before_request(self, retry: bool = False) -> None:
+        """
+        Let a request (or a retry) through, or raise :class:`HttpBackoff` while the circuit is open.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._circuit_state == CIRCUIT_OPEN:
+                remaining = self._opened_at + self.recovery_time - now
+                if remaining > 0:
+                    self._short_circuited += 1
+                    raise HttpBackoff(max(round(remaining, 1), 0.1))
+                self._circuit_state = CIRCUIT_HALF_OPEN
+                self._trial_in_flight = False
+            if self._circuit_state == CIRCUIT_HALF_OPEN:
+                # A single trial request tells whether the API recovered
+                if self._trial_in_flight:
+                    self._short_circuited += 1
+                    raise HttpBackoff(self.recovery_time)
+                self._trial_in_flight = True
+            if not retry:
+                self._roll_window(now)
+                self._requests += 1
+                self._window_requests += 1
+
+    def record(self, failure: bool) -> None:
+        """
+        Record the outcome of a request: `failure` for server errors, timeouts and connection errors.
+        """
+        with self._lock:
+            if not failure:
+                self._consecutive_failures = 0
+                self._circuit_state = CIRCUIT_CLOSED
+                self._trial_in_flight = False
+                return
+            self._consecutive_failures += 1
+            if self._circuit_state == CIRCUIT_HALF_OPEN or (
+                self.failure_threshold and self._consecutive_failures >= self.failure_threshold
+            ):
+                if self._circuit_state != CIRCUIT_OPEN:
+                    self._circuit_opened += 1
+                    logger.warning(
+                        "BetterUptime API failed %d times in a row, failing fast for %.1f seconds.",
+                        self._consecutive_failures,
+                        self.recovery_time,
+                    )
+                self._circuit_state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """
+        End a request without recording its outcome, e.g. a proxy error or a cancellation.
+        While the circuit is half-open, the next request becomes the trial request.
+        """
+        with self._lock:
+            if self._circuit_state == CIRCUIT_HALF_OPEN:
+                self._trial_in_flight = False
+
+    def is_failure(self, status_code: int) -> bool:
+        """
+        Whether a response counts as a failure for the circuit breaker.
+        """
+        return status_code >= 500
+
+    def should_retry(
+        self,
+        method: str,
+        retries: int,
+        status_code: Optional[int] = None,
+        sent: bool = True,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> bool:
+        """
+        Whether a request must be sent again, `retries` retries were already made.
+
+        :param status_code: Response status, `None` after a connection error or a timeout.
+        :param sent: `False` when the request surely never reached the server (connection refused).
+        :param headers: Request headers, an `Idempotency-Key` makes any method idempotent.
+        """
+        if retries >= self.max_retries:
+            return False
+        if status_code is not None and status_code not in self.retry_statuses:
+            return False
+        idempotent = method.upper() in self.idempotent_methods or bool(headers and "Idempotency-Key" in headers)
+        if sent and not idempotent:
+            return False
+        with self._lock:
+            if self._circuit_state == CIRCUIT_OPEN:
+                return False
+            self._roll_window(time.monotonic())
+            allowed = max(self.min_retries_per_window, self.budget_ratio * self._window_requests)
+            if self._window_retries + 1 > allowed:
+                self._budget_exhausted += 1
+                return False
+            self._window_retries += 1
+            self._retries += 1
+        return True
+
+    def backoff(self, retries: int) -> float:
+        """
+        Delay before retry number `retries` + 1, in seconds.
+        """
+        return random.uniform(0.0, min(self.max_backoff, self.backoff_factor * (2**retries)))
+
+    def _roll_window(self, now: float) -> None:
+        if now - self._window_started_at >= self.budget_window:
+            self._window_started_at = now
+            self._window_requests = 0
+            self._window_retries = 0
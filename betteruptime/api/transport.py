@@ -0,0 +1,57 @@
+"""
+Pluggable HTTP transports for BetterUptime API client.
+"""
+from __future__ import annotations
+
+# stdlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+import requests
+
+# betteruptime
+from betteruptime.api import _API_TIMEOUT
+from betteruptime.util.compression import ACCEPT_ENCODING
+
+
+class ConnectError(requests.ConnectionError):
+    """
+    The connection could not be established: the request surely never reached the server.
+    """
+
+
+class HTTPTransport(ABC):
+    """
+    Abstract synchronous transport sending the requests of :class:`HTTPClient`.
+
+    Transports return `requests.Response` objects and raise `requests` exceptions, so the
+    client maps them to :class:`ClientError`, :class:`HttpTimeout` and :class:`HTTPError`
+    the same way whatever the transport. Connections that could not be established are
+    raised as :class:`ConnectError`, so the retry policy knows the request was not sent.
+    """
+
+    #: Content codings the transport decodes, sent as the `Accept-Encoding` header.
+    accept_encoding: str = ACCEPT_ENCODING
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        data: Optional[bytes] = None,
+        timeout: float = _API_TIMEOUT,
+        allow_redirects: bool = True,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Sends a request, `headers` include the client authentication headers.
+        The body is either `json`, or `data` already encoded as described by `headers`.
+        """
+
+    def close(self) -> None:
+        """
+        Release the pooled connections, the transport can still be used afterwards.
+        """
@@ -0,0 +1,489 @@
+"""
+BetterUptime typed resource models.
+
+Opt-in, slotted alternative to the raw `JSON` payloads returned by the resources:
+
+    monitor = Monitor.from_payload(client.monitors.get("123456"))
+    monitors = [Monitor.from_item(item) for item in client.monitors.list_iter()]
+
+Known attributes are stored in `__slots__`, so a model takes a fraction of the
+memory of the equivalent nested dicts. Attributes the model does not know are kept
+in `extra`, absent ones in `missing`, and `raw` rebuilds the original JSON:API item.
+"""
+from __future__ import annotations
+
+import sys
+from typing import Any, ClassVar, Dict, FrozenSet, List, Mapping, Optional, Tuple, Type, TypeVar
+
+from betteruptime.typing import JSON
+
+ModelT = TypeVar("ModelT", bound="Model")
+
+# Short strings (statuses, types, http methods...) repeat across thousands of items
+_INTERN_MAX_LENGTH = 32
+
+
+def _intern(value: Any) -> Any:
+    if isinstance(value, str) and len(value) <= _INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+class Model:
+    """
+    Base of the typed models, built from a JSON:API item `{"id", "type", "attributes", "relationships"}`.
+    Subclasses list the attributes they model in their `__slots__`.
+    """
+
+    __slots__ = ("id", "type", "relationships", "extra", "missing")
+
+    id: str
+    type: str
+    relationships: Optional[Dict[str, Any]]
+    #: Attributes returned by the API but not modelled, `None` when there are none.
+    extra: Optional[Dict[str, Any]]
+    #: Modelled attributes absent from the item (e.g. sparse fieldsets), read as `None`, `None` when there are none.
+    missing: Optional[FrozenSet[str]]
+
+    #: Modelled attribute names, in the API order.
+    fields: ClassVar[Tuple[str, ...]] = ()
+    _field_set: ClassVar[FrozenSet[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.fields = cls.fields + tuple(cls.__dict__.get("__slots__", ()))
+        cls._field_set = frozenset(cls.fields)
+
+    @classmethod
+    def from_item(cls: Type[ModelT], item: Mapping[str, Any]) -> ModelT:
+        """
+        Build a model from a `data` item.
+        """
+        model = cls.__new__(cls)
+        attributes: Mapping[str, Any] = item.get("attributes") or {}
+        model.id = str(item["id"])
+        model.type = _intern(item.get("type"))
+        model.relationships = item.get("relationships") or None
+        for name in cls.fields:
+            setattr(model, name, _intern(attributes.get(name)))
+        extra = {name: value for name, value in attributes.items() if name not in cls._field_set}
+        model.extra = extra or None
+        model.missing = cls._field_set.difference(attributes) or None
+        return model
+
+    @classmethod
+    def from_payload(cls: Type[ModelT], payload: JSON) -> ModelT:
+        """
+        Build a model from a single resource response, e.g. `client.monitors.get("123456")`.
+        """
+        assert isinstance(payload, dict)
+        return cls.from_item(payload["data"])
+
+    @classmethod
+    def from_listing(cls: Type[ModelT], payload: JSON) -> List[ModelT]:
+        """
+        Build the models of a list response page, e.g. `client.monitors.list()`.
+        """
+        assert isinstance(payload, dict)
+        return [cls.from_item(item) for item in payload["data"]]
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        """
+        Attributes as returned by the API.
+        """
+        missing = self.missing or ()
+        attributes = {name: getattr(self, name) for name in self.fields if name not in missing}
+        if self.extra:
+            attributes.update(self.extra)
+        return attributes
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """
+        The JSON:API item this model was built from.
+        """
+        item: Dict[str, Any] = {"id": self.id, "type": self.type, "attributes": self.attributes}
+        if self.relationships is not None:
+            item["relationships"] = self.relationships
+        return item
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Model):
+            return NotImplemented
+        return type(self) is type(other) and self.raw == other.raw
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(id={self.id!r})"
+
+
+class EscalationPolicy(Model):
+    """
+    Escalation policy (`policy`).
+    """
+
+    __slots__ = ("name", "repeat_count", "repeat_delay", "incident_token")
+
+    name: Optional[str]
+    repeat_count: Optional[int]
+    repeat_delay: Optional[int]
+    incident_token: Optional[str]
+
+
+class Heartbeat(Model):
+    """
+    Heartbeat (`heartbeat`).
+    """
+
+    __slots__ = (
+        "url",
+        "name",
+        "period",
+        "grace",
+        "call",
+        "sms",
+        "email",
+        "push",
+        "team_wait",
+        "heartbeat_group_id",
+        "sort_index",
+        "paused_at",
+        "created_at",
+        "updated_at",
+        "status",
+    )
+
+    url: Optional[str]
+    name: Optional[str]
+    period: Optional[int]
+    grace: Optional[int]
+    call: Optional[bool]
+    sms: Optional[bool]
+    email: Optional[bool]
+    push: Optional[bool]
+    team_wait: Optional[int]
+    heartbeat_group_id: Optional[int]
+    sort_index: Optional[int]
+    paused_at: Optional[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    status: Optional[str]
+
+
+class HeartbeatGroup(Model):
+    """
+    Heartbeat group (`heartbeat_group`).
+    """
+
+    __slots__ = ("name", "sort_index", "created_at", "updated_at", "paused")
+
+    name: Optional[str]
+    sort_index: Optional[int]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    paused: Optional[bool]
+
+
+class Incident(Model):
+    """
+    Incident (`incident`).
+    """
+
+    __slots__ = (
+        "name",
+        "url",
+        "http_method",
+        "cause",
+        "incident_group_id",
+        "started_at",
+        "acknowledged_at",
+        "acknowledged_by",
+        "resolved_at",
+        "resolved_by",
+        "response_content",
+        "response_options",
+        "regions",
+        "response_url",
+        "screenshot_url",
+        "escalation_policy_id",
+        "call",
+        "sms",
+        "email",
+        "push",
+    )
+
+    name: Optional[str]
+    url: Optional[str]
+    http_method: Optional[str]
+    cause: Optional[str]
+    incident_group_id: Optional[int]
+    started_at: Optional[str]
+    acknowledged_at: Optional[str]
+    acknowledged_by: Optional[str]
+    resolved_at: Optional[str]
+    resolved_by: Optional[str]
+    response_content: Optional[str]
+    response_options: Optional[str]
+    regions: Optional[List[str]]
+    response_url: Optional[str]
+    screenshot_url: Optional[str]
+    escalation_policy_id: Optional[int]
+    call: Optional[bool]
+    sms: Optional[bool]
+    email: Optional[bool]
+    push: Optional[bool]
+
+
+class Metadata(Model):
+    """
+    Metadata record (`metadata`).
+    """
+
+    __slots__ = ("key", "value")
+
+    key: Optional[str]
+    value: Optional[str]
+
+
+class Monitor(Model):
+    """
+    Monitor (`monitor`).
+    """
+
+    __slots__ = (
+        "url",
+        "pronounceable_name",
+        "monitor_type",
+        "monitor_group_id",
+        "last_checked_at",
+        "status",
+        "policy_id",
+        "required_keyword",
+        "verify_ssl",
+        "check_frequency",
+        "call",
+        "sms",
+        "email",
+        "push",
+        "team_wait",
+        "http_method",
+        "request_timeout",
+        "recovery_period",
+        "request_headers",
+        "request_body",
+        "follow_redirects",
+        "remember_cookies",
+        "created_at",
+        "updated_at",
+        "ssl_expiration",
+        "domain_expiration",
+        "regions",
+        "expected_status_codes",
+        "port",
+        "confirmation_period",
+        "paused_at",
+        "paused",
+        "maintenance_from",
+        "maintenance_to",
+        "maintenance_timezone",
+    )
+
+    url: Optional[str]
+    pronounceable_name: Optional[str]
+    monitor_type: Optional[str]
+    monitor_group_id: Optional[int]
+    last_checked_at: Optional[str]
+    status: Optional[str]
+    policy_id: Optional[int]
+    required_keyword: Optional[str]
+    verify_ssl: Optional[bool]
+    check_frequency: Optional[int]
+    call: Optional[bool]
+    sms: Optional[bool]
+    email: Optional[bool]
+    push: Optional[bool]
+    team_wait: Optional[int]
+    http_method: Optional[str]
+    request_timeout: Optional[int]
+    recovery_period: Optional[int]
+    request_headers: Optional[List[Dict[str, str]]]
+    request_body: Optional[str]
+    follow_redirects: Optional[bool]
+    remember_cookies: Optional[bool]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    ssl_expiration: Optional[int]
+    domain_expiration: Optional[int]
+    regions: Optional[List[str]]
+    expected_status_codes: Optional[List[int]]
+    port: Optional[str]
+    confirmation_period: Optional[int]
+    paused_at: Optional[str]
+    paused: Optional[bool]
+    maintenance_from: Optional[str]
+    maintenance_to: Optional[str]
+    maintenance_timezone: Optional[str]
+
+
+class MonitorGroup(Model):
+    """
+    Monitor group (`monitor_group`).
+    """
+
+    __slots__ = ("name", "sort_index", "created_at", "updated_at", "paused")
+
+    name: Optional[str]
+    sort_index: Optional[int]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    paused: Optional[bool]
+
+
+class OnCallCalendar(Model):
+    """
+    On-call calendar (`on_call_calendar`).
+    """
+
+    __slots__ = ("name", "default_calendar")
+
+    name: Optional[str]
+    default_calendar: Optional[bool]
+
+
+class StatusPage(Model):
+    """
+    Status page (`status_page`).
+    """
+
+    __slots__ = (
+        "company_name",
+        "company_url",
+        "contact_url",
+        "logo_url",
+        "timezone",
+        "subdomain",
+        "custom_domain",
+        "custom_css",
+        "google_analytics_id",
+        "min_incident_length",
+        "announcement",
+        "announcement_embed_enabled",
+        "announcement_embed_css",
+        "announcement_embed_link",
+        "subscribable",
+        "hide_from_search_engines",
+        "password_enabled",
+        "history",
+        "created_at",
+        "updated_at",
+    )
+
+    company_name: Optional[str]
+    company_url: Optional[str]
+    contact_url: Optional[str]
+    logo_url: Optional[str]
+    timezone: Optional[str]
+    subdomain: Optional[str]
+    custom_domain: Optional[str]
+    custom_css: Optional[str]
+    google_analytics_id: Optional[str]
+    min_incident_length: Optional[int]
+    announcement: Optional[str]
+    announcement_embed_enabled: Optional[bool]
+    announcement_embed_css: Optional[str]
+    announcement_embed_link: Optional[str]
+    subscribable: Optional[bool]
+    hide_from_search_engines: Optional[bool]
+    password_enabled: Optional[bool]
+    history: Optional[int]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+
+
+class StatusPageResource(Model):
+    """
+    Status page resource (`status_page_resource`).
+    """
+
+    __slots__ = ("resource_id", "resource_type", "public_name", "explanation", "history", "widget_type", "position")
+
+    resource_id: Optional[int]
+    resource_type: Optional[str]
+    public_name: Optional[str]
+    explanation: Optional[str]
+    history: Optional[bool]
+    widget_type: Optional[str]
+    position: Optional[int]
+
+
+class StatusPageSection(Model):
+    """
+    Status page section (`status_page_section`).
+    """
+
+    __slots__ = ("name", "position")
+
+    name: Optional[str]
+    position: Optional[int]
+
+
+class StatusReport(Model):
+    """
+    Status page report (`status_report`).
+    """
+
+    __slots__ = (
+        "title",
+        "report_type",
+        "starts_at",
+        "ends_at",
+        "status_page_id",
+        "affected_resources",
+        "aggregate_state",
+    )
+
+    title: Optional[str]
+    report_type: Optional[str]
+    starts_at: Optional[str]
+    ends_at: Optional[str]
+    status_page_id: Optional[int]
+    affected_resources: Optional[List[Dict[str, Any]]]
+    aggregate_state: Optional[str]
+
+
+class StatusUpdate(Model):
+    """
+    Status report update (`status_update`).
+    """
+
+    __slots__ = ("message", "published_at", "status_report_id", "affected_resources")
+
+    message: Optional[str]
+    published_at: Optional[str]
+    status_report_id: Optional[int]
+    affected_resources: Optional[List[Dict[str, Any]]]
+
+
+#: Models by JSON:API `type`.
+MODELS: Dict[str, Type[Model]] = {
+    "heartbeat": Heartbeat,
+    "heartbeat_group": HeartbeatGroup,
+    "incident": Incident,
+    "metadata": Metadata,
+    "monitor": Monitor,
+    "monitor_group": MonitorGroup,
+    "on_call_calendar": OnCallCalendar,
+    "policy": EscalationPolicy,
+    "status_page": StatusPage,
+    "status_page_resource": StatusPageResource,
+    "status_page_section": StatusPageSection,
+    "status_report": StatusReport,
+    "status_update": StatusUpdate,
+}
+
+
+def parse_item(item: Mapping[str, Any]) -> Model:
+    """
+    Build the model matching an item `type`, or a bare :class:`Model` for unknown types.
+    """
+    return MODELS.get(item.get("type") or "", Model).from_item(item)
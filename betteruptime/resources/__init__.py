@@ -1,15 +1,36 @@
 """
 BetterUptime Resources
+
+Resource classes are imported on first access.
 """
-from betteruptime.resources.escalation_policies import EscalationPolicy
-from betteruptime.resources.heartbeat_groups import HeartbeatGroup
-from betteruptime.resources.heartbeats import Heartbeat
-from betteruptime.resources.incidents import Incident
-from betteruptime.resources.metadata import Metadata
-from betteruptime.resources.monitor_groups import MonitorGroup
-from betteruptime.resources.monitors import Monitor
-from betteruptime.resources.on_call_calendar import OnCallCalendar
-from betteruptime.resources.status_pages import StatusPage
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from betteruptime.resources.escalation_policies import EscalationPolicy
+    from betteruptime.resources.heartbeat_groups import HeartbeatGroup
+    from betteruptime.resources.heartbeats import Heartbeat
+    from betteruptime.resources.incidents import Incident
+    from betteruptime.resources.metadata import Metadata
+    from betteruptime.resources.monitor_groups import MonitorGroup
+    from betteruptime.resources.monitors import Monitor
+    from betteruptime.resources.on_call_calendar import OnCallCalendar
+    from betteruptime.resources.status_pages import StatusPage
+
+# Resource class name: defining module
+_LAZY_RESOURCES: Dict[str, str] = {
+    "EscalationPolicy": "betteruptime.resources.escalation_policies",
+    "HeartbeatGroup": "betteruptime.resources.heartbeat_groups",
+    "Heartbeat": "betteruptime.resources.heartbeats",
+    "Incident": "betteruptime.resources.incidents",
+    "Metadata": "betteruptime.resources.metadata",
+    "MonitorGroup": "betteruptime.resources.monitor_groups",
+    "Monitor": "betteruptime.resources.monitors",
+    "OnCallCalendar": "betteruptime.resources.on_call_calendar",
+    "StatusPage": "betteruptime.resources.status_pages",
+}
 
 __all__ = [
     "EscalationPolicy",
@@ -22,3 +43,15 @@ __all__ = [
     "OnCallCalendar",
     "StatusPage",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_RESOURCES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_RESOURCES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,36 +4,41 @@ Abstract BetterUptime Resource
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from typing import Any, Generic, Optional, Tuple, TypeVar, Union
 
 from yarl import URL
 
-from betteruptime.api.http_client import HTTPClient
+from betteruptime.util.format import quote_path
 
+# Either a synchronous `HTTPClient` or an `AsyncHTTPClient`.
+HTTPClientT = TypeVar("HTTPClientT")
 
-class AbstractResource(ABC):
+
+class AbstractResource(ABC, Generic[HTTPClientT]):
     """
     Abstract BetterUptime Resource, all resources should inherit from
     this class.
     """
 
-    _http_client: HTTPClient
+    _http_client: HTTPClientT
     _name: str
     _resource_id: Optional[str] = None
+    # (collection path, item path prefix), computed on first request by `_path`
+    _path_cache: Optional[Tuple[str, str]] = None
 
-    def __init__(self, http_client: HTTPClient) -> None:
+    def __init__(self, http_client: HTTPClientT) -> None:
         super().__init__()
         self.http_client = http_client
 
     @property
-    def http_client(self) -> HTTPClient:
+    def http_client(self) -> HTTPClientT:
         """
         http_client property getter.
         """
         return self._http_client
 
     @http_client.setter
-    def http_client(self, http_client: HTTPClient) -> None:
+    def http_client(self, http_client: HTTPClientT) -> None:
         """
         http_client property setter.
         """
@@ -52,6 +57,7 @@ class AbstractResource(ABC):
         name property setter.
         """
         self._name = name
+        self._path_cache = None
 
     @property
     def resource_id(self) -> Optional[str]:
@@ -61,7 +67,7 @@ class AbstractResource(ABC):
         return self._resource_id
 
     @abstractmethod
-    def __call__(self, resource_id: str) -> AbstractResource:
+    def __call__(self, resource_id: str) -> AbstractResource[HTTPClientT]:
         pass
 
     def _get_base_path(self) -> URL:
@@ -70,40 +76,66 @@ class AbstractResource(ABC):
         """
         return URL(self.name)
 
+    def _get_full_path(self) -> URL:
+        """
+        returns resource's path, relative to the API base url.
+        """
+        return self._get_base_path()
+
+    def _path(self, resource_id: Optional[str] = None) -> str:
+        """
+        returns resource's path, or the path of its item `resource_id`, relative to the API base url.
+        It only depends on the resources names and parents ids, so it is built once and then reused.
+        """
+        path_cache = self._path_cache
+        if path_cache is None:
+            path = str(self._get_full_path()).strip("/")
+            path_cache = self._path_cache = (path, f"{path}/")
+        if resource_id is None:
+            return path_cache[0]
+        return path_cache[1] + quote_path(resource_id)
 
-class AbstractSubResource(AbstractResource):
+    def _page_path(self, page: int) -> str:
+        """
+        returns the path of a listing page.
+        """
+        return f"{self._path()}?page={page}"
+
+
+class AbstractSubResource(AbstractResource[HTTPClientT]):
     """
     Abstract BetterUptime Sub-resource.
     """
 
-    _parent: AbstractResource
+    _parent: AbstractResource[Any]
 
-    def __init__(self, http_client: HTTPClient, parent: AbstractResource) -> None:
+    def __init__(self, http_client: HTTPClientT, parent: AbstractResource[Any]) -> None:
         super().__init__(http_client=http_client)
         self.parent = parent
 
     @property
-    def parent(self) -> Union[AbstractResource, AbstractSubResource]:
+    def parent(self) -> Union[AbstractResource[Any], AbstractSubResource[Any]]:
         """
         parent property getter.
         """
         return self._parent
 
     @parent.setter
-    def parent(self, parent: Union[AbstractResource, AbstractSubResource]) -> None:
+    def parent(self, parent: Union[AbstractResource[Any], AbstractSubResource[Any]]) -> None:
         """
         parent property setter.
         """
         self._parent = parent
+        self._path_cache = None
 
     @abstractmethod
-    def __call__(self, resource_id: str) -> AbstractSubResource:
+    def __call__(self, resource_id: str) -> AbstractSubResource[HTTPClientT]:
         pass
 
     def _build_path(
         self,
         path: URL,
-        parent: Union[AbstractResource, AbstractSubResource, None] = None,
+        parent: Union[AbstractResource[Any], AbstractSubResource[Any], None] = None,
     ) -> URL:
         if parent is None:
             path_part = self._build_path(path=URL(self.name), parent=self.parent)
@@ -125,3 +157,6 @@ class AbstractSubResource(AbstractResource):
         returns resource's path.
         """
         return URL(self.name)
+
+    def _get_full_path(self) -> URL:
+        return self._build_path(URL(self.name))
@@ -0,0 +1,24 @@
+"""
+BetterUptime async Resources
+"""
+from betteruptime.resources.aio.escalation_policies import AsyncEscalationPolicy
+from betteruptime.resources.aio.heartbeat_groups import AsyncHeartbeatGroup
+from betteruptime.resources.aio.heartbeats import AsyncHeartbeat
+from betteruptime.resources.aio.incidents import AsyncIncident
+from betteruptime.resources.aio.metadata import AsyncMetadata
+from betteruptime.resources.aio.monitor_groups import AsyncMonitorGroup
+from betteruptime.resources.aio.monitors import AsyncMonitor
+from betteruptime.resources.aio.on_call_calendar import AsyncOnCallCalendar
+from betteruptime.resources.aio.status_pages import AsyncStatusPage
+
+__all__ = [
+    "AsyncEscalationPolicy",
+    "AsyncHeartbeatGroup",
+    "AsyncHeartbeat",
+    "AsyncIncident",
+    "AsyncMetadata",
+    "AsyncMonitorGroup",
+    "AsyncMonitor",
+    "AsyncOnCallCalendar",
+    "AsyncStatusPage",
+]
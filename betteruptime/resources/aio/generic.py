@@ -0,0 +1,347 @@
+"""
+BetterUptime generic async Resource classes
+"""
+from __future__ import annotations
+
+from typing import AsyncGenerator, Iterable, List, Mapping, Optional
+
+from yarl import URL
+
+from betteruptime.api import _API_MAX_CONCURRENCY
+from betteruptime.api.async_http_client import AsyncHTTPClient
+from betteruptime.api.exceptions import ApiError
+from betteruptime.resources.abstract import AbstractResource, AbstractSubResource
+from betteruptime.typing import JSON
+from betteruptime.util.bulk import BulkResult, run_bulk_async
+from betteruptime.util.errors import parse_error_response
+
+
+class AsyncImmutableResource(AbstractResource[AsyncHTTPClient]):
+    """
+    Immutable BetterUptime async Resource.
+    """
+
+    def __init__(self, http_client: AsyncHTTPClient, name: str) -> None:
+        super().__init__(http_client)
+        self.name = name
+
+    async def get(self, resource_id: Optional[str] = None) -> JSON:
+        """
+        Get a single resource.
+        """
+        resource_id = resource_id or self.resource_id
+        if resource_id is None:
+            raise ValueError(
+                f"A resource_id is mandatory to call {self.__class__.__name__}.get()."
+                f" You can either use {self.__class__.__name__}.get('12345') or"
+                f" {self.__class__.__name__}('12345').get()."
+            )
+
+        result = await self.http_client.get(path=self._path(resource_id))
+        if 200 == result.status_code:
+            payload: JSON = self.http_client.json(result)
+            return payload
+
+        raise ApiError(
+            resource=self.name,
+            status_code=result.status_code,
+            reason=result.reason,
+            errors=parse_error_response(result, self.http_client.decoder),
+        )
+
+    async def list(self, page: int = 1) -> JSON:
+        """
+        List paginated resource.
+        """
+        result = await self.http_client.get(path=self._page_path(page))
+        if 200 == result.status_code:
+            payload: JSON = self.http_client.json(result)
+            return payload
+
+        raise ApiError(
+            resource=self.name,
+            status_code=result.status_code,
+            reason=result.reason,
+            errors=parse_error_response(result, self.http_client.decoder),
+        )
+
+    async def list_iter(self, page: int = 1) -> AsyncGenerator[JSON, None]:
+        """
+        List all resource items by itering over all pages.
+        """
+        while True:
+            result = await self.list(page=page)
+            assert isinstance(result, dict)
+            for item in result["data"]:
+                yield item
+            if result["pagination"]["next"]:
+                next_url: URL = URL(result["pagination"]["next"])
+                page = int(next_url.query["page"])
+            else:
+                break
+
+
+class AsyncImmutableSubResource(AbstractSubResource[AsyncHTTPClient]):
+    """
+    Immutable BetterUptime async SubResource.
+    """
+
+    def __init__(self, http_client: AsyncHTTPClient, parent: AbstractResource[AsyncHTTPClient], name: str) -> None:
+        super().__init__(http_client=http_client, parent=parent)
+        self.name = name
+
+    async def get(self, resource_id: Optional[str] = None) -> JSON:
+        """
+        Get a single sub-resource.
+        """
+        resource_id = resource_id or self.resource_id
+        if resource_id is None:
+            raise ValueError(
+                f"A resource_id is mandatory to call {self.__class__.__name__}.get()."
+                f" You can either use {self.__class__.__name__}.get('12345') or"
+                f" {self.__class__.__name__}('12345').get()."
+            )
+
+        result = await self.http_client.get(path=self._path(resource_id))
+        if 200 == result.status_code:
+            payload: JSON = self.http_client.json(result)
+            return payload
+
+        raise ApiError(
+            resource=self.name,
+            status_code=result.status_code,
+            reason=result.reason,
+            errors=parse_error_response(result, self.http_client.decoder),
+        )
+
+    async def list(self, page: int = 1) -> JSON:
+        """
+        List paginated sub-resource.
+        """
+        result = await self.http_client.get(path=self._page_path(page))
+        if 200 == result.status_code:
+            payload: JSON = self.http_client.json(result)
+            return payload
+
+        raise ApiError(
+            resource=self.name,
+            status_code=result.status_code,
+            reason=result.reason,
+            errors=parse_error_response(result, self.http_client.decoder),
+        )
+
+    async def list_iter(self, page: int = 1) -> AsyncGenerator[JSON, None]:
+        """
+        List all sub-resource items by itering over all pages.
+        """
+        while True:
+            result = await self.list(page=page)
+            assert isinstance(result, dict)
+            for item in result["data"]:
+                yield item
+            if result["pagination"]["next"]:
+                next_url: URL = URL(result["pagination"]["next"])
+                page = int(next_url.query["page"])
+            else:
+                break
+
+
+class AsyncMutableResource(AsyncImmutableResource):
+    """
+    Mutable BetterUptime async Resource.
+    """
+
+    async def create(self, payload: JSON) -> JSON:
+        """
+        Create resource.
+        """
+        result = await self.http_client.post(path=self._path(), json=payload)
+        if 201 == result.status_code:
+            payload = self.http_client.json(result)
+            return payload
+
+        raise ApiError(
+            resource=self.name,
+            status_code=result.status_code,
+            reason=result.reason,
+            errors=parse_error_response(result, self.http_client.decoder),
+        )
+
+    async def delete(self, resource_id: Optional[str] = None) -> JSON:
+        """
+        Delete resource.
+        """
+        resource_id = resource_id or self.resource_id
+        if resource_id is None:
+            raise ValueError(
+                f"A resource_id is mandatory to call {self.__class__.__name__}.delete()."
+                f" You can either use {self.__class__.__name__}.delete('12345') or"
+                f" {self.__class__.__name__}('12345').delete()."
+            )
+
+        result = await self.http_client.delete(path=self._path(resource_id))
+        if 204 == result.status_code:
+            return None
+
+        raise ApiError(
+            resource=self.name,
+            status_code=result.status_code,
+            reason=result.reason,
+            errors=parse_error_response(result, self.http_client.decoder),
+        )
+
+    async def update(self, payload: JSON, resource_id: Optional[str] = None) -> JSON:
+        """
+        Update resource.
+        """
+        resource_id = resource_id or self.resource_id
+        if resource_id is None:
+            raise ValueError(
+                f"A resource_id is mandatory to call {self.__class__.__name__}.update()."
+                f" You can either use {self.__class__.__name__}.update('12345') or"
+                f" {self.__class__.__name__}('12345').update()."
+            )
+
+        result = await self.http_client.patch(path=self._path(resource_id), json=payload)
+        if 200 == result.status_code:
+            payload = self.http_client.json(result)
+            return payload
+
+        raise ApiError(
+            resource=self.name,
+            status_code=result.status_code,
+            reason=result.reason,
+            errors=parse_error_response(result, self.http_client.decoder),
+        )
+
+    async def create_many(
+        self, payloads: Iterable[JSON], max_concurrency: int = _API_MAX_CONCURRENCY
+    ) -> List[BulkResult[int]]:
+        """
+        Create resources concurrently, at most `max_concurrency` at a time.
+        Returns one :class:`BulkResult` per payload, in the same order and keyed by payload index.
+        """
+        items = ((index, (payload,)) for index, payload in enumerate(payloads))
+        return await run_bulk_async(self.create, items, max_concurrency)
+
+    async def update_many(
+        self, payloads: Mapping[str, JSON], max_concurrency: int = _API_MAX_CONCURRENCY
+    ) -> List[BulkResult[str]]:
+        """
+        Update resources concurrently, `payloads` maps resource ids to payloads.
+        Returns one :class:`BulkResult` per resource id.
+        """
+        items = ((resource_id, (payload, resource_id)) for resource_id, payload in payloads.items())
+        return await run_bulk_async(self.update, items, max_concurrency)
+
+    async def delete_many(
+        self, resource_ids: Iterable[str], max_concurrency: int = _API_MAX_CONCURRENCY
+    ) -> List[BulkResult[str]]:
+        """
+        Delete resources concurrently, at most `max_concurrency` at a time.
+        Returns one :class:`BulkResult` per resource id.
+        """
+        items = ((resource_id, (resource_id,)) for resource_id in resource_ids)
+        return await run_bulk_async(self.delete, items, max_concurrency)
+
+
+class AsyncMutableSubResource(AsyncImmutableSubResource):
+    """
+    Mutable BetterUptime async SubResource.
+    """
+
+    async def create(self, payload: JSON) -> JSON:
+        """
+        Create resource.
+        """
+        result = await self.http_client.post(path=self._path(), json=payload)
+        if 201 == result.status_code:
+            payload = self.http_client.json(result)
+            return payload
+
+        raise ApiError(
+            resource=self.name,
+            status_code=result.status_code,
+            reason=result.reason,
+            errors=parse_error_response(result, self.http_client.decoder),
+        )
+
+    async def delete(self, resource_id: Optional[str] = None) -> JSON:
+        """
+        Delete resource.
+        """
+        resource_id = resource_id or self.resource_id
+        if resource_id is None:
+            raise ValueError(
+                f"A resource_id is mandatory to call {self.__class__.__name__}.delete()."
+                f" You can either use {self.__class__.__name__}.delete('12345') or"
+                f" {self.__class__.__name__}('12345').delete()."
+            )
+
+        result = await self.http_client.delete(path=self._path(resource_id))
+        if 204 == result.status_code:
+            return None
+
+        raise ApiError(
+            resource=self.name,
+            status_code=result.status_code,
+            reason=result.reason,
+            errors=parse_error_response(result, self.http_client.decoder),
+        )
+
+    async def update(self, payload: JSON, resource_id: Optional[str] = None) -> JSON:
+        """
+        Update resource.
+        """
+        resource_id = resource_id or self.resource_id
+        if resource_id is None:
+            raise ValueError(
+                f"A resource_id is mandatory to call {self.__class__.__name__}.update()."
+                f" You can either use {self.__class__.__name__}.update('12345') or"
+                f" {self.__class__.__name__}('12345').update()."
+            )
+
+        result = await self.http_client.patch(
+            path=self._path(resource_id),
+            json=payload,
+        )
+        if 200 == result.status_code:
+            payload = self.http_client.json(result)
+            return payload
+
+        raise ApiError(
+            resource=self.name,
+            status_code=result.status_code,
+            reason=result.reason,
+            errors=parse_error_response(result, self.http_client.decoder),
+        )
+
+    async def create_many(
+        self, payloads: Iterable[JSON], max_concurrency: int = _API_MAX_CONCURRENCY
+    ) -> List[BulkResult[int]]:
+        """
+        Create resources concurrently, at most `max_concurrency` at a time.
+        Returns one :class:`BulkResult` per payload, in the same order and keyed by payload index.
+        """
+        items = ((index, (payload,)) for index, payload in enumerate(payloads))
+        return await run_bulk_async(self.create, items, max_concurrency)
+
+    async def update_many(
+        self, payloads: Mapping[str, JSON], max_concurrency: int = _API_MAX_CONCURRENCY
+    ) -> List[BulkResult[str]]:
+        """
+        Update resources concurrently, `payloads` maps resource ids to payloads.
+        Returns one :class:`BulkResult` per resource id.
+        """
+        items = ((resource_id, (payload, resource_id)) for resource_id, payload in payloads.items())
+        return await run_bulk_async(self.update, items, max_concurrency)
+
+    async def delete_many(
+        self, resource_ids: Iterable[str], max_concurrency: int = _API_MAX_CONCURRENCY
+    ) -> List[BulkResult[str]]:
+        """
+        Delete resources concurrently, at most `max_concurrency` at a time.
+        Returns one :class:`BulkResult` per resource id.
+        """
+        items = ((resource_id, (resource_id,)) for resource_id in resource_ids)
+        return await run_bulk_async(self.delete, items, max_concurrency)
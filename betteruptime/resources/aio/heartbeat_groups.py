@@ -0,0 +1,21 @@
+"""
+BetterUptime Heartbeat Groups async Resource
+"""
+from __future__ import annotations
+
+from betteruptime.api.async_http_client import AsyncHTTPClient
+from betteruptime.resources.aio.generic import AsyncMutableResource
+
+
+class AsyncHeartbeatGroup(AsyncMutableResource):
+    """
+    Represents BetterUptime Heartbeat Groups async Resource.
+    """
+
+    def __init__(self, http_client: AsyncHTTPClient, name: str = "heartbeat-groups") -> None:
+        super().__init__(http_client, name)
+
+    def __call__(self, resource_id: str) -> AsyncHeartbeatGroup:
+        new_resource = AsyncHeartbeatGroup(http_client=self.http_client)
+        new_resource._resource_id = resource_id
+        return new_resource
@@ -0,0 +1,21 @@
+"""
+BetterUptime Incidents async Resource
+"""
+from __future__ import annotations
+
+from betteruptime.api.async_http_client import AsyncHTTPClient
+from betteruptime.resources.aio.generic import AsyncMutableResource
+
+
+class AsyncIncident(AsyncMutableResource):
+    """
+    Represents BetterUptime Incidents async Resource.
+    """
+
+    def __init__(self, http_client: AsyncHTTPClient, name: str = "incidents") -> None:
+        super().__init__(http_client, name)
+
+    def __call__(self, resource_id: str) -> AsyncIncident:
+        new_resource = AsyncIncident(http_client=self.http_client)
+        new_resource._resource_id = resource_id
+        return new_resource
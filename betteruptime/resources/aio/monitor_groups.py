@@ -0,0 +1,67 @@
+"""
+BetterUptime Monitor Groups async Resource
+"""
+from __future__ import annotations
+
+from typing import AsyncGenerator
+
+from yarl import URL
+
+from betteruptime.api.async_http_client import AsyncHTTPClient
+from betteruptime.api.exceptions import ApiError
+from betteruptime.resources.aio.generic import AsyncMutableResource
+from betteruptime.typing import JSON
+from betteruptime.util.errors import parse_error_response
+
+
+class AsyncMonitorGroup(AsyncMutableResource):
+    """
+    Represents BetterUptime Monitor Groups async Resource.
+    """
+
+    def __init__(self, http_client: AsyncHTTPClient, name: str = "monitor-groups") -> None:
+        super().__init__(http_client, name)
+
+    def __call__(self, resource_id: str) -> AsyncMonitorGroup:
+        new_resource = AsyncMonitorGroup(http_client=self.http_client)
+        new_resource._resource_id = resource_id
+        return new_resource
+
+    async def monitors(self, page: int = 1) -> JSON:
+        """
+        List paginated monitors in this group.
+        """
+        if self.resource_id is None:
+            raise ValueError(
+                f"A resource_id is mandatory to call {self.__class__.__name__}.monitors."
+                f" You must use {self.__class__.__name__}('12345').monitors."
+            )
+
+        result = await self.http_client.get(
+            path=(self._get_base_path() / self.resource_id / "monitors").update_query(page=page)
+        )
+        if 200 == result.status_code:
+            payload: JSON = self.http_client.json(result)
+            return payload
+
+        raise ApiError(
+            resource=self.name,
+            status_code=result.status_code,
+            reason=result.reason,
+            errors=parse_error_response(result, self.http_client.decoder),
+        )
+
+    async def monitors_iter(self, page: int = 1) -> AsyncGenerator[JSON, None]:
+        """
+        List all monitor items by itering over all pages.
+        """
+        while True:
+            result = await self.monitors(page=page)
+            assert isinstance(result, dict)
+            for monitor in result["data"]:
+                yield monitor
+            if result["pagination"]["next"]:
+                next_url: URL = URL(result["pagination"]["next"])
+                page = int(next_url.query["page"])
+            else:
+                break
@@ -0,0 +1,6 @@
+"""
+BetterUptime Status Pages async Resource
+"""
+from .status_pages import AsyncStatusPage
+
+__all__ = ["AsyncStatusPage"]
@@ -0,0 +1,43 @@
+"""
+BetterUptime Status Page Reports async Resource
+"""
+from __future__ import annotations
+
+from betteruptime.api.async_http_client import AsyncHTTPClient
+from betteruptime.resources.abstract import AbstractResource
+from betteruptime.resources.aio.generic import AsyncMutableSubResource
+
+from .status_updates import AsyncStatusPageStatusUpdates
+
+
+class AsyncStatusPageReport(AsyncMutableSubResource):
+    """
+    Represents BetterUptime Status Page Report async Resource.
+    """
+
+    _status_updates: AsyncStatusPageStatusUpdates
+
+    def __init__(
+        self, http_client: AsyncHTTPClient, parent: AbstractResource[AsyncHTTPClient], name: str = "status-reports"
+    ) -> None:
+        super().__init__(http_client=http_client, parent=parent, name=name)
+        self.status_updates = AsyncStatusPageStatusUpdates(http_client=http_client, parent=self)
+
+    def __call__(self, resource_id: str) -> AsyncStatusPageReport:
+        new_resource = AsyncStatusPageReport(http_client=self.http_client, parent=self.parent)
+        new_resource._resource_id = resource_id
+        return new_resource
+
+    @property
+    def status_updates(self) -> AsyncStatusPageStatusUpdates:
+        """
+        status_updates property getter.
+        """
+        return self._status_updates
+
+    @status_updates.setter
+    def status_updates(self, status_updates: AsyncStatusPageStatusUpdates) -> None:
+        """
+        status_updates property setter.
+        """
+        self._status_updates = status_updates
@@ -0,0 +1,24 @@
+"""
+BetterUptime Status Page Resources async Resource
+"""
+from __future__ import annotations
+
+from betteruptime.api.async_http_client import AsyncHTTPClient
+from betteruptime.resources.abstract import AbstractResource
+from betteruptime.resources.aio.generic import AsyncMutableSubResource
+
+
+class AsyncStatusPageResource(AsyncMutableSubResource):
+    """
+    Represents BetterUptime Status Page Resources async Resource.
+    """
+
+    def __init__(
+        self, http_client: AsyncHTTPClient, parent: AbstractResource[AsyncHTTPClient], name: str = "resources"
+    ) -> None:
+        super().__init__(http_client=http_client, parent=parent, name=name)
+
+    def __call__(self, resource_id: str) -> AsyncStatusPageResource:
+        new_resource = AsyncStatusPageResource(http_client=self.http_client, parent=self.parent)
+        new_resource._resource_id = resource_id
+        return new_resource
@@ -0,0 +1,74 @@
+"""
+BetterUptime Status Pages async Resource
+"""
+from __future__ import annotations
+
+from betteruptime.api.async_http_client import AsyncHTTPClient
+from betteruptime.resources.aio.generic import AsyncMutableResource
+
+from .reports import AsyncStatusPageReport
+from .resources import AsyncStatusPageResource
+from .sections import AsyncStatusPageSection
+
+
+class AsyncStatusPage(AsyncMutableResource):
+    """
+    Represents BetterUptime Status Page async Resource.
+    """
+
+    _reports: AsyncStatusPageReport
+    _resources: AsyncStatusPageResource
+    _sections: AsyncStatusPageSection
+
+    def __init__(self, http_client: AsyncHTTPClient, name: str = "status-pages") -> None:
+        super().__init__(http_client, name)
+        self.reports = AsyncStatusPageReport(http_client=http_client, parent=self)
+        self.resources = AsyncStatusPageResource(http_client=http_client, parent=self)
+        self.sections = AsyncStatusPageSection(http_client=http_client, parent=self)
+
+    def __call__(self, resource_id: str) -> AsyncStatusPage:
+        new_resource = AsyncStatusPage(http_client=self.http_client)
+        new_resource._resource_id = resource_id
+        return new_resource
+
+    @property
+    def reports(self) -> AsyncStatusPageReport:
+        """
+        reports property getter.
+        """
+        return self._reports
+
+    @reports.setter
+    def reports(self, reports: AsyncStatusPageReport) -> None:
+        """
+        reports property setter.
+        """
+        self._reports = reports
+
+    @property
+    def resources(self) -> AsyncStatusPageResource:
+        """
+        resources property getter.
+        """
+        return self._resources
+
+    @resources.setter
+    def resources(self, resources: AsyncStatusPageResource) -> None:
+        """
+        resources property setter.
+        """
+        self._resources = resources
+
+    @property
+    def sections(self) -> AsyncStatusPageSection:
+        """
+        sections property getter.
+        """
+        return self._sections
+
+    @sections.setter
+    def sections(self, sections: AsyncStatusPageSection) -> None:
+        """
+        sections property setter.
+        """
+        self._sections = sections
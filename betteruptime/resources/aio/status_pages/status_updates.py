@@ -0,0 +1,24 @@
+"""
+BetterUptime Status Page Status Updates async Resource
+"""
+from __future__ import annotations
+
+from betteruptime.api.async_http_client import AsyncHTTPClient
+from betteruptime.resources.abstract import AbstractResource
+from betteruptime.resources.aio.generic import AsyncMutableSubResource
+
+
+class AsyncStatusPageStatusUpdates(AsyncMutableSubResource):
+    """
+    Represents BetterUptime Status Page Status Update async Resource.
+    """
+
+    def __init__(
+        self, http_client: AsyncHTTPClient, parent: AbstractResource[AsyncHTTPClient], name: str = "status-updates"
+    ) -> None:
+        super().__init__(http_client=http_client, parent=parent, name=name)
+
+    def __call__(self, resource_id: str) -> AsyncStatusPageStatusUpdates:
+        new_resource = AsyncStatusPageStatusUpdates(http_client=self.http_client, parent=self.parent)
+        new_resource._resource_id = resource_id
+        return new_resource
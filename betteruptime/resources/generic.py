@@ -3,18 +3,24 @@ BetterUptime generic Resource classes
 """
 from __future__ import annotations
 
-from typing import Generator, Optional
-
-from yarl import URL
+from functools import partial
+from typing import Any, Dict, Generator, Iterable, List, Mapping, Optional, cast
 
+from betteruptime.api import _API_BULK_MAX_WORKERS
 from betteruptime.api.exceptions import ApiError
 from betteruptime.api.http_client import HTTPClient
 from betteruptime.resources.abstract import AbstractResource, AbstractSubResource
 from betteruptime.typing import JSON
+from betteruptime.util.bulk import BulkResult, run_bulk
 from betteruptime.util.errors import parse_error_response
+from betteruptime.util.pagination import iter_pages, iter_streamed_items
+from betteruptime.util.projection import Fields, item_type, project_item, sparse_fieldset_param
+from betteruptime.util.reconcile import Plan, apply_plan, plan_changes
+from betteruptime.util.streaming import StreamedPage
+from betteruptime.util.sync import CheckpointStore, sync_items
 
 
-class ImmutableResource(AbstractResource):
+class ImmutableResource(AbstractResource[HTTPClient]):
     """
     Immutable BetterUptime Resource.
     """
@@ -23,9 +29,17 @@ class ImmutableResource(AbstractResource):
         super().__init__(http_client)
         self.name = name
 
-    def get(self, resource_id: Optional[str] = None) -> JSON:
+    def _sparse_fieldset(self, fields: Optional[Fields], resource_name: Optional[str] = None) -> Dict[str, str]:
         """
-        Get a single resource.
+        Sparse fieldset query parameter of `fields`, when the client asks the API for them.
+        """
+        if fields is None or not self.http_client.sparse_fieldsets:
+            return {}
+        return sparse_fieldset_param(item_type(resource_name or self.name), fields)
+
+    def get(self, resource_id: Optional[str] = None, fields: Optional[Fields] = None) -> JSON:
+        """
+        Get a single resource, keeping only the `fields` attributes when set.
         """
         resource_id = resource_id or self.resource_id
         if resource_id is None:
@@ -35,56 +49,88 @@ class ImmutableResource(AbstractResource):
                 f" {self.__class__.__name__}('12345').get()."
             )
 
-        result = self.http_client.get(path=self._get_base_path() / resource_id)
+        result = self.http_client.get(path=self._path(resource_id), params=self._sparse_fieldset(fields) or None)
         if 200 == result.status_code:
-            payload: JSON = result.json()
+            payload: JSON = self.http_client.json(result, fields)
             return payload
 
         raise ApiError(
             resource=self.name,
             status_code=result.status_code,
             reason=result.reason,
-            errors=parse_error_response(result),
+            errors=parse_error_response(result, self.http_client.decoder),
         )
 
-    def list(self, page: int = 1) -> JSON:
+    def list(self, page: int = 1, filters: Optional[Mapping[str, str]] = None, fields: Optional[Fields] = None) -> JSON:
         """
-        List paginated resource.
+        List paginated resource, with optional server side `filters` (e.g. incidents `from` and `to` dates).
+        Items only keep the `fields` attributes when set.
         """
-        result = self.http_client.get(path=self._get_base_path().update_query(page=page))
+        params = {**(filters or {}), **self._sparse_fieldset(fields)}
+        result = self.http_client.get(path=self._page_path(page), params=params or None)
         if 200 == result.status_code:
-            payload: JSON = result.json()
+            payload: JSON = self.http_client.json(result, fields)
             return payload
 
         raise ApiError(
             resource=self.name,
             status_code=result.status_code,
             reason=result.reason,
-            errors=parse_error_response(result),
+            errors=parse_error_response(result, self.http_client.decoder),
+        )
+
+    def list_stream(self, page: int = 1) -> StreamedPage:
+        """
+        List paginated resource, items are decoded while the response is read.
+        """
+        result = self.http_client.get(path=self._page_path(page), stream=True)
+        if 200 == result.status_code:
+            return self.http_client.stream_page(result)
+
+        raise ApiError(
+            resource=self.name,
+            status_code=result.status_code,
+            reason=result.reason,
+            errors=parse_error_response(result, self.http_client.decoder),
         )
 
-    def list_iter(self, page: int = 1) -> Generator[JSON, None, None]:
+    def list_iter(
+        self,
+        page: int = 1,
+        max_workers: int = 1,
+        read_ahead: Optional[int] = None,
+        stream: bool = False,
+        fields: Optional[Fields] = None,
+    ) -> Generator[JSON, None, None]:
         """
         List all resource items by itering over all pages.
+        With `max_workers` > 1 the next pages are prefetched concurrently, items are still yielded in order.
+        With `stream` items are yielded while each page is read, pages are then fetched sequentially.
+        Items only keep the `fields` attributes when set.
+        """
+        if stream:
+            for item in iter_streamed_items(self.list_stream, page=page):
+                yield item if fields is None else project_item(cast(Dict[str, Any], item), fields)
+            return
+        fetch_page = self.list if fields is None else partial(self.list, fields=fields)
+        for result in iter_pages(fetch_page, page=page, max_workers=max_workers, read_ahead=read_ahead):
+            yield from result["data"]
+
+    def sync(self, store: CheckpointStore, key: Optional[str] = None) -> Generator[Dict[str, Any], None, None]:
         """
-        while True:
-            result = self.list(page=page)
-            assert isinstance(result, dict)
-            for monitor in result["data"]:
-                yield monitor
-            if result["pagination"]["next"]:
-                next_url: URL = URL(result["pagination"]["next"])
-                page = int(next_url.query["page"])
-            else:
-                break
+        Yield the items created or changed since the last sync checkpointed in `store`
+        under `key` (the resource path by default). Every page is listed, only the
+        items whose attributes changed are yielded.
+        """
+        return sync_items(self.list, store, key or self._path())
 
 
-class ImmutableSubResource(AbstractSubResource):
+class ImmutableSubResource(AbstractSubResource[HTTPClient]):
     """
     Immutable BetterUptime SubResource.
     """
 
-    def __init__(self, http_client: HTTPClient, parent: AbstractResource, name: str) -> None:
+    def __init__(self, http_client: HTTPClient, parent: AbstractResource[HTTPClient], name: str) -> None:
         super().__init__(http_client=http_client, parent=parent)
         self.name = name
 
@@ -100,49 +146,66 @@ class ImmutableSubResource(AbstractSubResource):
                 f" {self.__class__.__name__}('12345').get()."
             )
 
-        result = self.http_client.get(path=self._build_path(URL(self.name)) / resource_id)
+        result = self.http_client.get(path=self._path(resource_id))
         if 200 == result.status_code:
-            payload: JSON = result.json()
+            payload: JSON = self.http_client.json(result)
             return payload
 
         raise ApiError(
             resource=self.name,
             status_code=result.status_code,
             reason=result.reason,
-            errors=parse_error_response(result),
+            errors=parse_error_response(result, self.http_client.decoder),
         )
 
     def list(self, page: int = 1) -> JSON:
         """
         List paginated sub-resource.
         """
-        path: URL = self._build_path(URL(self.name))
-        result = self.http_client.get(path=path.update_query(page=page))
+        result = self.http_client.get(path=self._page_path(page))
         if 200 == result.status_code:
-            payload: JSON = result.json()
+            payload: JSON = self.http_client.json(result)
             return payload
 
         raise ApiError(
             resource=self.name,
             status_code=result.status_code,
             reason=result.reason,
-            errors=parse_error_response(result),
+            errors=parse_error_response(result, self.http_client.decoder),
+        )
+
+    def list_stream(self, page: int = 1) -> StreamedPage:
+        """
+        List paginated sub-resource, items are decoded while the response is read.
+        """
+        result = self.http_client.get(path=self._page_path(page), stream=True)
+        if 200 == result.status_code:
+            return self.http_client.stream_page(result)
+
+        raise ApiError(
+            resource=self.name,
+            status_code=result.status_code,
+            reason=result.reason,
+            errors=parse_error_response(result, self.http_client.decoder),
         )
 
-    def list_iter(self, page: int = 1) -> Generator[JSON, None, None]:
+    def list_iter(
+        self,
+        page: int = 1,
+        max_workers: int = 1,
+        read_ahead: Optional[int] = None,
+        stream: bool = False,
+    ) -> Generator[JSON, None, None]:
         """
         List all sub-resource itmes by itering over all pages.
+        With `max_workers` > 1 the next pages are prefetched concurrently, items are still yielded in order.
+        With `stream` items are yielded while each page is read, pages are then fetched sequentially.
         """
-        while True:
-            result = self.list(page=page)
-            assert isinstance(result, dict)
-            for monitor in result["data"]:
-                yield monitor
-            if result["pagination"]["next"]:
-                next_url: URL = URL(result["pagination"]["next"])
-                page = int(next_url.query["page"])
-            else:
-                break
+        if stream:
+            yield from iter_streamed_items(self.list_stream, page=page)
+            return
+        for result in iter_pages(self.list, page=page, max_workers=max_workers, read_ahead=read_ahead):
+            yield from result["data"]
 
 
 class MutableResource(ImmutableResource):
@@ -150,20 +213,23 @@ class MutableResource(ImmutableResource):
     Mutable BetterUptime Resource.
     """
 
+    #: Attribute matching desired and current items in :meth:`plan`.
+    reconcile_key: Any = "name"
+
     def create(self, payload: JSON) -> JSON:
         """
         Create resource.
         """
-        result = self.http_client.post(path=self._get_base_path(), json=payload)
+        result = self.http_client.post(path=self._path(), json=payload)
         if 201 == result.status_code:
-            payload = result.json()
+            payload = self.http_client.json(result)
             return payload
 
         raise ApiError(
             resource=self.name,
             status_code=result.status_code,
             reason=result.reason,
-            errors=parse_error_response(result),
+            errors=parse_error_response(result, self.http_client.decoder),
         )
 
     def delete(self, resource_id: Optional[str] = None) -> JSON:
@@ -178,7 +244,7 @@ class MutableResource(ImmutableResource):
                 f" {self.__class__.__name__}('12345').delete()."
             )
 
-        result = self.http_client.delete(path=self._get_base_path() / resource_id)
+        result = self.http_client.delete(path=self._path(resource_id))
         if 204 == result.status_code:
             return None
 
@@ -186,7 +252,7 @@ class MutableResource(ImmutableResource):
             resource=self.name,
             status_code=result.status_code,
             reason=result.reason,
-            errors=parse_error_response(result),
+            errors=parse_error_response(result, self.http_client.decoder),
         )
 
     def update(self, payload: JSON, resource_id: Optional[str] = None) -> JSON:
@@ -201,18 +267,66 @@ class MutableResource(ImmutableResource):
                 f" {self.__class__.__name__}('12345').update()."
             )
 
-        result = self.http_client.patch(path=self._get_base_path() / resource_id, json=payload)
+        result = self.http_client.patch(path=self._path(resource_id), json=payload)
         if 200 == result.status_code:
-            payload = result.json()
+            payload = self.http_client.json(result)
             return payload
 
         raise ApiError(
             resource=self.name,
             status_code=result.status_code,
             reason=result.reason,
-            errors=parse_error_response(result),
+            errors=parse_error_response(result, self.http_client.decoder),
         )
 
+    def create_many(self, payloads: Iterable[JSON], max_workers: int = _API_BULK_MAX_WORKERS) -> List[BulkResult[int]]:
+        """
+        Create resources concurrently on `max_workers` threads.
+        Returns one :class:`BulkResult` per payload, in the same order and keyed by payload index.
+        """
+        return run_bulk(self.create, ((index, (payload,)) for index, payload in enumerate(payloads)), max_workers)
+
+    def update_many(
+        self, payloads: Mapping[str, JSON], max_workers: int = _API_BULK_MAX_WORKERS
+    ) -> List[BulkResult[str]]:
+        """
+        Update resources concurrently on `max_workers` threads, `payloads` maps resource ids to payloads.
+        Returns one :class:`BulkResult` per resource id.
+        """
+        items = ((resource_id, (payload, resource_id)) for resource_id, payload in payloads.items())
+        return run_bulk(self.update, items, max_workers)
+
+    def delete_many(
+        self, resource_ids: Iterable[str], max_workers: int = _API_BULK_MAX_WORKERS
+    ) -> List[BulkResult[str]]:
+        """
+        Delete resources concurrently on `max_workers` threads.
+        Returns one :class:`BulkResult` per resource id.
+        """
+        return run_bulk(self.delete, ((resource_id, (resource_id,)) for resource_id in resource_ids), max_workers)
+
+    def plan(
+        self,
+        desired: Iterable[Mapping[str, Any]],
+        key: Any = None,
+        prune: bool = False,
+        max_workers: int = 1,
+    ) -> Plan:
+        """
+        Diff the `desired` attributes against the current resources, listed once.
+        Items are matched by `key` (an attribute name, a tuple of names or a function of the
+        attributes, `reconcile_key` by default) and current items missing from `desired`
+        are deleted when `prune` is set. Nothing is changed until the plan is applied.
+        """
+        return plan_changes(self.list_iter(max_workers=max_workers), desired, key or self.reconcile_key, prune)
+
+    def apply(self, plan: Plan, max_workers: int = _API_BULK_MAX_WORKERS) -> List[BulkResult[Any]]:
+        """
+        Run the plan operations concurrently on `max_workers` threads.
+        Returns one :class:`BulkResult` per operation, keyed by reconcile key.
+        """
+        return apply_plan(plan, self.create, self.update, self.delete, max_workers)
+
 
 class MutableSubResource(ImmutableSubResource):
     """
@@ -223,16 +337,16 @@ class MutableSubResource(ImmutableSubResource):
         """
         Create resource.
         """
-        result = self.http_client.post(path=self._build_path(URL(self.name)), json=payload)
+        result = self.http_client.post(path=self._path(), json=payload)
         if 201 == result.status_code:
-            payload = result.json()
+            payload = self.http_client.json(result)
             return payload
 
         raise ApiError(
             resource=self.name,
             status_code=result.status_code,
             reason=result.reason,
-            errors=parse_error_response(result),
+            errors=parse_error_response(result, self.http_client.decoder),
         )
 
     def delete(self, resource_id: Optional[str] = None) -> JSON:
@@ -247,7 +361,7 @@ class MutableSubResource(ImmutableSubResource):
                 f" {self.__class__.__name__}('12345').delete()."
             )
 
-        result = self.http_client.delete(path=self._build_path(URL(self.name)) / resource_id)
+        result = self.http_client.delete(path=self._path(resource_id))
         if 204 == result.status_code:
             return None
 
@@ -255,7 +369,7 @@ class MutableSubResource(ImmutableSubResource):
             resource=self.name,
             status_code=result.status_code,
             reason=result.reason,
-            errors=parse_error_response(result),
+            errors=parse_error_response(result, self.http_client.decoder),
         )
 
     def update(self, payload: JSON, resource_id: Optional[str] = None) -> JSON:
@@ -271,16 +385,42 @@ class MutableSubResource(ImmutableSubResource):
             )
 
         result = self.http_client.patch(
-            path=self._build_path(URL(self.name)) / resource_id,
+            path=self._path(resource_id),
             json=payload,
         )
         if 200 == result.status_code:
-            payload = result.json()
+            payload = self.http_client.json(result)
             return payload
 
         raise ApiError(
             resource=self.name,
             status_code=result.status_code,
             reason=result.reason,
-            errors=parse_error_response(result),
+            errors=parse_error_response(result, self.http_client.decoder),
         )
+
+    def create_many(self, payloads: Iterable[JSON], max_workers: int = _API_BULK_MAX_WORKERS) -> List[BulkResult[int]]:
+        """
+        Create resources concurrently on `max_workers` threads.
+        Returns one :class:`BulkResult` per payload, in the same order and keyed by payload index.
+        """
+        return run_bulk(self.create, ((index, (payload,)) for index, payload in enumerate(payloads)), max_workers)
+
+    def update_many(
+        self, payloads: Mapping[str, JSON], max_workers: int = _API_BULK_MAX_WORKERS
+    ) -> List[BulkResult[str]]:
+        """
+        Update resources concurrently on `max_workers` threads, `payloads` maps resource ids to payloads.
+        Returns one :class:`BulkResult` per resource id.
+        """
+        items = ((resource_id, (payload, resource_id)) for resource_id, payload in payloads.items())
+        return run_bulk(self.update, items, max_workers)
+
+    def delete_many(
+        self, resource_ids: Iterable[str], max_workers: int = _API_BULK_MAX_WORKERS
+    ) -> List[BulkResult[str]]:
+        """
+        Delete resources concurrently on `max_workers` threads.
+        Returns one :class:`BulkResult` per resource id.
+        """
+        return run_bulk(self.delete, ((resource_id, (resource_id,)) for resource_id in resource_ids), max_workers)
@@ -0,0 +1,341 @@
+"""
+BetterUptime Heartbeat pings sender
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Dict, List, Optional, Tuple, Type
+
+import requests
+
+from betteruptime.api import _API_PROXIES, _API_VERIFY
+from betteruptime.api.http_client import _get_user_agent_header
+
+logger: logging.Logger = logging.getLogger("betteruptime.api")
+
+# Queued ping: (url, unix time of the ping, replayed from the spool)
+_Ping = Tuple[str, float, bool]
+
+
+def _heartbeat_url(url: str) -> str:
+    """
+    Heartbeat URL of a ping URL built by :meth:`HeartbeatSender.ping_url`.
+    """
+    heartbeat, _, suffix = url.rpartition("/")
+    return heartbeat if suffix == "fail" or suffix.isdigit() else url
+
+
+@dataclass(frozen=True)
+class HeartbeatSenderStats:
+    """
+    Snapshot of a :class:`HeartbeatSender` activity.
+    """
+
+    #: Pings accepted by `ping()`.
+    queued: int
+    #: Pings acknowledged by the API.
+    sent: int
+    #: Pings dropped because the same ping was accepted less than `coalesce_window` ago.
+    coalesced: int
+    #: Pings refused by the API (e.g. unknown heartbeat), they are not retried.
+    failed: int
+    #: Pings written to the spool file because the API was unreachable.
+    spooled: int
+    #: Spooled pings sent again.
+    replayed: int
+    #: Spooled pings dropped because a later ping of the same heartbeat was sent.
+    superseded: int
+    #: Pings dropped because the queue was full or the sender closed.
+    dropped: int
+    #: Pings waiting to be sent.
+    queue_depth: int
+
+
+class HeartbeatSender:
+    """
+    Sends heartbeat pings in the background, without blocking the caller.
+
+    Pings are queued and sent by `workers` threads sharing a pooled session. Identical
+    pings accepted less than `coalesce_window` seconds apart are only sent once. When the
+    API is unreachable (network errors, timeouts, 5xx), pings are appended to the
+    `spool_path` file and sent again once it answers: the latest ping per heartbeat only,
+    and only when no later ping of that heartbeat was sent meanwhile:
+
+        with betteruptime.HeartbeatSender(spool_path="/var/spool/heartbeats.ndjson") as sender:
+            sender.ping(heartbeat["attributes"]["url"])
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        coalesce_window: float = 1.0,
+        spool_path: Optional[str] = None,
+        max_queue: int = 100_000,
+        timeout: float = 10.0,
+        replay_interval: float = 30.0,
+        proxies: Optional[Dict[str, str]] = _API_PROXIES,
+        verify: bool = _API_VERIFY,
+    ) -> None:
+        """
+        :param workers: Threads sending the pings, each keeps a pooled connection alive.
+        :param coalesce_window: Seconds during which identical pings are only sent once, 0 sends them all.
+        :param spool_path: (optional) NDJSON file buffering the pings while the API is unreachable.
+            Pings left there by a previous process are sent once the API answers.
+        :param max_queue: Pings waiting to be sent, further pings are dropped.
+        :param timeout: Seconds to wait for the API to answer a ping.
+        :param replay_interval: Minimum seconds between two replays of the spool file.
+        """
+        self.workers = workers
+        self.coalesce_window = coalesce_window
+        self.spool_path = spool_path
+        self.timeout = timeout
+        self.replay_interval = replay_interval
+        self._proxies = proxies
+        self._verify = verify
+
+        self._queue: queue.Queue[Optional[_Ping]] = queue.Queue(maxsize=max_queue)
+        self._threads: List[threading.Thread] = []
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+        self._spool_lock = threading.Lock()
+        self._replay_lock = threading.Lock()
+        self._last_replay = 0.0
+        self._closed = False
+        self._recent: Dict[str, float] = {}
+        # Time of the latest ping sent, by heartbeat
+        self._last_sent: Dict[str, float] = {}
+
+        self._queued = 0
+        self._sent = 0
+        self._coalesced = 0
+        self._failed = 0
+        self._spooled = 0
+        self._replayed = 0
+        self._superseded = 0
+        self._dropped = 0
+
+    @property
+    def stats(self) -> HeartbeatSenderStats:
+        """
+        Current activity counters.
+        """
+        with self._lock:
+            return HeartbeatSenderStats(
+                queued=self._queued,
+                sent=self._sent,
+                coalesced=self._coalesced,
+                failed=self._failed,
+                spooled=self._spooled,
+                replayed=self._replayed,
+                superseded=self._superseded,
+                dropped=self._dropped,
+                queue_depth=self._queue.qsize(),
+            )
+
+    @staticmethod
+    def ping_url(url: str, failure: bool = False, exit_code: Optional[int] = None) -> str:
+        """
+        URL reporting a success, a failure or a job exit code to the heartbeat `url`.
+        """
+        url = url.rstrip("/")
+        if exit_code is not None:
+            return f"{url}/{exit_code}"
+        return f"{url}/fail" if failure else url
+
+    def ping(self, url: str, failure: bool = False, exit_code: Optional[int] = None) -> bool:
+        """
+        Queue a ping of the heartbeat `url` and return at once.
+        Returns `False` when the ping was dropped: queue full or sender closed.
+
+        :param url: Heartbeat URL, the `url` attribute of a heartbeat.
+        :param failure: Report a failure instead of a success.
+        :param exit_code: Report a job exit code, 0 is a success and any other code a failure.
+        """
+        url = self.ping_url(url, failure, exit_code)
+        now = time.monotonic()
+        with self._lock:
+            if self._closed:
+                self._dropped += 1
+                return False
+            if self.coalesce_window > 0:
+                last = self._recent.get(url)
+                if last is not None and now - last < self.coalesce_window:
+                    self._coalesced += 1
+                    return True
+                if len(self._recent) >= 10_000:
+                    self._recent = {
+                        key: accepted for key, accepted in self._recent.items() if now - accepted < self.coalesce_window
+                    }
+                self._recent[url] = now
+            if not self._threads:
+                self._start()
+            try:
+                self._queue.put_nowait((url, time.time(), False))
+            except queue.Full:
+                self._dropped += 1
+                return False
+            self._queued += 1
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued ping was sent or spooled.
+        Returns `False` when `timeout` seconds elapsed first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Send the queued pings, then stop the workers and close the connections.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            threads, self._threads = self._threads, []
+        self.flush(timeout)
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> HeartbeatSender:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _start(self) -> None:
+        """
+        Create the session and start the workers, on first ping.
+        """
+        session = requests.Session()
+        http_adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.workers, max_retries=0)
+        session.mount("https://", http_adapter)
+        session.mount("http://", http_adapter)
+        session.headers["User-Agent"] = _get_user_agent_header()
+        self._session = session
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"betteruptime-heartbeats-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self) -> None:
+        while True:
+            ping = self._queue.get()
+            try:
+                if ping is None:
+                    return
+                self._send(ping)
+            except Exception:  # pragma: no cover - a worker must never die
+                logger.exception("Could not send heartbeat ping.")
+            finally:
+                self._queue.task_done()
+
+    def _send(self, ping: _Ping) -> None:
+        url, pinged_at, replayed = ping
+        heartbeat = _heartbeat_url(url)
+        if replayed:
+            with self._lock:
+                if self._last_sent.get(heartbeat, 0.0) >= pinged_at:
+                    # The heartbeat state is the one of its latest ping, an older one must not override it
+                    self._superseded += 1
+                    return
+        assert self._session is not None
+        try:
+            response = self._session.get(url, timeout=self.timeout, proxies=self._proxies, verify=self._verify)
+        except requests.RequestException as exc:
+            self._spool(ping, str(exc))
+            return
+        status_code = response.status_code
+        if status_code >= 500:
+            self._spool(ping, f"HTTP {status_code}")
+            return
+
+        with self._lock:
+            if status_code >= 400:
+                self._failed += 1
+            else:
+                self._sent += 1
+                self._replayed += int(replayed)
+                self._last_sent[heartbeat] = max(self._last_sent.get(heartbeat, 0.0), pinged_at)
+        if status_code >= 400:
+            logger.warning("Heartbeat ping %s was refused: HTTP %d.", url, status_code)
+        elif self.spool_path is not None:
+            self._replay()
+
+    def _spool(self, ping: _Ping, reason: str) -> None:
+        """
+        Buffer a ping the API did not receive.
+        """
+        url, pinged_at, _ = ping
+        if self.spool_path is None:
+            with self._lock:
+                self._dropped += 1
+            logger.warning("Heartbeat ping %s was lost: %s.", url, reason)
+            return
+        line = json.dumps({"url": url, "at": pinged_at}, separators=(",", ":"))
+        with self._spool_lock:
+            with open(self.spool_path, "a", encoding="utf-8") as spool:
+                spool.write(line + "\n")
+        with self._lock:
+            self._spooled += 1
+
+    def _replay(self) -> None:
+        """
+        Queue the spooled pings again, the latest one per heartbeat only: successes,
+        failures and exit codes of a heartbeat are pings of the same heartbeat.
+        """
+        assert self.spool_path is not None
+        now = time.monotonic()
+        if now - self._last_replay < self.replay_interval or not self._replay_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_replay = now
+            with self._spool_lock:
+                try:
+                    with open(self.spool_path, encoding="utf-8") as spool:
+                        lines = spool.readlines()
+                except FileNotFoundError:
+                    return
+                os.unlink(self.spool_path)
+
+            latest: Dict[str, Tuple[float, str]] = {}
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Torn write of a crashed process
+                    continue
+                heartbeat = _heartbeat_url(entry["url"])
+                if heartbeat not in latest or entry["at"] >= latest[heartbeat][0]:
+                    latest[heartbeat] = (entry["at"], entry["url"])
+            for pinged_at, url in sorted(latest.values()):
+                try:
+                    self._queue.put_nowait((url, pinged_at, True))
+                except queue.Full:
+                    self._spool((url, pinged_at, True), "queue full")
+        finally:
+            self._replay_lock.release()
@@ -3,8 +3,12 @@ BetterUptime Incidents Resource
 """
 from __future__ import annotations
 
+from datetime import datetime, timedelta
+from typing import Any, Dict, Generator, Optional
+
 from betteruptime.api.http_client import HTTPClient
 from betteruptime.resources.generic import MutableResource
+from betteruptime.util.sync import CheckpointStore, SyncCheckpoint, sync_items
 
 
 class Incident(MutableResource):
@@ -19,3 +23,34 @@ class Incident(MutableResource):
         new_resource = Incident(http_client=self.http_client)
         new_resource._resource_id = resource_id
         return new_resource
+
+    def sync(
+        self,
+        store: CheckpointStore,
+        key: Optional[str] = None,
+        lookback: timedelta = timedelta(days=1),
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Yield the incidents started, acknowledged or resolved since the last sync checkpointed
+        in `store` under `key` (`incidents` by default).
+
+        Only the incidents started since the last sync, minus `lookback`, are listed (`from`
+        filter). Incidents unresolved at the end of a sync are fetched again on the next syncs,
+        wherever they are, until they are resolved.
+        """
+
+        def filters(checkpoint: SyncCheckpoint) -> Dict[str, str]:
+            if checkpoint.cursor is None:
+                return {}
+            started_at = datetime.fromisoformat(checkpoint.cursor.replace("Z", "+00:00"))
+            return {"from": (started_at - lookback).date().isoformat()}
+
+        return sync_items(
+            self.list,
+            store,
+            key or self._path(),
+            filters=filters,
+            cursor="started_at",
+            is_pending=lambda incident: not (incident.get("attributes") or {}).get("resolved_at"),
+            get=self.get,
+        )
@@ -3,15 +3,16 @@ BetterUptime Monitor Groups Resource
 """
 from __future__ import annotations
 
-from typing import Generator
-
-from yarl import URL
+from functools import partial
+from typing import Generator, Optional
 
 from betteruptime.api.exceptions import ApiError
 from betteruptime.api.http_client import HTTPClient
 from betteruptime.resources.generic import MutableResource
 from betteruptime.typing import JSON
 from betteruptime.util.errors import parse_error_response
+from betteruptime.util.pagination import iter_pages
+from betteruptime.util.projection import Fields
 
 
 class MonitorGroup(MutableResource):
@@ -27,9 +28,9 @@ class MonitorGroup(MutableResource):
         new_resource._resource_id = resource_id
         return new_resource
 
-    def monitors(self, page: int = 1) -> JSON:
+    def monitors(self, page: int = 1, fields: Optional[Fields] = None) -> JSON:
         """
-        List paginated monitors in this group.
+        List paginated monitors in this group, keeping only the `fields` attributes when set.
         """
         if self.resource_id is None:
             raise ValueError(
@@ -38,30 +39,32 @@ class MonitorGroup(MutableResource):
             )
 
         result = self.http_client.get(
-            path=(self._get_base_path() / self.resource_id / "monitors").update_query(page=page)
+            path=(self._get_base_path() / self.resource_id / "monitors").update_query(page=page),
+            params=self._sparse_fieldset(fields, "monitors") or None,
         )
         if 200 == result.status_code:
-            payload: JSON = result.json()
+            payload: JSON = self.http_client.json(result, fields)
             return payload
 
         raise ApiError(
             resource=self.name,
             status_code=result.status_code,
             reason=result.reason,
-            errors=parse_error_response(result),
+            errors=parse_error_response(result, self.http_client.decoder),
         )
 
-    def monitors_iter(self, page: int = 1) -> Generator[JSON, None, None]:
+    def monitors_iter(
+        self,
+        page: int = 1,
+        max_workers: int = 1,
+        read_ahead: Optional[int] = None,
+        fields: Optional[Fields] = None,
+    ) -> Generator[JSON, None, None]:
         """
         List all monitor items by itering over all pages.
+        With `max_workers` > 1 the next pages are prefetched concurrently, items are still yielded in order.
+        Items only keep the `fields` attributes when set.
         """
-        while True:
-            result = self.monitors(page=page)
-            assert isinstance(result, dict)
-            for monitor in result["data"]:
-                yield monitor
-            if result["pagination"]["next"]:
-                next_url: URL = URL(result["pagination"]["next"])
-                page = int(next_url.query["page"])
-            else:
-                break
+        fetch_page = self.monitors if fields is None else partial(self.monitors, fields=fields)
+        for result in iter_pages(fetch_page, page=page, max_workers=max_workers, read_ahead=read_ahead):
+            yield from result["data"]
@@ -0,0 +1,140 @@
+"""
+BetterUptime local Monitors index
+"""
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+from betteruptime.typing import JSON
+
+
+class MonitorIndex:
+    """
+    In-memory index of monitors keyed by `id`, `pronounceable_name` and `url`.
+
+    The index is hydrated by `loader` (usually `Monitor.list_iter`) and considered fresh
+    for `ttl` seconds. Lookups return `None` when the index is stale or does not know
+    the key, callers then fall back to the API. Monitors are copied in and out of the
+    index, so callers may modify them freely.
+    """
+
+    def __init__(self, loader: Callable[[], Iterable[JSON]], ttl: float = 300.0) -> None:
+        self._loader = loader
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_name: Dict[str, Set[str]] = {}
+        self._by_url: Dict[str, Set[str]] = {}
+        self._refreshed_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    @property
+    def stale(self) -> bool:
+        """
+        Whether the index is older than its TTL (or was never hydrated).
+        """
+        refreshed_at = self._refreshed_at
+        return refreshed_at is None or time.monotonic() - refreshed_at > self.ttl
+
+    def refresh(self) -> None:
+        """
+        Rebuild the index from the loader.
+        """
+        by_id: Dict[str, Dict[str, Any]] = {}
+        by_name: Dict[str, Set[str]] = {}
+        by_url: Dict[str, Set[str]] = {}
+        for monitor in self._loader():
+            assert isinstance(monitor, dict)
+            self._add(monitor, by_id, by_name, by_url)
+
+        with self._lock:
+            self._by_id, self._by_name, self._by_url = by_id, by_name, by_url
+            self._refreshed_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """
+        Mark the index stale, lookups fall back to the API until the next refresh.
+        """
+        with self._lock:
+            self._refreshed_at = None
+
+    def get(self, resource_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Monitor with this id, `None` when unknown or stale.
+        """
+        if self.stale:
+            return None
+        with self._lock:
+            monitor = self._by_id.get(resource_id)
+        return copy.deepcopy(monitor)
+
+    def get_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Monitor with this pronounceable name, `None` when unknown, ambiguous or stale.
+        """
+        return self._lookup(self._by_name, name)
+
+    def get_by_url(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Monitor with this url, `None` when unknown, ambiguous or stale.
+        """
+        return self._lookup(self._by_url, url)
+
+    def put(self, monitor: JSON) -> None:
+        """
+        Add or replace a monitor (a `data` item of the API responses).
+        """
+        assert isinstance(monitor, dict)
+        monitor = copy.deepcopy(monitor)
+        with self._lock:
+            self._discard(str(monitor["id"]))
+            self._add(monitor, self._by_id, self._by_name, self._by_url)
+
+    def remove(self, resource_id: str) -> None:
+        """
+        Forget a monitor.
+        """
+        with self._lock:
+            self._discard(resource_id)
+
+    def _lookup(self, keys: Dict[str, Set[str]], key: str) -> Optional[Dict[str, Any]]:
+        if self.stale:
+            return None
+        with self._lock:
+            resource_ids = keys.get(key)
+            if resource_ids is None or len(resource_ids) != 1:
+                return None
+            monitor = self._by_id.get(next(iter(resource_ids)))
+        return copy.deepcopy(monitor)
+
+    def _discard(self, resource_id: str) -> None:
+        monitor = self._by_id.pop(resource_id, None)
+        if monitor is None:
+            return
+        attributes = monitor.get("attributes") or {}
+        for keys, key in ((self._by_name, attributes.get("pronounceable_name")), (self._by_url, attributes.get("url"))):
+            if key is None or key not in keys:
+                continue
+            keys[key].discard(resource_id)
+            if not keys[key]:
+                del keys[key]
+
+    @staticmethod
+    def _add(
+        monitor: Dict[str, Any],
+        by_id: Dict[str, Dict[str, Any]],
+        by_name: Dict[str, Set[str]],
+        by_url: Dict[str, Set[str]],
+    ) -> None:
+        resource_id = str(monitor["id"])
+        by_id[resource_id] = monitor
+        attributes = monitor.get("attributes") or {}
+        if attributes.get("pronounceable_name") is not None:
+            by_name.setdefault(attributes["pronounceable_name"], set()).add(resource_id)
+        if attributes.get("url") is not None:
+            by_url.setdefault(attributes["url"], set()).add(resource_id)
@@ -4,13 +4,15 @@ BetterUptime Monitors Resource
 from __future__ import annotations
 
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Optional
 
 from betteruptime.api.exceptions import ApiError
 from betteruptime.api.http_client import HTTPClient
 from betteruptime.resources.generic import MutableResource
+from betteruptime.resources.monitor_index import MonitorIndex
 from betteruptime.typing import JSON
 from betteruptime.util.errors import parse_error_response
+from betteruptime.util.projection import Fields, project_item
 
 
 class Monitor(MutableResource):
@@ -18,17 +20,93 @@ class Monitor(MutableResource):
     Represents BetterUptime Monitors Resource
     """
 
+    _index: Optional[MonitorIndex] = None
+    reconcile_key = "url"
+
     def __init__(self, http_client: HTTPClient, name: str = "monitors") -> None:
         super().__init__(http_client, name)
 
     def __call__(self, resource_id: str) -> Monitor:
         new_resource = Monitor(http_client=self.http_client)
         new_resource._resource_id = resource_id
+        new_resource._index = self._index
         return new_resource
 
+    @property
+    def index(self) -> Optional[MonitorIndex]:
+        """
+        index property getter, `None` unless :meth:`enable_index` was called.
+        """
+        return self._index
+
+    def enable_index(self, ttl: float = 300.0, max_workers: int = 1) -> MonitorIndex:
+        """
+        Load every monitor once into a local index serving `get`, `get_by_name` and `get_by_url`.
+        The index follows this resource create/update/delete calls, after `ttl` seconds lookups
+        go back to the API until :meth:`MonitorIndex.refresh` is called.
+        """
+        index = MonitorIndex(loader=lambda: self.list_iter(max_workers=max_workers), ttl=ttl)
+        index.refresh()
+        self._index = index
+        return index
+
+    def disable_index(self) -> None:
+        """
+        Drop the local index, lookups go back to the API.
+        """
+        self._index = None
+
+    def _remember(self, payload: JSON) -> None:
+        """
+        Store a monitor returned by the API in the index.
+        """
+        if self._index is not None and isinstance(payload, dict) and isinstance(payload.get("data"), dict):
+            self._index.put(payload["data"])
+
+    def get(self, resource_id: Optional[str] = None, fields: Optional[Fields] = None) -> JSON:
+        """
+        Get a single monitor, from the index when enabled, keeping only the `fields` attributes when set.
+        """
+        resource_id = resource_id or self.resource_id
+        if self._index is not None and resource_id is not None:
+            monitor = self._index.get(resource_id)
+            if monitor is not None:
+                return {"data": monitor if fields is None else project_item(monitor, fields)}
+
+        payload = super().get(resource_id, fields)
+        if fields is None:
+            self._remember(payload)
+        return payload
+
+    def create(self, payload: JSON) -> JSON:
+        """
+        Create monitor.
+        """
+        payload = super().create(payload)
+        self._remember(payload)
+        return payload
+
+    def update(self, payload: JSON, resource_id: Optional[str] = None) -> JSON:
+        """
+        Update monitor.
+        """
+        payload = super().update(payload, resource_id)
+        self._remember(payload)
+        return payload
+
+    def delete(self, resource_id: Optional[str] = None) -> JSON:
+        """
+        Delete monitor.
+        """
+        resource_id = resource_id or self.resource_id
+        payload = super().delete(resource_id)
+        if self._index is not None and resource_id is not None:
+            self._index.remove(resource_id)
+        return payload
+
     def get_by_name(self, name: str) -> JSON:
         """
-        Get a single monitor by name.
+        Get a single monitor by name, from the index when enabled.
         """
         if name is None:
             raise ValueError(
@@ -36,11 +114,18 @@ class Monitor(MutableResource):
                 f" You must use {self.__class__.__name__}.get_by_name('Backend')."
             )
 
+        if self._index is not None:
+            monitor = self._index.get_by_name(name)
+            if monitor is not None:
+                return {"data": monitor}
+
         result = self.http_client.get(path=self._get_base_path().update_query(pronounceable_name=name))
         if 200 == result.status_code:
-            exists = result.json()
+            exists = self.http_client.json(result)
             if len(exists["data"]) == 1:
-                return {"data": exists["data"][0]}
+                payload: JSON = {"data": exists["data"][0]}
+                self._remember(payload)
+                return payload
             raise ApiError(
                 resource=self.name,
                 status_code=HTTPStatus.NOT_FOUND,
@@ -52,12 +137,12 @@ class Monitor(MutableResource):
             resource=self.name,
             status_code=result.status_code,
             reason=result.reason,
-            errors=parse_error_response(result),
+            errors=parse_error_response(result, self.http_client.decoder),
         )
 
     def get_by_url(self, url: str) -> JSON:
         """
-        Get a single monitor by url.
+        Get a single monitor by url, from the index when enabled.
         """
         if url is None:
             raise ValueError(
@@ -65,11 +150,18 @@ class Monitor(MutableResource):
                 f" You must use {self.__class__.__name__}.get_by_url('http://my.company')."
             )
 
+        if self._index is not None:
+            monitor = self._index.get_by_url(url)
+            if monitor is not None:
+                return {"data": monitor}
+
         result = self.http_client.get(path=self._get_base_path().update_query(url=url))
         if 200 == result.status_code:
-            exists = result.json()
+            exists = self.http_client.json(result)
             if len(exists["data"]) == 1:
-                return {"data": exists["data"][0]}
+                payload: JSON = {"data": exists["data"][0]}
+                self._remember(payload)
+                return payload
             raise ApiError(
                 resource=self.name,
                 status_code=HTTPStatus.NOT_FOUND,
@@ -81,7 +173,7 @@ class Monitor(MutableResource):
             resource=self.name,
             status_code=result.status_code,
             reason=result.reason,
-            errors=parse_error_response(result),
+            errors=parse_error_response(result, self.http_client.decoder),
         )
 
     def delete_by_name(self, name: str) -> Any:
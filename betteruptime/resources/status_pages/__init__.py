@@ -1,6 +1,7 @@
 """
 BetterUptims Status Pages Resource
 """
+from .publisher import StatusReportPublisher
 from .status_pages import StatusPage
 
-__all__ = ["StatusPage"]
+__all__ = ["StatusPage", "StatusReportPublisher"]
@@ -0,0 +1,138 @@
+"""
+BetterUptime Status Page Reports publisher
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, cast
+
+from betteruptime.api import _API_BULK_MAX_WORKERS
+from betteruptime.typing import JSON
+from betteruptime.util.bulk import BulkResult, run_bulk
+
+if TYPE_CHECKING:
+    from .status_pages import StatusPage
+
+
+class StatusReportPublisher:
+    """
+    Publishes the same status report on many status pages concurrently.
+
+    The id of the report created on every status page is kept in `report_ids`, so the
+    follow-up status updates are posted without listing the reports again. Save it and
+    pass it back to a new publisher to update the reports from another process.
+    """
+
+    def __init__(
+        self,
+        status_pages: StatusPage,
+        report_ids: Optional[Mapping[str, str]] = None,
+        max_workers: int = _API_BULK_MAX_WORKERS,
+    ) -> None:
+        """
+        :param status_pages: Status pages resource of a client.
+        :param report_ids: (optional) Report id by status page id, from a previous publisher.
+        :param max_workers: Threads publishing on the status pages.
+        """
+        self.status_pages = status_pages
+        self.max_workers = max_workers
+        self._report_ids: Dict[str, str] = dict(report_ids or {})
+        self._affected_resources: Dict[str, List[str]] = {}
+
+    @property
+    def report_ids(self) -> Dict[str, str]:
+        """
+        Report id by status page id.
+        """
+        return dict(self._report_ids)
+
+    @staticmethod
+    def affected_resources_payload(resource_ids: Iterable[str], status: str) -> List[Dict[str, str]]:
+        """
+        `affected_resources` attribute setting the status of the status page resources `resource_ids`.
+        """
+        return [{"status_page_resource_id": str(resource_id), "status": status} for resource_id in resource_ids]
+
+    def publish(
+        self,
+        affected_resources: Mapping[str, Iterable[str]],
+        title: str,
+        message: str,
+        status: str = "downtime",
+        report_type: str = "manual",
+        **attributes: Any,
+    ) -> List[BulkResult[str]]:
+        """
+        Create a status report on every status page concurrently.
+        Returns one :class:`BulkResult` per status page, keyed by status page id.
+
+        Status pages already holding a report in `report_ids` are skipped, so publishing
+        again only retries the status pages that failed.
+
+        :param affected_resources: Ids of the affected status page resources, by status page id.
+        :param title: Report title.
+        :param message: Message of the first status update.
+        :param status: Status of the affected resources: `degraded`, `downtime` or `maintenance`.
+        :param report_type: `manual` or `maintenance`.
+        :param attributes: Other report attributes, e.g. `published_at`.
+        """
+        items = []
+        for status_page_id, resource_ids in affected_resources.items():
+            status_page_id = str(status_page_id)
+            self._affected_resources[status_page_id] = [str(resource_id) for resource_id in resource_ids]
+            if status_page_id in self._report_ids:
+                continue
+            payload = dict(
+                attributes,
+                title=title,
+                message=message,
+                report_type=report_type,
+                affected_resources=self.affected_resources_payload(self._affected_resources[status_page_id], status),
+            )
+            items.append((status_page_id, (status_page_id, payload)))
+
+        results = run_bulk(self._create_report, items, self.max_workers)
+        for result in results:
+            if result.ok:
+                self._report_ids[result.key] = str(cast(Dict[str, Any], result.result)["data"]["id"])
+        return results
+
+    def update(
+        self,
+        message: str,
+        status: str,
+        status_page_ids: Optional[Iterable[str]] = None,
+        affected_resources: Optional[Mapping[str, Iterable[str]]] = None,
+        **attributes: Any,
+    ) -> List[BulkResult[str]]:
+        """
+        Post a status update on the published reports concurrently.
+        Returns one :class:`BulkResult` per status page, keyed by status page id.
+
+        :param message: Status update message.
+        :param status: New status of the affected resources, e.g. `resolved`.
+        :param status_page_ids: (optional) Status pages to update, every published one by default.
+        :param affected_resources: (optional) Ids of the affected status page resources, by status page id.
+            Defaults to the resources given to `publish`.
+        :param attributes: Other status update attributes, e.g. `notify_subscribers`.
+        """
+        if status_page_ids is None:
+            status_page_ids = list(self._report_ids)
+        status_page_ids = [str(status_page_id) for status_page_id in status_page_ids]
+        missing = [status_page_id for status_page_id in status_page_ids if status_page_id not in self._report_ids]
+        if missing:
+            raise KeyError(f"No report was published on the status pages {', '.join(missing)}.")
+
+        items = []
+        for status_page_id in status_page_ids:
+            resource_ids = (affected_resources or {}).get(status_page_id, self._affected_resources.get(status_page_id))
+            payload = dict(attributes, message=message)
+            if resource_ids is not None:
+                payload["affected_resources"] = self.affected_resources_payload(resource_ids, status)
+            items.append((status_page_id, (status_page_id, self._report_ids[status_page_id], payload)))
+        return run_bulk(self._create_status_update, items, self.max_workers)
+
+    def _create_report(self, status_page_id: str, payload: JSON) -> JSON:
+        return self.status_pages(status_page_id).reports.create(payload)
+
+    def _create_status_update(self, status_page_id: str, report_id: str, payload: JSON) -> JSON:
+        return self.status_pages(status_page_id).reports(report_id).status_updates.create(payload)
@@ -17,7 +17,9 @@ class StatusPageReport(MutableSubResource):
 
     _status_updates: StatusPageStatusUpdates
 
-    def __init__(self, http_client: HTTPClient, parent: AbstractResource, name: str = "status-reports") -> None:
+    def __init__(
+        self, http_client: HTTPClient, parent: AbstractResource[HTTPClient], name: str = "status-reports"
+    ) -> None:
         super().__init__(http_client=http_client, parent=parent, name=name)
         self.status_updates = StatusPageStatusUpdates(http_client=http_client, parent=self)
 
@@ -13,7 +13,7 @@ class StatusPageResource(MutableSubResource):
     Represents BetterUptime Status Page Resources Resource.
     """
 
-    def __init__(self, http_client: HTTPClient, parent: AbstractResource, name: str = "resources") -> None:
+    def __init__(self, http_client: HTTPClient, parent: AbstractResource[HTTPClient], name: str = "resources") -> None:
         super().__init__(http_client=http_client, parent=parent, name=name)
 
     def __call__(self, resource_id: str) -> StatusPageResource:
@@ -13,7 +13,7 @@ class StatusPageSection(MutableSubResource):
     Represents BetterUptime Status Page Section Resource.
     """
 
-    def __init__(self, http_client: HTTPClient, parent: AbstractResource, name: str = "sections") -> None:
+    def __init__(self, http_client: HTTPClient, parent: AbstractResource[HTTPClient], name: str = "sections") -> None:
         super().__init__(http_client=http_client, parent=parent, name=name)
 
     def __call__(self, resource_id: str) -> StatusPageSection:
@@ -3,9 +3,13 @@ BetterUptime Status Pages Resource
 """
 from __future__ import annotations
 
+from typing import Mapping, Optional
+
+from betteruptime.api import _API_BULK_MAX_WORKERS
 from betteruptime.api.http_client import HTTPClient
 from betteruptime.resources.generic import MutableResource
 
+from .publisher import StatusReportPublisher
 from .reports import StatusPageReport
 from .resources import StatusPageResource
 from .sections import StatusPageSection
@@ -16,15 +20,13 @@ class StatusPage(MutableResource):
     Represents BetterUptime Status Page Resource.
     """
 
-    _reports: StatusPageReport
-    _resources: StatusPageResource
-    _sections: StatusPageSection
+    # Sub-resources are built on first access
+    _reports: Optional[StatusPageReport] = None
+    _resources: Optional[StatusPageResource] = None
+    _sections: Optional[StatusPageSection] = None
 
     def __init__(self, http_client: HTTPClient, name: str = "status-pages") -> None:
         super().__init__(http_client, name)
-        self.reports = StatusPageReport(http_client=http_client, parent=self)
-        self.resources = StatusPageResource(http_client=http_client, parent=self)
-        self.sections = StatusPageSection(http_client=http_client, parent=self)
 
     def __call__(self, resource_id: str) -> StatusPage:
         new_resource = StatusPage(http_client=self.http_client)
@@ -36,6 +38,8 @@ class StatusPage(MutableResource):
         """
         reports property getter.
         """
+        if self._reports is None:
+            self._reports = StatusPageReport(http_client=self.http_client, parent=self)
         return self._reports
 
     @reports.setter
@@ -50,6 +54,8 @@ class StatusPage(MutableResource):
         """
         resources property getter.
         """
+        if self._resources is None:
+            self._resources = StatusPageResource(http_client=self.http_client, parent=self)
         return self._resources
 
     @resources.setter
@@ -64,6 +70,8 @@ class StatusPage(MutableResource):
         """
         sections property getter.
         """
+        if self._sections is None:
+            self._sections = StatusPageSection(http_client=self.http_client, parent=self)
         return self._sections
 
     @sections.setter
@@ -72,3 +80,11 @@ class StatusPage(MutableResource):
         sections property setter.
         """
         self._sections = sections
+
+    def publisher(
+        self, report_ids: Optional[Mapping[str, str]] = None, max_workers: int = _API_BULK_MAX_WORKERS
+    ) -> StatusReportPublisher:
+        """
+        :class:`StatusReportPublisher` fanning a status report out to many status pages.
+        """
+        return StatusReportPublisher(self, report_ids=report_ids, max_workers=max_workers)
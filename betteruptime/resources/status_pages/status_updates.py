@@ -13,7 +13,9 @@ class StatusPageStatusUpdates(MutableSubResource):
     Represents BetterUptime Status Page Status Update Resource.
     """
 
-    def __init__(self, http_client: HTTPClient, parent: AbstractResource, name: str = "status-updates") -> None:
+    def __init__(
+        self, http_client: HTTPClient, parent: AbstractResource[HTTPClient], name: str = "status-updates"
+    ) -> None:
         super().__init__(http_client=http_client, parent=parent, name=name)
 
     def __call__(self, resource_id: str) -> StatusPageStatusUpdates:
@@ -0,0 +1,339 @@
+"""
+BetterUptime account snapshots.
+
+`export_snapshot` dumps the account resources to a directory, one file per resource
+plus a sorted id index, and `open_snapshot` memory-maps them back for random access
+by id without reading the whole files:
+
+    export_snapshot(client, "snapshots/2022-06-01")
+    with open_snapshot("snapshots/2022-06-01") as snapshot:
+        monitor = snapshot["monitors"].get("123456")
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+from betteruptime.typing import JSON
+from betteruptime.util.decoders import Decoder, get_decoder
+
+if TYPE_CHECKING:
+    from betteruptime.api.api_client import Client
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+
+    _HAS_PYARROW = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_PYARROW = False
+
+#: Client resources exported by default.
+SNAPSHOT_RESOURCES: Tuple[str, ...] = (
+    "monitors",
+    "heartbeats",
+    "monitor_groups",
+    "heartbeat_groups",
+    "policies",
+    "metadata",
+    "status_pages",
+)
+SNAPSHOT_FORMATS: Tuple[str, ...] = ("ndjson", "arrow")
+
+_MANIFEST = "manifest.json"
+_INDEX_MAGIC = b"BUSNAPI1"
+_INDEX_HEADER = struct.Struct("<8sQ")
+# id hash, then byte offset and length of the line (ndjson) or row number and 0 (arrow)
+_INDEX_ENTRY = struct.Struct("<QQQ")
+_ARROW_BATCH_SIZE = 10_000
+
+
+def _id_hash(resource_id: str) -> int:
+    return int.from_bytes(hashlib.blake2b(resource_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _write_index(path: str, entries: List[Tuple[int, int, int]]) -> None:
+    entries.sort()
+    with open(path, "wb") as index:
+        index.write(_INDEX_HEADER.pack(_INDEX_MAGIC, len(entries)))
+        for entry in entries:
+            index.write(_INDEX_ENTRY.pack(*entry))
+
+
+def write_collection(directory: str, name: str, items: Iterable[JSON], snapshot_format: str = "ndjson") -> int:
+    """
+    Write a collection of JSON:API items and its id index to `directory`, returns the items count.
+    """
+    if snapshot_format not in SNAPSHOT_FORMATS:
+        raise ValueError(f"Unknown snapshot format {snapshot_format!r}, expected one of {', '.join(SNAPSHOT_FORMATS)}.")
+    if snapshot_format == "arrow" and not _HAS_PYARROW:
+        raise ImportError(
+            "Arrow snapshots require the `pyarrow` package. Install it with 'pip install betteruptime[arrow]'."
+        )
+
+    data_path = os.path.join(directory, f"{name}.{snapshot_format}")
+    entries: List[Tuple[int, int, int]] = []
+    if snapshot_format == "ndjson":
+        offset = 0
+        with open(f"{data_path}.tmp", "wb") as output:
+            for item in items:
+                assert isinstance(item, dict)
+                line = _dumps(item).encode("utf-8") + b"\n"
+                output.write(line)
+                entries.append((_id_hash(str(item["id"])), offset, len(line) - 1))
+                offset += len(line)
+    else:
+        # Attributes are kept as JSON documents, their types differ from an item to another
+        schema = pyarrow.schema(
+            [(column, pyarrow.string()) for column in ("id", "type", "attributes", "relationships")]
+        )
+        with pyarrow.OSFile(f"{data_path}.tmp", "wb") as sink, pyarrow.ipc.new_file(sink, schema) as writer:
+            batch: Dict[str, List[Optional[str]]] = {column: [] for column in schema.names}
+            for item in items:
+                assert isinstance(item, dict)
+                entries.append((_id_hash(str(item["id"])), len(entries), 0))
+                batch["id"].append(str(item["id"]))
+                batch["type"].append(item.get("type"))
+                batch["attributes"].append(_dumps(item.get("attributes", {})))
+                relationships = item.get("relationships")
+                batch["relationships"].append(_dumps(relationships) if relationships is not None else None)
+                if len(batch["id"]) == _ARROW_BATCH_SIZE:
+                    writer.write_batch(pyarrow.record_batch(list(batch.values()), schema=schema))
+                    batch = {column: [] for column in schema.names}
+            if batch["id"]:
+                writer.write_batch(pyarrow.record_batch(list(batch.values()), schema=schema))
+
+    _write_index(os.path.join(directory, f"{name}.idx.tmp"), entries)
+    os.replace(f"{data_path}.tmp", data_path)
+    os.replace(os.path.join(directory, f"{name}.idx.tmp"), os.path.join(directory, f"{name}.idx"))
+    return len(entries)
+
+
+def write_manifest(directory: str, counts: Dict[str, int], snapshot_format: str = "ndjson") -> None:
+    """
+    Write the snapshot manifest, last: a snapshot without one is incomplete.
+    """
+    manifest = {
+        "version": 1,
+        "format": snapshot_format,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "resources": counts,
+    }
+    with open(os.path.join(directory, f"{_MANIFEST}.tmp"), "w", encoding="utf-8") as output:
+        json.dump(manifest, output, indent=2)
+    os.replace(os.path.join(directory, f"{_MANIFEST}.tmp"), os.path.join(directory, _MANIFEST))
+
+
+def export_snapshot(
+    client: Client,
+    directory: str,
+    resources: Sequence[str] = SNAPSHOT_RESOURCES,
+    snapshot_format: str = "ndjson",
+    max_workers: int = 1,
+) -> Dict[str, int]:
+    """
+    Export every item of the client `resources` (property names, e.g. `monitors`) to `directory`.
+    Pages are prefetched by `max_workers` threads, items are written as they are listed.
+    Returns the items count by resource.
+    """
+    os.makedirs(directory, exist_ok=True)
+    # A previous export stays incomplete while its collections are rewritten
+    try:
+        os.remove(os.path.join(directory, _MANIFEST))
+    except FileNotFoundError:
+        pass
+    counts: Dict[str, int] = {}
+    for name in resources:
+        resource = getattr(client, name)
+        counts[name] = write_collection(
+            directory, name, resource.list_iter(max_workers=max_workers), snapshot_format=snapshot_format
+        )
+    write_manifest(directory, counts, snapshot_format=snapshot_format)
+    return counts
+
+
+class SnapshotCollection:
+    """
+    Items of a resource in a snapshot, looked up by id through the memory-mapped index.
+    Iterating over the collection yields its items in export order.
+    """
+
+    _data: Union[mmap.mmap, bytes] = b""
+    _table: Any = None
+
+    def __init__(self, directory: str, name: str, snapshot_format: str, decoder: Decoder) -> None:
+        self.name = name
+        self.format = snapshot_format
+        self._decoder = decoder
+        self._files: List[Any] = []
+        self._index = self._map(os.path.join(directory, f"{name}.idx"))
+        magic, self._count = _INDEX_HEADER.unpack_from(self._index, 0)
+        if magic != _INDEX_MAGIC:
+            raise ValueError(f"{name}.idx is not a snapshot index.")
+        data_path = os.path.join(directory, f"{name}.{snapshot_format}")
+        if snapshot_format == "arrow":
+            if not _HAS_PYARROW:
+                raise ImportError(
+                    "Arrow snapshots require the `pyarrow` package. Install it with 'pip install betteruptime[arrow]'."
+                )
+            source = pyarrow.memory_map(data_path)
+            self._files.append(source)
+            self._table = pyarrow.ipc.open_file(source).read_all()
+        else:
+            self._data = self._map(data_path)
+
+    def _map(self, path: str) -> Union[mmap.mmap, bytes]:
+        data_file = open(path, "rb")
+        self._files.append(data_file)
+        if os.fstat(data_file.fileno()).st_size == 0:
+            # Empty files can not be mapped
+            return b""
+        mapped = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._files.append(mapped)
+        return mapped
+
+    def __len__(self) -> int:
+        return int(self._count)
+
+    def __contains__(self, resource_id: object) -> bool:
+        return isinstance(resource_id, str) and self.get(resource_id) is not None
+
+    def __getitem__(self, resource_id: str) -> Dict[str, Any]:
+        item = self.get(resource_id)
+        if item is None:
+            raise KeyError(resource_id)
+        return item
+
+    def get(self, resource_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Item with this id, `None` when the snapshot does not have it.
+        """
+        key = _id_hash(resource_id)
+        # Leftmost entry with this hash, then the colliding ones
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if _INDEX_ENTRY.unpack_from(self._index, _INDEX_HEADER.size + middle * _INDEX_ENTRY.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        for position in range(low, self._count):
+            entry_key, offset, length = _INDEX_ENTRY.unpack_from(
+                self._index, _INDEX_HEADER.size + position * _INDEX_ENTRY.size
+            )
+            if entry_key != key:
+                break
+            item = self._read(offset, length)
+            if str(item["id"]) == resource_id:
+                return item
+        return None
+
+    def _read(self, offset: int, length: int) -> Dict[str, Any]:
+        if self.format == "arrow":
+            return self._row(offset)
+        item: Dict[str, Any] = self._decoder(self._data[offset : offset + length])
+        return item
+
+    def _row(self, row: int) -> Dict[str, Any]:
+        item: Dict[str, Any] = {
+            "id": self._table.column("id")[row].as_py(),
+            "type": self._table.column("type")[row].as_py(),
+            "attributes": self._decoder(self._table.column("attributes")[row].as_py().encode("utf-8")),
+        }
+        relationships = self._table.column("relationships")[row].as_py()
+        if relationships is not None:
+            item["relationships"] = self._decoder(relationships.encode("utf-8"))
+        return item
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if self.format == "arrow":
+            for row in range(self._table.num_rows):
+                yield self._row(row)
+            return
+        start = 0
+        data = self._data
+        while start < len(data):
+            end = data.find(b"\n", start)
+            item: Dict[str, Any] = self._decoder(data[start:end])
+            yield item
+            start = end + 1
+
+    def close(self) -> None:
+        """
+        Unmap and close the collection files.
+        """
+        self._index = b""
+        self._data = b""
+        self._table = None
+        for opened in reversed(self._files):
+            opened.close()
+        self._files = []
+
+
+class Snapshot:
+    """
+    Snapshot written by :func:`export_snapshot`, collections are opened on first access.
+    """
+
+    def __init__(self, directory: str, decoder: Union[str, Decoder, None] = None) -> None:
+        self.directory = directory
+        try:
+            with open(os.path.join(directory, _MANIFEST), encoding="utf-8") as manifest:
+                self.manifest: Dict[str, Any] = json.load(manifest)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{directory} has no snapshot manifest, the export may be incomplete.") from None
+        self._decoder = get_decoder(decoder)
+        self._collections: Dict[str, SnapshotCollection] = {}
+
+    @property
+    def resources(self) -> List[str]:
+        """
+        Names of the exported resources.
+        """
+        return list(self.manifest["resources"])
+
+    def __getitem__(self, name: str) -> SnapshotCollection:
+        collection = self._collections.get(name)
+        if collection is None:
+            if name not in self.manifest["resources"]:
+                raise KeyError(name)
+            collection = self._collections[name] = SnapshotCollection(
+                self.directory, name, self.manifest["format"], self._decoder
+            )
+        return collection
+
+    def close(self) -> None:
+        """
+        Close the opened collections.
+        """
+        for collection in self._collections.values():
+            collection.close()
+        self._collections = {}
+
+    def __enter__(self) -> Snapshot:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def open_snapshot(directory: str, decoder: Union[str, Decoder, None] = None) -> Snapshot:
+    """
+    Open a snapshot written by :func:`export_snapshot`.
+    """
+    return Snapshot(directory, decoder=decoder)
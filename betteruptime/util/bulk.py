@@ -0,0 +1,79 @@
+"""
+BetterUptime bulk operations helpers.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+from betteruptime.api.exceptions import BetterUptimeException
+from betteruptime.typing import JSON
+
+KeyT = TypeVar("KeyT")
+
+
+@dataclass(frozen=True)
+class BulkResult(Generic[KeyT]):
+    """
+    Outcome of a single item of a bulk operation: either a `result` or an `error`.
+    `key` is the payload index for creations and the resource id for updates and deletions.
+    """
+
+    key: KeyT
+    result: JSON = None
+    error: Optional[BetterUptimeException] = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether this item succeeded.
+        """
+        return self.error is None
+
+
+def run_bulk(
+    operation: Callable[..., JSON],
+    items: Iterable[Tuple[KeyT, Tuple[Any, ...]]],
+    max_workers: int,
+) -> List[BulkResult[KeyT]]:
+    """
+    Call `operation(*args)` for every `(key, args)` item on a pool of `max_workers` threads.
+    Results are returned in the items order, BetterUptime errors are collected instead of raised.
+    """
+
+    def call(key: KeyT, args: Tuple[Any, ...]) -> BulkResult[KeyT]:
+        try:
+            return BulkResult(key=key, result=operation(*args))
+        except BetterUptimeException as exc:
+            return BulkResult(key=key, error=exc)
+
+    items = list(items)
+    if not items:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix="betteruptime-bulk") as pool:
+        futures = [pool.submit(call, key, args) for key, args in items]
+        return [future.result() for future in futures]
+
+
+async def run_bulk_async(
+    operation: Callable[..., Awaitable[JSON]],
+    items: Iterable[Tuple[KeyT, Tuple[Any, ...]]],
+    max_concurrency: int,
+) -> List[BulkResult[KeyT]]:
+    """
+    Await `operation(*args)` for every `(key, args)` item, at most `max_concurrency` at a time.
+    Results are returned in the items order, BetterUptime errors are collected instead of raised.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call(key: KeyT, args: Tuple[Any, ...]) -> BulkResult[KeyT]:
+        async with semaphore:
+            try:
+                return BulkResult(key=key, result=await operation(*args))
+            except BetterUptimeException as exc:
+                return BulkResult(key=key, error=exc)
+
+    return list(await asyncio.gather(*(call(key, args) for key, args in items)))
@@ -0,0 +1,46 @@
+"""
+BetterUptime request and response compression helpers.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any, Dict, Tuple
+
+import requests
+from urllib3.util.request import ACCEPT_ENCODING as _URLLIB3_ACCEPT_ENCODING
+
+#: Content codings `requests` decodes: gzip and deflate, plus br and zstd when
+#: the `brotli` and `zstandard` packages are installed (`pip install betteruptime[compression]`).
+ACCEPT_ENCODING: str = ", ".join(coding.strip() for coding in _URLLIB3_ACCEPT_ENCODING.split(","))
+
+#: Response attribute holding the body size on the wire, set by transports that measure it.
+WIRE_BYTES: str = "_betteruptime_wire_bytes"
+
+_GZIP_LEVEL = 6
+
+
+def encode_json(payload: Any, threshold: int) -> Tuple[bytes, Dict[str, str], int]:
+    """
+    Serialize a JSON request body like `requests` does, gzipped when it is at least `threshold` bytes.
+    Returns the body, the headers describing it and its uncompressed size.
+    """
+    body = json.dumps(payload, allow_nan=False).encode("utf-8")
+    size = len(body)
+    headers = {"Content-Type": "application/json"}
+    if size >= threshold:
+        body = gzip.compress(body, compresslevel=_GZIP_LEVEL)
+        headers["Content-Encoding"] = "gzip"
+    return body, headers, size
+
+
+def wire_bytes(response: requests.Response) -> int:
+    """
+    Size of a read response body as received, before its content coding is decoded.
+    """
+    size = response.__dict__.get(WIRE_BYTES)
+    if size is None:
+        # urllib3 counts the raw bytes read from the socket
+        tell = getattr(response.raw, "tell", None)
+        size = tell() if callable(tell) else 0
+    return int(size) or len(response.content or b"")
@@ -0,0 +1,80 @@
+"""
+BetterUptime JSON decoders.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_ORJSON = False
+
+try:
+    import msgspec
+
+    _HAS_MSGSPEC = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_MSGSPEC = False
+
+Decoder = Callable[[bytes], Any]
+"""
+Decode a raw JSON body, raising a `ValueError` when it is not valid JSON.
+"""
+
+
+def stdlib_decoder(content: bytes) -> Any:
+    """
+    Decode JSON with the standard library `json` module.
+    """
+    return json.loads(content)
+
+
+def orjson_decoder(content: bytes) -> Any:
+    """
+    Decode JSON with `orjson` (its `JSONDecodeError` is a `ValueError`).
+    """
+    return orjson.loads(content)
+
+
+def msgspec_decoder(content: bytes) -> Any:
+    """
+    Decode JSON with `msgspec`.
+    """
+    try:
+        return _msgspec_decode(content)
+    except msgspec.DecodeError as exc:
+        raise ValueError(str(exc)) from exc
+
+
+if _HAS_MSGSPEC:
+    _msgspec_decode = msgspec.json.Decoder().decode
+
+DECODERS: Dict[str, Decoder] = {"json": stdlib_decoder}
+if _HAS_MSGSPEC:
+    DECODERS["msgspec"] = msgspec_decoder
+if _HAS_ORJSON:
+    DECODERS["orjson"] = orjson_decoder
+
+# Fastest first
+_PREFERENCE = ("orjson", "msgspec", "json")
+
+
+def get_decoder(decoder: Union[str, Decoder, None] = None) -> Decoder:
+    """
+    Resolve a decoder setting: a callable is returned as is, a name picks one
+    of :data:`DECODERS` and `None` (or `"auto"`) the fastest installed backend.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder is None or decoder == "auto":
+        return next(DECODERS[name] for name in _PREFERENCE if name in DECODERS)
+    try:
+        return DECODERS[decoder]
+    except KeyError:
+        raise ValueError(
+            f"Unknown or not installed JSON decoder {decoder!r}, available decoders: {', '.join(sorted(DECODERS))}."
+        ) from None
@@ -1,20 +1,30 @@
 """
 BetterUptime error helpers.
 """
-import requests
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Union
 
 from betteruptime.typing import JSON
+from betteruptime.util.decoders import Decoder, get_decoder
+
+if TYPE_CHECKING:
+    # Type only: importing the async client would load its transports in sync programs
+    import requests
+
+    from betteruptime.api.async_http_client import AsyncResponse
 
 
-def parse_error_response(response: requests.Response) -> JSON:
+def parse_error_response(response: Union[requests.Response, AsyncResponse], decoder: Optional[Decoder] = None) -> JSON:
     """
-    Parse BetterUptime response to extract errors.
+    Parse BetterUptime response to extract errors, with the client JSON `decoder`.
     """
     errors = None
     try:
-        payload = response.json()
+        payload = (decoder or get_decoder())(response.content)
         errors = payload["errors"]
-    except requests.exceptions.JSONDecodeError:
+    except ValueError:
+        # Every decoder raises a ValueError on invalid JSON
         errors = None
     except KeyError:
         errors = None
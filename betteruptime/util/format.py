@@ -1,10 +1,21 @@
 """
 BetterUptime format helpers.
 """
+from typing import Union
+from urllib.parse import quote
+
 # 3rdp
 from yarl import URL
 
+# Characters `yarl` leaves unquoted in a path
+_PATH_SAFE = "!$&'()*+,;=:@/"
+
 
-def construct_url(url: URL, path: URL) -> str:
+def construct_url(url: URL, path: Union[URL, str]) -> str:
     """Helper to construct URL"""
     return f"{str(url).rstrip('/')}/{str(path).strip('/')}"
+
+
+def quote_path(path: str) -> str:
+    """Helper to quote a path segment, like `yarl.URL` does"""
+    return quote(path, safe=_PATH_SAFE)
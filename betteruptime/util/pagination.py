@@ -0,0 +1,86 @@
+"""
+BetterUptime pagination helpers.
+"""
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Generator, Optional
+
+from yarl import URL
+
+from betteruptime.typing import JSON
+from betteruptime.util.streaming import StreamedPage
+
+
+def page_number(url: Optional[str]) -> Optional[int]:
+    """
+    Extract the page number from a pagination link, `None` when there is no such page.
+    """
+    if not url:
+        return None
+    page = URL(url).query.get("page")
+    return int(page) if page is not None else None
+
+
+def iter_pages(
+    fetch_page: Callable[[int], JSON],
+    page: int = 1,
+    max_workers: int = 1,
+    read_ahead: Optional[int] = None,
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Yield every page payload in order, starting at `page`.
+
+    With `max_workers` > 1, the last page number is read from the first response
+    and the following pages are fetched concurrently by `max_workers` threads,
+    at most `read_ahead` pages (defaults to twice `max_workers`) ahead of the consumer.
+    Pending requests are cancelled and running ones awaited when the consumer stops early.
+    """
+    result = fetch_page(page)
+    assert isinstance(result, dict)
+    last_page = page_number(result["pagination"].get("last"))
+
+    if max_workers > 1 and last_page is not None and last_page > page:
+        read_ahead = max(read_ahead or 2 * max_workers, 1)
+        pages = iter(range(page + 1, last_page + 1))
+        window: Deque["Future[JSON]"] = deque()
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="betteruptime-prefetch")
+        try:
+            for next_page in islice(pages, read_ahead):
+                window.append(executor.submit(fetch_page, next_page))
+            yield result
+            while window:
+                result = window.popleft().result()
+                assert isinstance(result, dict)
+                for next_page in islice(pages, 1):
+                    window.append(executor.submit(fetch_page, next_page))
+                yield result
+        finally:
+            for future in window:
+                future.cancel()
+            executor.shutdown(wait=True)
+    else:
+        yield result
+
+    # Sequential walk, also picks up pages added after the first response was read.
+    following_page = page_number(result["pagination"].get("next"))
+    while following_page is not None:
+        result = fetch_page(following_page)
+        assert isinstance(result, dict)
+        yield result
+        following_page = page_number(result["pagination"].get("next"))
+
+
+def iter_streamed_items(
+    stream_page: Callable[[int], StreamedPage],
+    page: int = 1,
+) -> Generator[JSON, None, None]:
+    """
+    Yield every item of every page in order, starting at `page`, decoded while each page is read.
+    Pages are requested one after the other: the next page is only known at the end of the current one.
+    """
+    following_page: Optional[int] = page
+    while following_page is not None:
+        with stream_page(following_page) as streamed:
+            yield from streamed
+        following_page = page_number(streamed.pagination.get("next"))
@@ -0,0 +1,124 @@
+"""
+BetterUptime sparse fieldsets: payloads keeping only some item attributes.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from betteruptime.typing import JSON
+from betteruptime.util.decoders import DECODERS, Decoder
+
+try:
+    import msgspec
+
+    _HAS_MSGSPEC = hasattr(msgspec, "UNSET")
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_MSGSPEC = False
+
+Fields = Iterable[str]
+"""
+Names of the item attributes to keep, e.g. ``("url", "paused")``.
+"""
+
+
+def fieldset(fields: Fields) -> Tuple[str, ...]:
+    """
+    Normalized, hashable `fields`.
+    """
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    return tuple(sorted(set(field.strip() for field in fields if field.strip())))
+
+
+def item_type(resource_name: str) -> str:
+    """
+    JSON:API type of the items of a resource, e.g. `status_page` for `status-pages`.
+    """
+    name = resource_name.replace("-", "_")
+    if name.endswith("ies"):
+        return name[:-3] + "y"
+    return name[:-1] if name.endswith("s") else name
+
+
+def sparse_fieldset_param(item_type: str, fields: Fields) -> Dict[str, str]:
+    """
+    JSON:API sparse fieldset query parameter, e.g. ``{"fields[monitor]": "paused,url"}``.
+    """
+    return {f"fields[{item_type}]": ",".join(fieldset(fields))}
+
+
+def project_item(item: Dict[str, Any], fields: Fields) -> Dict[str, Any]:
+    """
+    Copy of a JSON:API item keeping its `id`, `type` and the `fields` attributes it has.
+    """
+    attributes = item.get("attributes") or {}
+    projected: Dict[str, Any] = {key: item[key] for key in ("id", "type") if key in item}
+    projected["attributes"] = {field: attributes[field] for field in fieldset(fields) if field in attributes}
+    return projected
+
+
+def project_payload(payload: JSON, fields: Fields) -> JSON:
+    """
+    Copy of a single item or list payload keeping only the `fields` attributes of its items.
+    Relationships and included resources are dropped, the pagination links are kept.
+    """
+    if not isinstance(payload, dict):
+        return payload
+    data = payload.get("data")
+    projected: Dict[str, Any] = {}
+    if isinstance(data, list):
+        projected["data"] = [project_item(item, fields) for item in data]
+    elif isinstance(data, dict):
+        projected["data"] = project_item(data, fields)
+    else:
+        projected["data"] = data
+    if "pagination" in payload:
+        projected["pagination"] = payload["pagination"]
+    return projected
+
+
+def projection_decoder(fields: Fields, decoder: Decoder) -> Callable[[bytes], Any]:
+    """
+    Decoder of payloads projected on `fields`.
+
+    With `msgspec` installed, the built-in decoders are replaced by a typed `msgspec` decoder
+    skipping the other attributes while the body is parsed, so they are never materialized.
+    Custom decoders decode the whole payload, which is then projected.
+    """
+    if _HAS_MSGSPEC and decoder in DECODERS.values():
+        return _msgspec_projection(fieldset(fields))
+    return lambda content: project_payload(decoder(content), fields)
+
+
+@lru_cache(maxsize=64)
+def _msgspec_projection(fields: Tuple[str, ...]) -> Callable[[bytes], Any]:
+    unset = msgspec.UNSET
+    attributes = msgspec.defstruct(
+        "Attributes", [(field, Any, unset) for field in fields], omit_defaults=True, forbid_unknown_fields=False
+    )
+    item = msgspec.defstruct(
+        "Item",
+        [("id", Any, unset), ("type", Any, unset), ("attributes", Optional[attributes], unset)],
+        omit_defaults=True,
+    )
+    data: Any = Union[List[item], item, None]  # type: ignore[valid-type]
+    page = msgspec.defstruct(
+        "Page", [("data", data, None), ("pagination", Optional[Dict[str, Any]], unset)], omit_defaults=True
+    )
+    decode = msgspec.json.Decoder(page).decode
+
+    def decode_projection(content: bytes) -> Any:
+        try:
+            payload = msgspec.to_builtins(decode(content))
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+        data = payload.get("data")
+        # Items always carry an `attributes` object, even when none of the fields is set
+        for projected in data if isinstance(data, list) else [data] if isinstance(data, dict) else []:
+            if projected.get("attributes") is None:
+                projected["attributes"] = {}
+        payload.setdefault("data", None)
+        return payload
+
+    return decode_projection
@@ -0,0 +1,166 @@
+"""
+BetterUptime declarative reconcile helpers.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from betteruptime.typing import JSON
+from betteruptime.util.bulk import BulkResult, run_bulk
+
+CREATE = "create"
+UPDATE = "update"
+DELETE = "delete"
+
+#: Desired state key, an attribute name or a function of the attributes.
+ReconcileKey = Callable[[Mapping[str, Any]], Any]
+
+
+@dataclass(frozen=True)
+class Operation:
+    """
+    A change needed to reach the desired state.
+    """
+
+    #: `create`, `update` or `delete`.
+    action: str
+    #: Value of the reconcile key of the item.
+    key: Any
+    #: Id of the existing item, `None` for creations.
+    resource_id: Optional[str] = None
+    #: Attributes to send: every desired attribute for creations, only the changed ones for updates.
+    payload: Dict[str, Any] = field(default_factory=dict)
+    #: Changed attributes: `(current, desired)` values by name.
+    changes: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Plan:
+    """
+    Operations reaching the desired state, empty when nothing has to change.
+    """
+
+    operations: List[Operation]
+    #: Desired items already up to date.
+    unchanged: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.operations)
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Operations count by action.
+        """
+        counts = {CREATE: 0, UPDATE: 0, DELETE: 0}
+        for operation in self.operations:
+            counts[operation.action] += 1
+        return dict(counts, unchanged=self.unchanged)
+
+
+def key_function(key: Any) -> ReconcileKey:
+    """
+    Reconcile key function from an attribute name, a tuple of attribute names or a function.
+    """
+    if callable(key):
+        function: ReconcileKey = key
+        return function
+    if isinstance(key, tuple):
+        return lambda attributes: tuple(attributes.get(name) for name in key)
+    return lambda attributes: attributes.get(key)
+
+
+def _is_unset(key: Any) -> bool:
+    return key is None or (isinstance(key, tuple) and all(value is None for value in key))
+
+
+def plan_changes(
+    current: Iterable[JSON],
+    desired: Iterable[Mapping[str, Any]],
+    key: Any = "name",
+    prune: bool = False,
+) -> Plan:
+    """
+    Diff the `current` JSON:API items against the `desired` attributes, matched by `key`.
+
+    Only the attributes present in a desired item are compared, so partial specifications
+    leave the other attributes alone. Current items without a desired counterpart are
+    deleted when `prune` is set, and left alone otherwise. Current items without a key value,
+    e.g. resources without a `name` attribute, are not managed: never matched nor deleted.
+    """
+    key_of = key_function(key)
+    current_by_key: Dict[Any, Dict[str, Any]] = {}
+    for item in current:
+        assert isinstance(item, dict)
+        item_key = key_of(item.get("attributes") or {})
+        if _is_unset(item_key):
+            continue
+        if item_key in current_by_key:
+            raise ValueError(f"Several current items share the reconcile key {item_key!r}, use a more specific key.")
+        current_by_key[item_key] = item
+
+    operations: List[Operation] = []
+    unchanged = 0
+    desired_keys = set()
+    for attributes in desired:
+        item_key = key_of(attributes)
+        if item_key in desired_keys:
+            raise ValueError(f"Several desired items share the reconcile key {item_key!r}.")
+        desired_keys.add(item_key)
+
+        existing = current_by_key.get(item_key)
+        if existing is None:
+            operations.append(Operation(action=CREATE, key=item_key, payload=dict(attributes)))
+            continue
+        current_attributes = existing.get("attributes") or {}
+        changes = {
+            name: (current_attributes.get(name), value)
+            for name, value in attributes.items()
+            if current_attributes.get(name) != value
+        }
+        if changes:
+            operations.append(
+                Operation(
+                    action=UPDATE,
+                    key=item_key,
+                    resource_id=str(existing["id"]),
+                    payload={name: desired_value for name, (_, desired_value) in changes.items()},
+                    changes=changes,
+                )
+            )
+        else:
+            unchanged += 1
+
+    if prune:
+        operations.extend(
+            Operation(action=DELETE, key=item_key, resource_id=str(item["id"]))
+            for item_key, item in current_by_key.items()
+            if item_key not in desired_keys
+        )
+    return Plan(operations=operations, unchanged=unchanged)
+
+
+def apply_plan(
+    plan: Plan,
+    create: Callable[[JSON], JSON],
+    update: Callable[[JSON, str], JSON],
+    delete: Callable[[str], JSON],
+    max_workers: int,
+) -> List[BulkResult[Any]]:
+    """
+    Run the plan operations concurrently on `max_workers` threads.
+    Returns one :class:`BulkResult` per operation, in the plan order and keyed by reconcile key.
+    """
+
+    def execute(operation: Operation) -> JSON:
+        if operation.action == CREATE:
+            return create(operation.payload)
+        assert operation.resource_id is not None
+        if operation.action == UPDATE:
+            return update(operation.payload, operation.resource_id)
+        return delete(operation.resource_id)
+
+    return run_bulk(execute, ((operation.key, (operation,)) for operation in plan.operations), max_workers)
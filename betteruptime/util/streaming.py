@@ -0,0 +1,172 @@
+"""
+BetterUptime streaming JSON helpers.
+"""
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Pattern
+
+_WHITESPACE: Pattern[str] = re.compile(r"[ \t\r\n]*")
+_SEPARATORS: Pattern[str] = re.compile(r"[ \t\r\n,]*")
+
+# Sentinel yielded by the parser coroutine when it needs another chunk
+_NEED_DATA: Any = object()
+
+
+class JSONArrayParser:
+    """
+    Incremental parser of a JSON object which decodes the items of its `key` array
+    as soon as they are complete, e.g. the `data` of a list page.
+
+    Feed it the body chunks, then call :meth:`close`. The other members of the object
+    (e.g. `pagination`) are available in :attr:`members` once parsed. Only the current
+    item and one chunk are held in memory, whatever the size of the array.
+
+    Values are decoded by the C scanner of the standard library `json` module, which
+    reports where each value ends, instead of the client decoder.
+    """
+
+    def __init__(self, key: str = "data") -> None:
+        self.key = key
+        self.members: Dict[str, Any] = {}
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._scanner = json.JSONDecoder()
+        self._text = ""
+        self._pos = 0
+        self._eof = False
+        self._parser = self._parse()
+        next(self._parser)
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Parse a chunk of the body, return the items it completed.
+        """
+        self._text = self._text[self._pos :] + self._utf8.decode(chunk)
+        self._pos = 0
+        return self._drain()
+
+    def close(self) -> List[Any]:
+        """
+        Signal the end of the body, return the last items.
+
+        :raises ValueError: if the body is not a complete JSON object.
+        """
+        self._text = self._text[self._pos :] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        return self._drain()
+
+    def _drain(self) -> List[Any]:
+        items = []
+        for item in self._parser:
+            if item is _NEED_DATA:
+                break
+            items.append(item)
+        return items
+
+    def _skip(self, chars: Pattern[str]) -> Generator[Any, None, str]:
+        """
+        Move to the next character not in `chars` and return it.
+        """
+        while True:
+            match = chars.match(self._text, self._pos)
+            assert match is not None
+            self._pos = match.end()
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+            if self._eof:
+                raise ValueError("Unexpected end of JSON document.")
+            yield _NEED_DATA
+
+    def _value(self) -> Generator[Any, None, Any]:
+        """
+        Decode the value starting at the current position.
+        """
+        while True:
+            try:
+                value, end = self._scanner.raw_decode(self._text, self._pos)
+            except ValueError:
+                # Most likely a value cut by the chunk boundary, invalid documents fail at the end
+                if self._eof:
+                    raise
+                yield _NEED_DATA
+                continue
+            # A number could go on in the next chunk
+            if end < len(self._text) or self._eof:
+                self._pos = end
+                return value
+            yield _NEED_DATA
+
+    def _parse(self) -> Generator[Any, None, None]:
+        yield _NEED_DATA
+        if (yield from self._skip(_WHITESPACE)) != "{":
+            raise ValueError("Expected a JSON object.")
+        self._pos += 1
+        while True:
+            if (yield from self._skip(_SEPARATORS)) == "}":
+                self._pos += 1
+                return
+            key = yield from self._value()
+            if (yield from self._skip(_WHITESPACE)) != ":":
+                raise ValueError(f"Expected ':' after {key!r}.")
+            self._pos += 1
+            first = yield from self._skip(_WHITESPACE)
+
+            if key == self.key and first == "[":
+                self._pos += 1
+                while (yield from self._skip(_SEPARATORS)) != "]":
+                    yield (yield from self._value())
+                self._pos += 1
+            else:
+                self.members[key] = yield from self._value()
+
+
+def iter_json_array(chunks: Iterable[bytes], parser: JSONArrayParser) -> Iterator[Any]:
+    """
+    Yield the array items parsed from `chunks` by `parser`, as they are decoded.
+    """
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+class StreamedPage:
+    """
+    Items of a list page, decoded while the response body is read.
+    The page `pagination` is known once every item has been consumed.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], close: Optional[Callable[[], None]] = None) -> None:
+        self._chunks = chunks
+        self._parser = JSONArrayParser(key="data")
+        self._close = close
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            yield from iter_json_array(self._chunks, self._parser)
+        finally:
+            self.close()
+
+    def __enter__(self) -> StreamedPage:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def pagination(self) -> Dict[str, Any]:
+        """
+        The page `pagination` member, empty until it has been read.
+        """
+        pagination: Dict[str, Any] = self._parser.members.get("pagination") or {}
+        return pagination
+
+    def close(self) -> None:
+        """
+        Release the underlying response.
+        """
+        if self._close is not None:
+            self._close()
+            self._close = None
@@ -0,0 +1,215 @@
+"""
+BetterUptime incremental sync helpers.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Generator, List, Mapping, Optional
+
+from betteruptime.api.exceptions import ApiError
+from betteruptime.typing import JSON
+from betteruptime.util.pagination import iter_pages
+
+
+@dataclass
+class SyncCheckpoint:
+    """
+    Progress of an incremental sync, saved after every page.
+    """
+
+    #: Greatest value of the cursor attribute seen (e.g. incidents `started_at`).
+    cursor: Optional[str] = None
+    #: Id of the last item yielded.
+    last_id: Optional[str] = None
+    #: Next page to fetch, greater than 1 while a sync is interrupted.
+    page: int = 1
+    #: Server side filters of the sync in progress, reused when resuming it.
+    filters: Dict[str, str] = field(default_factory=dict)
+    #: Ids of the items that may still change outside of the next syncs window (e.g. unresolved incidents).
+    pending: List[str] = field(default_factory=list)
+    #: Attributes digest by id, to skip the items that did not change since they were yielded.
+    fingerprints: Dict[str, str] = field(default_factory=dict)
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        JSON serializable checkpoint.
+        """
+        return asdict(self)
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, Any]) -> SyncCheckpoint:
+        """
+        Checkpoint saved with `to_json`, unknown keys are ignored.
+        """
+        return cls(**{key: value for key, value in payload.items() if key in cls.__dataclass_fields__})
+
+
+class CheckpointStore(ABC):
+    """
+    Abstract checkpoint store, keeps one :class:`SyncCheckpoint` per sync key.
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[SyncCheckpoint]:
+        """
+        Checkpoint saved under `key`, `None` before the first sync.
+        """
+
+    @abstractmethod
+    def save(self, key: str, checkpoint: SyncCheckpoint) -> None:
+        """
+        Save the checkpoint under `key`.
+        """
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """
+    In-memory checkpoint store, for tests and long running processes.
+    """
+
+    def __init__(self) -> None:
+        self._checkpoints: Dict[str, Dict[str, Any]] = {}
+
+    def load(self, key: str) -> Optional[SyncCheckpoint]:
+        payload = self._checkpoints.get(key)
+        return SyncCheckpoint.from_json(payload) if payload is not None else None
+
+    def save(self, key: str, checkpoint: SyncCheckpoint) -> None:
+        # Copied, the sync keeps updating its own checkpoint
+        self._checkpoints[key] = json.loads(json.dumps(checkpoint.to_json()))
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store backed by a JSON file, replaced atomically on every save.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, encoding="utf-8") as checkpoints:
+                payload: Dict[str, Any] = json.load(checkpoints)
+        except FileNotFoundError:
+            return {}
+        return payload
+
+    def load(self, key: str) -> Optional[SyncCheckpoint]:
+        with self._lock:
+            payload = self._read().get(key)
+        return SyncCheckpoint.from_json(payload) if payload is not None else None
+
+    def save(self, key: str, checkpoint: SyncCheckpoint) -> None:
+        with self._lock:
+            checkpoints = self._read()
+            checkpoints[key] = checkpoint.to_json()
+            directory = os.path.dirname(os.path.abspath(self.path))
+            descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".checkpoints-")
+            try:
+                with os.fdopen(descriptor, "w", encoding="utf-8") as output:
+                    json.dump(checkpoints, output, separators=(",", ":"))
+                os.replace(temporary, self.path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+
+
+def fingerprint(item: Mapping[str, Any]) -> str:
+    """
+    Short digest of an item attributes.
+    """
+    attributes = json.dumps(item.get("attributes"), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(attributes.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def sync_items(
+    list_page: Callable[[int, Mapping[str, str]], JSON],
+    store: CheckpointStore,
+    key: str,
+    filters: Callable[[SyncCheckpoint], Dict[str, str]] = lambda checkpoint: {},
+    cursor: Optional[str] = None,
+    is_pending: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    get: Optional[Callable[[str], JSON]] = None,
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Yield the items created or changed since the last sync saved under `key` in `store`.
+    Items are yielded at least once: an interrupted sync resumes at its last page, and may
+    yield again the items of the pages read before the interruption on the following sync.
+
+    :param list_page: lists a page with server side filters, e.g. `Incident.list`.
+    :param filters: server side filters of a new sync, from the previous checkpoint.
+    :param cursor: attribute ordering the items in time, its greatest value is kept in the checkpoint.
+    :param is_pending: whether an item may still change once it is out of the filters window;
+        these are fetched with `get` on the next syncs until they are not pending anymore.
+    """
+    checkpoint = store.load(key) or SyncCheckpoint()
+    full_pass = checkpoint.page == 1
+    if full_pass:
+        checkpoint.filters = filters(checkpoint)
+    seen: Dict[str, str] = {}
+
+    def changed(item: Dict[str, Any]) -> bool:
+        resource_id = str(item["id"])
+        digest = seen[resource_id] = fingerprint(item)
+        if checkpoint.fingerprints.get(resource_id) == digest:
+            return False
+        checkpoint.fingerprints[resource_id] = digest
+        checkpoint.last_id = resource_id
+        value = (item.get("attributes") or {}).get(cursor) if cursor else None
+        if value is not None and (checkpoint.cursor is None or str(value) > checkpoint.cursor):
+            checkpoint.cursor = str(value)
+        return True
+
+    pending = set(checkpoint.pending)
+    page = checkpoint.page
+    for result in iter_pages(lambda number: list_page(number, checkpoint.filters), page=page):
+        for item in result["data"]:
+            if is_pending is not None:
+                if is_pending(item):
+                    pending.add(str(item["id"]))
+                else:
+                    pending.discard(str(item["id"]))
+            if changed(item):
+                yield item
+        page += 1
+        checkpoint.page = page
+        checkpoint.pending = sorted(pending)
+        store.save(key, checkpoint)
+
+    # Items out of the window may have changed since, e.g. incidents resolved after they started
+    if get is not None:
+        for resource_id in sorted(pending - seen.keys()):
+            try:
+                payload = get(resource_id)
+            except ApiError as exc:
+                if exc.status_code != 404:
+                    raise
+                pending.discard(resource_id)
+                checkpoint.fingerprints.pop(resource_id, None)
+                continue
+            assert isinstance(payload, dict)
+            item = payload["data"]
+            if is_pending is not None and not is_pending(item):
+                pending.discard(resource_id)
+            if changed(item):
+                yield item
+
+    checkpoint.page = 1
+    checkpoint.pending = sorted(pending)
+    if checkpoint.filters or full_pass:
+        # Windowed syncs only need the fingerprints of the items the next windows can return again,
+        # a full pass over every page only the fingerprints of the items still listed
+        checkpoint.fingerprints = {
+            resource_id: digest
+            for resource_id, digest in checkpoint.fingerprints.items()
+            if resource_id in seen or resource_id in pending
+        }
+    store.save(key, checkpoint)
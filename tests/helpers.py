@@ -0,0 +1,69 @@
+"""
+Helpers shared by the tests
+"""
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from betteruptime.api.async_http_client import AsyncResponse, AsyncTransport
+
+#: Base URL of the API v2.
+API = "https://betteruptime.com/api/v2"
+
+#: Body of an empty listing page.
+EMPTY_PAGE: Dict[str, Any] = {"data": []}
+
+
+def fake_response(
+    status_code: int = 200,
+    payload: Any = None,
+    content: Optional[bytes] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> requests.Response:
+    """
+    `requests` response with a JSON `payload` body, or a raw `content` body, empty by default.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    if content is None:
+        content = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    response._content = content
+    return response
+
+
+class FakeTransport(AsyncTransport):
+    """
+    In-memory async transport replying with canned responses keyed by (method, url).
+    """
+
+    def __init__(self, responses: Dict[Tuple[str, str], Tuple[int, Any]]) -> None:
+        self.responses = responses
+        self.requests: List[Tuple[str, str, Dict[str, str], Any]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        timeout: float = 30.0,
+        allow_redirects: bool = True,
+    ) -> AsyncResponse:
+        self.requests.append((method, url, headers, json))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        status_code, body = self.responses.get((method, url), (404, {"errors": "Not found"}))
+        content = b"" if body is None else _dumps(body)
+        return AsyncResponse(status_code=status_code, reason="", headers={}, content=content, url=url)
+
+
+def _dumps(body: Any) -> bytes:
+    return json.dumps(body).encode("utf-8")
@@ -0,0 +1,271 @@
+"""
+Local stub of the BetterUptime API, for offline integration tests and benchmarks.
+
+Serves paginated JSON:API collections seeded from the recorded cassettes:
+`monitors`, `heartbeats`, `status-pages` and `status-pages/1/status-reports/1/status-updates`
+(and their items), with optional latency and error injection:
+
+    with StubAPI(monitors=1000, latency=0.002, error_rate=0.01) as stub:
+        client = betteruptime.Client(bearer_token="fake", api_url=stub.url)
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import pathlib
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type
+from urllib.parse import parse_qs, urlsplit
+
+import yaml
+
+API_PREFIX = "/api/v2/"
+CASSETTES = pathlib.Path(__file__).parent / "cassettes"
+
+
+def recorded_payload(test_name: str) -> Dict[str, Any]:
+    """
+    Decoded body of the first response recorded by `TestClient.<test_name>`.
+    """
+    cassette = yaml.safe_load((CASSETTES / f"TestClient.{test_name}.yaml").read_text())
+    response = cassette["interactions"][0]["response"]
+    body = response["body"]["string"]
+    if "gzip" in response["headers"].get("Content-Encoding", []):
+        body = gzip.decompress(body)
+    payload: Dict[str, Any] = json.loads(body)
+    return payload
+
+
+class StubAPI:
+    """
+    In-memory BetterUptime API served by a threaded HTTP/1.1 server on localhost.
+
+    :param monitors, heartbeats, status_reports, status_updates: collection sizes.
+    :param per_page: items per list page.
+    :param latency: seconds every response is delayed by.
+    :param error_rate: share of requests answered `500 Internal Server Error`.
+    :param throttle_rate: share of requests answered `429 Too Many Requests` with `Retry-After: 0`.
+    :param seed: seed of the error injection.
+    :param compress: gzip the response bodies when the client accepts it.
+
+    Request bodies sent with `Content-Encoding: gzip` are always accepted.
+    """
+
+    def __init__(
+        self,
+        monitors: int = 250,
+        heartbeats: int = 250,
+        status_reports: int = 50,
+        status_updates: int = 50,
+        per_page: int = 50,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: int = 0,
+        compress: bool = False,
+    ) -> None:
+        self.per_page = per_page
+        self.compress = compress
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self.requests = 0
+        #: Requests received per `Authorization` header.
+        self.authorizations: Dict[str, int] = {}
+        self.collections: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._templates: Dict[str, Dict[str, Any]] = {}
+        self._seed("monitors", "test_get_monitor_200", monitors)
+        self._seed("heartbeats", "test_get_heartbeat_200", heartbeats)
+        self._seed("status-pages", "test_get_status_page_200", 1)
+        self._seed("status-pages/1/status-reports", "test_get_status_page_report_200", status_reports)
+        self._seed(
+            "status-pages/1/status-reports/1/status-updates",
+            "test_get_status_page_report_status_update_200",
+            status_updates,
+        )
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """
+        Base url to give to the client as `api_url`.
+        """
+        assert self._server is not None, "StubAPI is not started."
+        port = self._server.server_address[1]
+        return f"http://127.0.0.1:{port}"
+
+    def start(self) -> StubAPI:
+        """
+        Serve on a free localhost port, in a daemon thread.
+        """
+        stub = self
+
+        class Handler(_StubHandler):
+            api = stub
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="betteruptime-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop serving.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> StubAPI:
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
+    def handle(
+        self, method: str, target: str, body: Optional[Any], authorization: str = ""
+    ) -> Tuple[int, Dict[str, str], Any]:
+        """
+        Answer a request: status code, headers and JSON body (`None` for no body).
+        """
+        with self._lock:
+            self.requests += 1
+            self.authorizations[authorization] = self.authorizations.get(authorization, 0) + 1
+            draw = self._random.random()
+        if draw < self.error_rate:
+            return 500, {}, {"errors": "Injected error"}
+        if draw < self.error_rate + self.throttle_rate:
+            return 429, {"Retry-After": "0"}, {"errors": "Injected throttling"}
+
+        url = urlsplit(target)
+        if not url.path.startswith(API_PREFIX):
+            return 404, {}, {"errors": "Not found"}
+        path = url.path[len(API_PREFIX) :].strip("/")
+        collection, _, resource_id = path.rpartition("/")
+        if collection in self.collections and resource_id.isdigit():
+            return self._item(method, collection, resource_id, body)
+        if path in self.collections:
+            return self._collection(method, path, parse_qs(url.query), body)
+        return 404, {}, {"errors": "Not found"}
+
+    def _collection(
+        self, method: str, path: str, query: Dict[str, List[str]], body: Optional[Any]
+    ) -> Tuple[int, Dict[str, str], Any]:
+        items = self.collections[path]
+        if method == "POST":
+            with self._lock:
+                resource_id = self._new_id()
+                item = self._new_item(path, resource_id, body or {})
+                items[resource_id] = item
+            return 201, {}, {"data": item}
+        if method != "GET":
+            return 405, {}, {"errors": "Method not allowed"}
+
+        page = int(query.get("page", ["1"])[0])
+        per_page = int(query.get("per_page", [str(self.per_page)])[0])
+        with self._lock:
+            values = list(items.values())
+        last = max(1, -(-len(values) // per_page))
+        link = f"{self.url}{API_PREFIX}{path}?page="
+        return (
+            200,
+            {},
+            {
+                "data": values[(page - 1) * per_page : page * per_page],
+                "pagination": {
+                    "first": f"{link}1",
+                    "last": f"{link}{last}",
+                    "prev": f"{link}{page - 1}" if page > 1 else None,
+                    "next": f"{link}{page + 1}" if page < last else None,
+                },
+            },
+        )
+
+    def _item(
+        self, method: str, collection: str, resource_id: str, body: Optional[Any]
+    ) -> Tuple[int, Dict[str, str], Any]:
+        items = self.collections[collection]
+        with self._lock:
+            item = items.get(resource_id)
+            if item is None:
+                return 404, {}, {"errors": f"Resource with id = {resource_id} was not found"}
+            if method == "GET":
+                return 200, {}, {"data": item}
+            if method == "PATCH":
+                item = dict(item, attributes=dict(item["attributes"], **(body or {})))
+                items[resource_id] = item
+                return 200, {}, {"data": item}
+            if method == "DELETE":
+                del items[resource_id]
+                return 204, {}, None
+        return 405, {}, {"errors": "Method not allowed"}
+
+    def _seed(self, path: str, test_name: str, size: int) -> None:
+        template = recorded_payload(test_name)["data"]
+        items: Dict[str, Dict[str, Any]] = {}
+        for _ in range(size):
+            resource_id = self._new_id()
+            items[resource_id] = dict(template, id=resource_id)
+        self.collections[path] = items
+        self._templates[path] = template
+
+    def _new_item(self, path: str, resource_id: str, attributes: Dict[str, Any]) -> Dict[str, Any]:
+        template = self._templates[path]
+        return {"id": resource_id, "type": template["type"], "attributes": dict(template["attributes"], **attributes)}
+
+    def _new_id(self) -> str:
+        resource_id = str(self._next_id)
+        self._next_id += 1
+        return resource_id
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body in a single write, without waiting for delayed ACKs
+    wbufsize = 1 << 16
+    disable_nagle_algorithm = True
+    api: StubAPI
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length)
+        if self.headers.get("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+        body = json.loads(raw) if raw else None
+        status, headers, payload = self.api.handle(
+            self.command, self.path, body, self.headers.get("Authorization") or ""
+        )
+        if self.api.latency:
+            time.sleep(self.api.latency)
+        content = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            if self.api.compress and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+                content = gzip.compress(content, compresslevel=1)
+                self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _serve
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
@@ -0,0 +1,123 @@
+"""
+Async client tests
+"""
+import asyncio
+from typing import Any, List
+
+import pytest
+
+import betteruptime
+from betteruptime.api.async_http_client import AsyncResponse
+from betteruptime.api.exceptions import ApiError, HTTPError
+from tests.helpers import API, FakeTransport
+
+
+class TestAsyncClient:
+    """
+    BetterUptime async API Client tests
+    """
+
+    def test_bearer_token_set(self) -> None:
+        """
+        Test if Bearer token is sent with each request.
+        """
+        transport = FakeTransport({("GET", f"{API}/monitors/123456"): (200, {"data": {"id": "123456"}})})
+        client = betteruptime.AsyncClient(bearer_token="fake", transport=transport)
+        asyncio.run(client.monitors.get("123456"))
+        assert transport.requests[0][2]["Authorization"] == "Bearer fake"
+
+    def test_get_monitor_200(self) -> None:
+        """
+        Test get single monitor.
+        """
+        transport = FakeTransport(
+            {("GET", f"{API}/monitors/123456"): (200, {"data": {"id": "123456", "type": "monitor"}})}
+        )
+        client = betteruptime.AsyncClient(bearer_token="fake", transport=transport)
+        monitor = asyncio.run(client.monitors("123456").get())
+        assert isinstance(monitor, dict)
+        assert monitor["data"]["id"] == "123456"
+
+    def test_get_monitor_404(self) -> None:
+        """
+        Test get single monitor but not found.
+        """
+        client = betteruptime.AsyncClient(bearer_token="fake", transport=FakeTransport({}))
+        with pytest.raises(ApiError) as excinfo:
+            asyncio.run(client.monitors.get("123456"))
+        assert 404 == excinfo.value.status_code
+        assert "Not found" == excinfo.value.errors
+
+    def test_http_error_500(self) -> None:
+        """
+        Test that an unknown HTTP error raises an HTTPError.
+        """
+        transport = FakeTransport({("GET", f"{API}/heartbeats?page=1"): (500, None)})
+        client = betteruptime.AsyncClient(bearer_token="fake", transport=transport)
+        with pytest.raises(HTTPError):
+            asyncio.run(client.heartbeats.list())
+
+    def test_list_iter_pages(self) -> None:
+        """
+        Test list_iter follows the pagination.
+        """
+        transport = FakeTransport(
+            {
+                ("GET", f"{API}/heartbeats?page=1"): (
+                    200,
+                    {"data": [{"id": "1"}], "pagination": {"next": f"{API}/heartbeats?page=2"}},
+                ),
+                ("GET", f"{API}/heartbeats?page=2"): (200, {"data": [{"id": "2"}], "pagination": {"next": None}}),
+            }
+        )
+        client = betteruptime.AsyncClient(bearer_token="fake", transport=transport)
+
+        async def collect() -> List[Any]:
+            return [heartbeat async for heartbeat in client.heartbeats.list_iter()]
+
+        assert [heartbeat["id"] for heartbeat in asyncio.run(collect())] == ["1", "2"]
+
+    def test_status_page_report_status_updates_path(self) -> None:
+        """
+        Test the nested sub-resources build the same paths as the sync client.
+        """
+        url = f"{API}/status-pages/1/status-reports/2/status-updates"
+        transport = FakeTransport({("POST", url): (201, {"data": {"id": "3"}})})
+        client = betteruptime.AsyncClient(bearer_token="fake", transport=transport)
+        update = asyncio.run(client.status_pages("1").reports("2").status_updates.create({"message": "Fixed"}))
+        assert isinstance(update, dict)
+        assert update["data"]["id"] == "3"
+        assert transport.requests[0][3] == {"message": "Fixed"}
+
+    def test_max_concurrency(self) -> None:
+        """
+        Test that no more than `max_concurrency` requests are in flight.
+        """
+        responses = {("DELETE", f"{API}/monitors/{i}"): (204, None) for i in range(20)}
+        transport = FakeTransport(responses)
+        client = betteruptime.AsyncClient(bearer_token="fake", transport=transport, max_concurrency=5)
+
+        async def delete_all() -> List[Any]:
+            return await asyncio.gather(*(client.monitors.delete(str(i)) for i in range(20)))
+
+        assert asyncio.run(delete_all()) == [None] * 20
+        assert transport.max_in_flight == 5
+
+    def test_rate_limiter_retries_429(self) -> None:
+        """
+        Test the rate limiter retries a 429 response without blocking the event loop.
+        """
+
+        class ThrottlingTransport(FakeTransport):
+            async def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> AsyncResponse:
+                response = await super().request(method, url, *args, **kwargs)
+                if len(self.requests) == 1:
+                    return AsyncResponse(429, "Too Many Requests", {"Retry-After": "0.05"}, b"", url)
+                return response
+
+        transport = ThrottlingTransport({("GET", f"{API}/monitors/1"): (200, {"data": {"id": "1"}})})
+        limiter = betteruptime.RateLimiter()
+        client = betteruptime.AsyncClient(bearer_token="fake", transport=transport, rate_limiter=limiter)
+        assert asyncio.run(client.monitors.get("1")) == {"data": {"id": "1"}}
+        assert len(transport.requests) == 2
+        assert limiter.stats.retries == 1
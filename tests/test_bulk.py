@@ -0,0 +1,100 @@
+"""
+Bulk operations tests
+"""
+import asyncio
+import threading
+from typing import Any
+
+import requests
+from pytest_mock import MockerFixture
+
+import betteruptime
+from betteruptime.api.exceptions import ApiError
+from tests.helpers import API, FakeTransport, fake_response
+
+
+def _fake_api(method: str, url: str, json: Any = None, **kwargs: Any) -> requests.Response:
+    """
+    Fake monitors API: creation fails without url, monitor 404 does not exist.
+    """
+    if method == "POST":
+        if not json.get("url"):
+            return fake_response(422, {"errors": "Url can't be blank"})
+        return fake_response(201, {"data": {"id": json["url"], "type": "monitor"}})
+    if url.endswith("/404"):
+        return fake_response(404, {"errors": "Not found"})
+    if method == "PATCH":
+        return fake_response(200, {"data": {"id": url.rsplit("/", 1)[-1], "attributes": json}})
+    return fake_response(204)
+
+
+class _ConcurrentAPI:
+    """
+    `_fake_api` answering only once `parties` requests are in flight, counting them.
+    """
+
+    def __init__(self, parties: int) -> None:
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self, method: str, url: str, json: Any = None, **kwargs: Any) -> requests.Response:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            self.barrier.wait()
+            return _fake_api(method, url, json, **kwargs)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestBulk:
+    """
+    Bulk operations tests
+    """
+
+    def test_create_many(self, client: betteruptime.Client, mocker: MockerFixture) -> None:
+        """
+        Test errors are returned side by side with successes, in payloads order.
+        """
+        api = _ConcurrentAPI(parties=8)
+        mocker.patch.object(requests.Session, "request", side_effect=api)
+        payloads = [{"url": f"https://{i}.my.company"} for i in range(16)]
+        payloads[3] = {"url": ""}
+
+        results = client.monitors.create_many(payloads, max_workers=8)
+
+        assert [result.key for result in results] == list(range(16))
+        assert [result.ok for result in results].count(False) == 1
+        assert isinstance(results[3].error, ApiError)
+        assert results[3].error.status_code == 422
+        assert isinstance(results[0].result, dict)
+        assert results[0].result["data"]["id"] == "https://0.my.company"
+        # The barrier breaks unless the 8 workers send at the same time
+        assert api.max_in_flight == 8
+
+    def test_update_and_delete_many(self, client: betteruptime.Client, mocker: MockerFixture) -> None:
+        """
+        Test updates and deletions are keyed by resource id.
+        """
+        mocker.patch.object(requests.Session, "request", side_effect=_fake_api)
+        updates = client.monitors.update_many({"1": {"paused": True}, "404": {"paused": True}})
+        assert [(result.key, result.ok) for result in updates] == [("1", True), ("404", False)]
+        deletions = client.status_pages("1").reports.delete_many(["2", "404", "3"])
+        assert [(result.key, result.ok) for result in deletions] == [("2", True), ("404", False), ("3", True)]
+        assert deletions[0].result is None
+
+    def test_async_create_many(self) -> None:
+        """
+        Test async bulk creation collects API errors per item.
+        """
+        transport = FakeTransport({("POST", f"{API}/heartbeats"): (201, {"data": {"id": "1"}})})
+        client = betteruptime.AsyncClient(bearer_token="fake", transport=transport)
+        results = asyncio.run(client.heartbeats.create_many([{"name": str(i)} for i in range(10)], max_concurrency=3))
+        assert all(result.ok for result in results)
+        assert transport.max_in_flight == 3
+        deletions = asyncio.run(client.heartbeats.delete_many(["1", "2"]))
+        assert all(isinstance(result.error, ApiError) for result in deletions)
@@ -0,0 +1,98 @@
+"""
+Response cache tests
+"""
+from typing import Any, Dict, List
+
+import requests
+from pytest_mock import MockerFixture
+from yarl import URL
+
+import betteruptime
+from betteruptime.api.cache import ResponseCache
+from tests.helpers import fake_response
+
+API = "https://betteruptime.com/api/v2"
+
+
+class TestResponseCache:
+    """
+    Conditional GET response cache tests
+    """
+
+    def _mock(self, mocker: MockerFixture, etag: str = '"v1"') -> List[Dict[str, Any]]:
+        sent: List[Dict[str, Any]] = []
+
+        def request(method: str, url: str, **kwargs: Any) -> requests.Response:
+            sent.append({"method": method, "url": url, **kwargs})
+            if method == "GET" and (kwargs.get("headers") or {}).get("If-None-Match") == etag:
+                return fake_response(304, headers={"ETag": etag})
+            return fake_response(200, content=b'{"data": {"id": "1"}}', headers={"ETag": etag})
+
+        mocker.patch.object(requests.Session, "request", side_effect=request)
+        return sent
+
+    def test_not_modified_served_from_cache(self, mocker: MockerFixture) -> None:
+        """
+        Test that a 304 answer returns the cached payload, a copy per caller.
+        """
+        sent = self._mock(mocker)
+        cache = ResponseCache()
+        client = betteruptime.Client(bearer_token="fake", response_cache=cache)
+        first = client.monitors.get("1")
+        second = client.monitors.get("1")
+        assert first == second == {"data": {"id": "1"}}
+        assert isinstance(first, dict)
+        first["data"]["id"] = "changed"
+        assert client.monitors.get("1") == {"data": {"id": "1"}}
+        assert sent[0]["headers"] is None
+        assert sent[1]["headers"] == {"If-None-Match": '"v1"'}
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.size) == (2, 1, 1)
+
+    def test_only_get_is_cached(self, mocker: MockerFixture) -> None:
+        """
+        Test that write requests neither use nor fill the cache.
+        """
+        sent = self._mock(mocker)
+        cache = ResponseCache()
+        client = betteruptime.Client(bearer_token="fake", response_cache=cache)
+        client.monitors.update({"paused": True}, "1")
+        client.monitors.update({"paused": True}, "1")
+        assert all(request["headers"] is None for request in sent)
+        assert len(cache) == 0
+
+    def test_bypass(self, mocker: MockerFixture) -> None:
+        """
+        Test the per call and the context manager bypasses.
+        """
+        sent = self._mock(mocker)
+        cache = ResponseCache()
+        client = betteruptime.Client(bearer_token="fake", response_cache=cache)
+        client.monitors.get("1")
+        client.http_client.get(URL("monitors/1"), cache=False)
+        with client.http_client.bypass_cache():
+            client.monitors.get("1")
+        assert [request["headers"] for request in sent] == [None, None, None]
+        assert cache.stats.bypassed == 2
+
+    def test_lru_eviction(self) -> None:
+        """
+        Test that the least recently used entry is evicted first.
+        """
+        cache = ResponseCache(maxsize=2)
+        for path in ("a", "b"):
+            cache.store(cache.key("GET", f"{API}/{path}"), fake_response(200, headers={"ETag": path}))
+        assert cache.get(cache.key("GET", f"{API}/a")) is not None
+        cache.store(cache.key("GET", f"{API}/c"), fake_response(200, headers={"ETag": "c"}))
+        assert cache.get(cache.key("GET", f"{API}/b")) is None
+        assert cache.get(cache.key("GET", f"{API}/a")) is not None
+        assert cache.stats.evictions == 1
+
+    def test_responses_without_validators_are_not_stored(self) -> None:
+        """
+        Test that responses which cannot be revalidated are not kept.
+        """
+        cache = ResponseCache()
+        cache.store(cache.key("GET", f"{API}/a"), fake_response(200))
+        cache.store(cache.key("GET", f"{API}/b"), fake_response(404, headers={"ETag": "b"}))
+        assert len(cache) == 0
+        assert cache.stats.misses == 2
@@ -0,0 +1,139 @@
+"""
+Request coalescing tests
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Callable, List
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+import betteruptime
+from betteruptime.api.coalesce import RequestCoalescer
+from betteruptime.api.exceptions import ClientError
+from tests.helpers import FakeTransport, fake_response
+
+
+def _slow_response(*args: Any, **kwargs: Any) -> requests.Response:
+    time.sleep(0.05)
+    return fake_response(200, {"data": {"id": "1"}})
+
+
+def _concurrently(function: Callable[[], Any], threads: int = 8) -> List[Any]:
+    barrier = threading.Barrier(threads)
+    results: List[Any] = [None] * threads
+
+    def run(index: int) -> None:
+        barrier.wait()
+        try:
+            results[index] = function()
+        except Exception as exc:
+            results[index] = exc
+
+    workers = [threading.Thread(target=run, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return results
+
+
+class TestRequestCoalescer:
+    """
+    Single-flight GET requests tests
+    """
+
+    def test_identical_gets_share_one_request(self, mocker: MockerFixture) -> None:
+        """
+        Test concurrent identical GETs send a single request and all get its result.
+        """
+        coalescer = RequestCoalescer()
+        client = betteruptime.Client(bearer_token="fake", coalescer=coalescer)
+        send = mocker.patch.object(requests.Session, "request", side_effect=_slow_response)
+        results = _concurrently(lambda: client.monitors.get("1"))
+        assert send.call_count == 1
+        assert all(result == {"data": {"id": "1"}} for result in results)
+        # Every caller gets its own payload
+        assert len({id(result) for result in results}) == len(results)
+        stats = coalescer.stats
+        assert (stats.requests, stats.coalesced, stats.in_flight) == (8, 7, 0)
+        assert stats.dedup_ratio == pytest.approx(7 / 8)
+
+        # Done requests are not reused
+        client.monitors.get("1")
+        assert send.call_count == 2
+
+    def test_different_requests_are_not_shared(self, mocker: MockerFixture) -> None:
+        """
+        Test GETs with different query strings and non GET requests are all sent.
+        """
+        client = betteruptime.Client(bearer_token="fake", coalescer=RequestCoalescer())
+        send = mocker.patch.object(requests.Session, "request", side_effect=_slow_response)
+        pages = iter(range(4))
+        lock = threading.Lock()
+
+        def list_page() -> Any:
+            with lock:
+                page = next(pages)
+            return client.monitors.list(page=page)
+
+        _concurrently(list_page, threads=4)
+        _concurrently(lambda: client.monitors.update({"paused": True}, "1"), threads=2)
+        assert send.call_count == 6
+
+    def test_errors_are_shared(self, mocker: MockerFixture) -> None:
+        """
+        Test every caller gets the error of the shared request.
+        """
+
+        def refused(*args: Any, **kwargs: Any) -> requests.Response:
+            time.sleep(0.05)
+            raise requests.ConnectionError("Connection refused")
+
+        client = betteruptime.Client(bearer_token="fake", coalescer=RequestCoalescer())
+        send = mocker.patch.object(requests.Session, "request", side_effect=refused)
+        results = _concurrently(lambda: client.monitors.get("1"), threads=4)
+        assert send.call_count == 1
+        assert all(isinstance(result, ClientError) for result in results)
+
+    def test_async_client(self) -> None:
+        """
+        Test concurrent identical GETs of the async client send a single request.
+        """
+        transport = FakeTransport({("GET", "https://betteruptime.com/api/v2/monitors/1"): (200, {"data": {}})})
+        coalescer = RequestCoalescer()
+        client = betteruptime.AsyncClient(bearer_token="fake", transport=transport, coalescer=coalescer)
+
+        async def fetch() -> List[Any]:
+            return list(await asyncio.gather(*(client.monitors.get("1") for _ in range(5))))
+
+        assert asyncio.run(fetch()) == [{"data": {}}] * 5
+        assert len(transport.requests) == 1
+        assert coalescer.stats.coalesced == 4
+
+    def test_cancelled_leader(self) -> None:
+        """
+        Test the followers of a cancelled async call send it again instead of being cancelled.
+        """
+        coalescer = RequestCoalescer()
+        key = coalescer.key("GET", "https://betteruptime.com/api/v2/monitors/1", None, None)
+        sent: List[int] = []
+
+        async def send() -> str:
+            sent.append(len(sent))
+            await asyncio.sleep(0.05)
+            return "monitor"
+
+        async def fetch() -> List[Any]:
+            leader = asyncio.ensure_future(asyncio.wait_for(coalescer.do_async(key, send), timeout=0.01))
+            await asyncio.sleep(0)
+            followers = [coalescer.do_async(key, send) for _ in range(3)]
+            return list(await asyncio.gather(leader, *followers, return_exceptions=True))
+
+        results = asyncio.run(fetch())
+        assert isinstance(results[0], asyncio.TimeoutError)
+        assert results[1:] == ["monitor"] * 3
+        assert len(sent) == 2
+        assert coalescer.stats.coalesced == 2
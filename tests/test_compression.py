@@ -0,0 +1,119 @@
+"""
+Request and response compression tests
+"""
+import asyncio
+import gzip
+import json
+from typing import Any
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+import betteruptime
+from betteruptime.api.async_http_client import AsyncTransport, HttpxAsyncTransport, ThreadedAsyncTransport
+from betteruptime.util.compression import ACCEPT_ENCODING
+from tests.helpers import API, EMPTY_PAGE, FakeTransport, fake_response
+from tests.stub_server import StubAPI
+
+
+class TestCompression:
+    """
+    Compression negotiation and wire bytes measurement tests
+    """
+
+    def test_accept_encoding(self) -> None:
+        """
+        Test the client advertises the content codings it decodes.
+        """
+        client = betteruptime.Client(bearer_token="fake")
+        assert client.http_client.session.headers["Accept-Encoding"] == ACCEPT_ENCODING
+        assert "gzip" in ACCEPT_ENCODING
+
+    def test_async_accept_encoding(self) -> None:
+        """
+        Test the async client advertises the content codings its transport decodes.
+        """
+        transport = FakeTransport({("GET", f"{API}/monitors/1"): (200, {"data": {}})})
+        asyncio.run(betteruptime.AsyncClient(bearer_token="fake", transport=transport).monitors.get("1"))
+        assert transport.requests[0][2]["Accept-Encoding"] == ACCEPT_ENCODING
+        pytest.importorskip("httpx")
+        assert "gzip" in HttpxAsyncTransport().accept_encoding
+
+    def test_request_bodies_are_gzipped(self, mocker: MockerFixture) -> None:
+        """
+        Test only the JSON bodies reaching the threshold are gzipped.
+        """
+        request = mocker.patch.object(requests.Session, "request", return_value=fake_response(201, EMPTY_PAGE))
+        client = betteruptime.Client(bearer_token="fake", compress_requests=1024)
+
+        client.monitors.create({"url": "https://example.com"})
+        kwargs = request.call_args.kwargs
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+        assert json.loads(kwargs["data"]) == {"url": "https://example.com"}
+
+        payload = {"url": "https://example.com", "request_headers": [{"name": "X-Test", "value": "a" * 2048}]}
+        client.monitors.create(payload)
+        kwargs = request.call_args.kwargs
+        assert kwargs["headers"] == {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        assert kwargs["json"] is None
+        assert json.loads(gzip.decompress(kwargs["data"])) == payload
+
+    @pytest.mark.parametrize("transport", ["requests", "httpx"])
+    def test_wire_bytes(self, transport: str) -> None:
+        """
+        Test the metrics count the bytes on the wire next to the decoded bytes, against the local stub API.
+        """
+        http_transport: Any = None
+        if transport == "httpx":
+            pytest.importorskip("httpx")
+            from betteruptime.api.httpx_transport import HttpxTransport
+
+            http_transport = HttpxTransport(http2=False)
+        metrics = betteruptime.MetricsCollector()
+        with StubAPI(monitors=100, per_page=100, compress=True) as stub, betteruptime.Client(
+            bearer_token="fake", api_url=stub.url, hooks=[metrics], transport=http_transport, compress_requests=256
+        ) as client:
+            listed = client.monitors.list()
+            assert isinstance(listed, dict)
+            assert len(listed["data"]) == 100
+            created = client.monitors.create({"url": "https://example.com", "pronounceable_name": "a" * 1024})
+            assert isinstance(created, dict)
+            assert created["data"]["attributes"]["pronounceable_name"] == "a" * 1024
+
+        listing, creation = sorted(metrics.endpoints(), key=lambda endpoint: endpoint.method)
+        assert listing.response_wire_bytes < listing.response_bytes
+        assert listing.compression_ratio > 2
+        assert creation.request_bytes > 1024 > creation.request_wire_bytes
+        labels = '{method="GET",endpoint="monitors"}'
+        assert f"betteruptime_client_response_wire_bytes_total{labels} {listing.response_wire_bytes}" in (
+            metrics.to_prometheus()
+        )
+
+    @pytest.mark.parametrize("transport", ["threaded", "httpx"])
+    def test_async_wire_bytes(self, transport: str) -> None:
+        """
+        Test the async client negotiates compressed responses and measures their wire bytes.
+        """
+        async_transport: AsyncTransport
+        if transport == "httpx":
+            pytest.importorskip("httpx")
+            async_transport = HttpxAsyncTransport()
+        else:
+            async_transport = ThreadedAsyncTransport()
+        metrics = betteruptime.MetricsCollector()
+
+        async def run(url: str) -> None:
+            async with betteruptime.AsyncClient(
+                bearer_token="fake", api_url=url, transport=async_transport, hooks=[metrics]
+            ) as client:
+                listed = await client.monitors.list()
+                assert isinstance(listed, dict)
+                assert len(listed["data"]) == 100
+
+        with StubAPI(monitors=100, per_page=100, compress=True) as stub:
+            asyncio.run(run(stub.url))
+
+        (listing,) = metrics.endpoints()
+        assert listing.response_wire_bytes < listing.response_bytes
+        assert listing.compression_ratio > 2
@@ -0,0 +1,77 @@
+"""
+JSON decoders tests
+"""
+from typing import Any, List
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+import betteruptime
+from betteruptime.api.exceptions import ApiError
+from betteruptime.util.decoders import DECODERS, Decoder, get_decoder, stdlib_decoder
+from betteruptime.util.errors import parse_error_response
+from tests.helpers import fake_response
+
+
+class TestDecoders:
+    """
+    Pluggable JSON decoders tests
+    """
+
+    @pytest.mark.parametrize("name", sorted(DECODERS))
+    def test_decoders_agree(self, name: str) -> None:
+        """
+        Test that every installed decoder decodes like the standard library.
+        """
+        content = '{"data": [{"id": "1", "name": "café", "paused": false, "ratio": 0.5}], "n": null}'.encode()
+        assert DECODERS[name](content) == stdlib_decoder(content)
+
+    @pytest.mark.parametrize("name", sorted(DECODERS))
+    def test_decoders_raise_value_error(self, name: str) -> None:
+        """
+        Test that every installed decoder raises a ValueError on invalid JSON.
+        """
+        with pytest.raises(ValueError):
+            DECODERS[name](b"<html>Bad gateway</html>")
+
+    def test_get_decoder(self) -> None:
+        """
+        Test the decoder setting resolution.
+        """
+        assert get_decoder("json") is stdlib_decoder
+        assert get_decoder(None) is get_decoder("auto")
+        if "orjson" in DECODERS:
+            assert get_decoder() is DECODERS["orjson"]
+        with pytest.raises(ValueError):
+            get_decoder("simplejson")
+
+    def test_client_decoder(self, mocker: MockerFixture) -> None:
+        """
+        Test that a custom decoder decodes resources payloads and error responses.
+        """
+        decoded: List[bytes] = []
+
+        def decoder(content: bytes) -> Any:
+            decoded.append(content)
+            return stdlib_decoder(content)
+
+        responses = [
+            fake_response(200, content=b'{"data": {"id": "1"}}'),
+            fake_response(404, content=b'{"errors": "Resource type monitor with id = 2 was not found"}'),
+        ]
+        mocker.patch.object(requests.Session, "request", side_effect=responses)
+        client = betteruptime.Client(bearer_token="fake", decoder=decoder)
+        assert client.monitors.get("1") == {"data": {"id": "1"}}
+        with pytest.raises(ApiError) as excinfo:
+            client.monitors.get("2")
+        assert excinfo.value.errors == "Resource type monitor with id = 2 was not found"
+        assert len(decoded) == 2
+
+    def test_parse_error_response_invalid_body(self) -> None:
+        """
+        Test that non JSON error bodies give no errors, whatever the decoder.
+        """
+        decoder: Decoder
+        for decoder in DECODERS.values():
+            assert parse_error_response(fake_response(502, content=b"Bad gateway"), decoder) is None
@@ -0,0 +1,96 @@
+"""
+Heartbeat pings sender tests
+"""
+import json
+import pathlib
+from typing import Any, List
+
+import requests
+from pytest_mock import MockerFixture
+
+import betteruptime
+from betteruptime.resources.heartbeat_sender import HeartbeatSender
+from tests.helpers import fake_response
+
+HEARTBEAT_URL = "https://betteruptime.com/api/v1/heartbeat/abc123"
+
+
+class TestHeartbeatSender:
+    """
+    Background heartbeat pings tests
+    """
+
+    def test_pings_are_coalesced(self, mocker: MockerFixture) -> None:
+        """
+        Test identical pings within the window are sent once, and failures are separate pings.
+        """
+        send = mocker.patch.object(requests.Session, "request", return_value=fake_response(200, content=b"OK"))
+        with betteruptime.HeartbeatSender(coalesce_window=60) as sender:
+            for _ in range(1000):
+                assert sender.ping(HEARTBEAT_URL)
+            sender.ping(HEARTBEAT_URL, failure=True)
+            sender.ping(HEARTBEAT_URL, exit_code=2)
+            assert sender.flush(timeout=5)
+            stats = sender.stats
+        assert sorted(call.args[1] for call in send.call_args_list) == [
+            HEARTBEAT_URL,
+            f"{HEARTBEAT_URL}/2",
+            f"{HEARTBEAT_URL}/fail",
+        ]
+        assert (stats.queued, stats.sent, stats.coalesced, stats.queue_depth) == (3, 3, 999, 0)
+        assert not sender.ping(HEARTBEAT_URL)
+
+    def test_unreachable_api_is_spooled(self, mocker: MockerFixture, tmp_path: pathlib.Path) -> None:
+        """
+        Test pings are spooled while the API is unreachable, and not replayed over a later ping.
+        """
+        spool = tmp_path / "heartbeats.ndjson"
+        outcomes: List[Any] = [requests.ConnectionError("unreachable"), fake_response(502, content=b"OK")]
+        send = mocker.patch.object(requests.Session, "request", side_effect=outcomes)
+        sender = HeartbeatSender(workers=1, coalesce_window=0, spool_path=str(spool), replay_interval=0)
+        sender.ping(HEARTBEAT_URL)
+        sender.ping(HEARTBEAT_URL)
+        assert sender.flush(timeout=5)
+        assert [json.loads(line)["url"] for line in spool.read_text().splitlines()] == [HEARTBEAT_URL] * 2
+        assert sender.stats.spooled == 2
+
+        send.side_effect = None
+        send.return_value = fake_response(200, content=b"OK")
+        sender.ping(f"{HEARTBEAT_URL}/fail")
+        sender.close(timeout=5)
+        assert [call.args[1] for call in send.call_args_list[2:]] == [f"{HEARTBEAT_URL}/fail"]
+        assert not spool.exists()
+        stats = sender.stats
+        assert (stats.sent, stats.replayed, stats.superseded) == (1, 0, 1)
+
+    def test_spool_is_replayed_in_order(self, mocker: MockerFixture, tmp_path: pathlib.Path) -> None:
+        """
+        Test the spool of a previous process is replayed oldest first, latest ping per heartbeat.
+        """
+        other_url = "https://betteruptime.com/api/v1/heartbeat/other"
+        spool = tmp_path / "heartbeats.ndjson"
+        spooled = [
+            (f"{HEARTBEAT_URL}/fail", 100.0),
+            (other_url, 300.0),
+            (HEARTBEAT_URL, 200.0),
+            (f"{HEARTBEAT_URL}/1", 150.0),
+        ]
+        spool.write_text("".join(json.dumps({"url": url, "at": at}) + "\n" for url, at in spooled))
+        send = mocker.patch.object(requests.Session, "request", return_value=fake_response(200, content=b"OK"))
+        sender = HeartbeatSender(workers=1, coalesce_window=0, spool_path=str(spool), replay_interval=0)
+        sender.ping(f"{other_url}/fail")
+        sender.close(timeout=5)
+        assert [call.args[1] for call in send.call_args_list] == [f"{other_url}/fail", HEARTBEAT_URL]
+        assert not spool.exists()
+        stats = sender.stats
+        assert (stats.sent, stats.replayed, stats.superseded) == (2, 1, 1)
+
+    def test_refused_pings_are_not_retried(self, mocker: MockerFixture, tmp_path: pathlib.Path) -> None:
+        """
+        Test pings of unknown heartbeats are counted as failed, not spooled.
+        """
+        mocker.patch.object(requests.Session, "request", return_value=fake_response(404, content=b"OK"))
+        with HeartbeatSender(spool_path=str(tmp_path / "heartbeats.ndjson")) as sender:
+            sender.ping(HEARTBEAT_URL)
+        assert (sender.stats.failed, sender.stats.spooled) == (1, 0)
+        assert not (tmp_path / "heartbeats.ndjson").exists()
@@ -0,0 +1,68 @@
+"""
+HTTP Client tests
+"""
+import threading
+from typing import List
+
+import requests
+
+import betteruptime
+from betteruptime.api.http_client import HTTPClient
+
+
+class TestHTTPClient:
+    """
+    BetterUptime HTTP Client tests
+    """
+
+    def test_clients_do_not_share_headers(self) -> None:
+        """
+        Test that each client keeps its own bearer token and session.
+        """
+        first = betteruptime.Client(bearer_token="first")
+        second = betteruptime.Client(bearer_token="second")
+        assert first.http_client._headers["Authorization"] == "Bearer first"
+        assert second.http_client._headers["Authorization"] == "Bearer second"
+        assert first.http_client.session is not second.http_client.session
+        assert first.http_client.session.headers["Authorization"] == "Bearer first"
+        assert second.http_client.session.headers["Authorization"] == "Bearer second"
+
+    def test_pool_settings(self) -> None:
+        """
+        Test that the connection pool settings are applied to both http and https adapters.
+        """
+        client = betteruptime.Client(bearer_token="fake", pool_maxsize=50, pool_block=True)
+        for prefix in ("https://", "http://"):
+            adapter = client.http_client.session.get_adapter(prefix)
+            assert isinstance(adapter, requests.adapters.HTTPAdapter)
+            assert adapter.poolmanager.connection_pool_kw["maxsize"] == 50
+            assert adapter.poolmanager.connection_pool_kw["block"] is True
+
+    def test_keep_alive_disabled(self) -> None:
+        """
+        Test that disabling keep-alive asks the server to close connections.
+        """
+        http_client = HTTPClient(bearer_token="fake", keep_alive=False)
+        assert http_client.session.headers["Connection"] == "close"
+
+    def test_session_created_once(self) -> None:
+        """
+        Test that concurrent first requests share a single session.
+        """
+        http_client = HTTPClient(bearer_token="fake")
+        sessions: List[requests.Session] = []
+        threads = [threading.Thread(target=lambda: sessions.append(http_client.session)) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(session) for session in sessions}) == 1
+
+    def test_close(self) -> None:
+        """
+        Test that closing the client drops its session.
+        """
+        with betteruptime.Client(bearer_token="fake") as client:
+            session = client.http_client.session
+        assert client.http_client._session is None
+        assert client.http_client.session is not session
@@ -0,0 +1,208 @@
+"""
+Request instrumentation tests
+"""
+import asyncio
+from typing import Any, List
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+import betteruptime
+from betteruptime.api.exceptions import HTTPError
+from betteruptime.api.instrumentation import MetricsCollector, RequestEvent, RequestHook, endpoint_template
+from betteruptime.api.rate_limit import RateLimiter
+from tests.helpers import API, FakeTransport, fake_response
+
+
+class RecordingHook(RequestHook):
+    """
+    Hook keeping the name of every call along its event.
+    """
+
+    def __init__(self) -> None:
+        self.calls: List[Any] = []
+
+    def before_send(self, event: RequestEvent) -> None:
+        self.calls.append(("before_send", event.endpoint, event.status_code))
+
+    def after_response(self, event: RequestEvent) -> None:
+        self.calls.append(("after_response", event.endpoint, event.status_code))
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.calls.append(("on_error", event.endpoint, event.status_code))
+
+
+class TestInstrumentation:
+    """
+    Request hooks and metrics tests
+    """
+
+    def test_endpoint_template(self) -> None:
+        """
+        Test resource ids are replaced in the endpoint labels.
+        """
+        assert endpoint_template("monitors") == "monitors"
+        assert endpoint_template("/monitors/123456") == "monitors/{id}"
+        assert endpoint_template("status-pages/1/status-reports/2/status-updates") == (
+            "status-pages/{id}/status-reports/{id}/status-updates"
+        )
+
+    def test_hooks_called(self, mocker: MockerFixture) -> None:
+        """
+        Test the hooks see the templated endpoint and the final response.
+        """
+        hook = RecordingHook()
+        client = betteruptime.Client(bearer_token="fake", hooks=[hook])
+        mocker.patch.object(
+            requests.Session, "request", return_value=fake_response(200, content=b'{"data": {}}', headers={})
+        )
+        client.monitors.get("123456")
+        assert hook.calls == [("before_send", "monitors/{id}", None), ("after_response", "monitors/{id}", 200)]
+
+    def test_metrics(self, mocker: MockerFixture) -> None:
+        """
+        Test the collector counts requests, retries, bytes and errors per endpoint.
+        """
+        metrics = MetricsCollector()
+        client = betteruptime.Client(bearer_token="fake", hooks=[metrics], rate_limiter=RateLimiter(max_retries=1))
+        responses = [
+            fake_response(429, headers={"Retry-After": "0"}),
+            fake_response(200, content=b'{"data": []}', headers={}),
+            fake_response(500),
+        ]
+        mocker.patch.object(requests.Session, "request", side_effect=responses)
+        client.monitors.list()
+        with pytest.raises(HTTPError):
+            client.monitors.get("1")
+
+        stats = {(endpoint.method, endpoint.endpoint): endpoint for endpoint in metrics.endpoints()}
+        listing, item = stats[("GET", "monitors")], stats[("GET", "monitors/{id}")]
+        assert (listing.requests, listing.errors, listing.retries, listing.response_bytes) == (1, 0, 1, 12)
+        assert (item.requests, item.errors) == (1, 1)
+        assert metrics.in_flight == 0
+
+        text = metrics.to_prometheus()
+        assert 'betteruptime_client_requests_total{method="GET",endpoint="monitors",status="200"} 1' in text
+        assert 'betteruptime_client_requests_total{method="GET",endpoint="monitors/{id}",status="500"} 1' in text
+        assert (
+            'betteruptime_client_request_duration_seconds_bucket{method="GET",endpoint="monitors",le="+Inf"} 1' in text
+        )
+        assert 'betteruptime_client_retries_total{method="GET",endpoint="monitors"} 1' in text
+        assert "betteruptime_client_requests_in_flight 0" in text
+
+        metrics.reset()
+        assert metrics.endpoints() == []
+
+    def test_connection_error(self, mocker: MockerFixture) -> None:
+        """
+        Test connection errors are reported without a status code.
+        """
+        hook = RecordingHook()
+        client = betteruptime.Client(bearer_token="fake", hooks=[hook])
+        mocker.patch.object(requests.Session, "request", side_effect=requests.ConnectionError("refused"))
+        with pytest.raises(betteruptime.api.exceptions.ClientError):
+            client.heartbeats.list()
+        assert hook.calls[-1] == ("on_error", "heartbeats", None)
+
+    def test_unmapped_error(self, mocker: MockerFixture) -> None:
+        """
+        Test requests failing with an error the client does not map still end with `on_error`.
+        """
+        hook = RecordingHook()
+        metrics = MetricsCollector()
+        client = betteruptime.Client(bearer_token="fake", hooks=[hook, metrics])
+        mocker.patch.object(requests.Session, "request", side_effect=requests.TooManyRedirects("loop"))
+        with pytest.raises(requests.TooManyRedirects):
+            client.heartbeats.list()
+        assert hook.calls == [("before_send", "heartbeats", None), ("on_error", "heartbeats", None)]
+        assert metrics.in_flight == 0
+        assert metrics.endpoints()[0].errors == 1
+
+    def test_async_cancelled(self) -> None:
+        """
+        Test cancelled async requests end with `on_error`.
+        """
+        hook = RecordingHook()
+        metrics = MetricsCollector()
+        transport = FakeTransport({})
+
+        async def hang(*args: Any, **kwargs: Any) -> Any:
+            await asyncio.sleep(10)
+
+        transport.request = hang  # type: ignore[method-assign]
+
+        async def run() -> None:
+            async with betteruptime.AsyncClient(
+                bearer_token="fake", transport=transport, hooks=[hook, metrics]
+            ) as client:
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(client.monitors.get("1"), 0.01)
+
+        asyncio.run(run())
+        assert hook.calls == [("before_send", "monitors/{id}", None), ("on_error", "monitors/{id}", None)]
+        assert metrics.in_flight == 0
+
+    def test_failing_hook_ignored(self, mocker: MockerFixture) -> None:
+        """
+        Test an exception raised by a hook does not fail the request.
+        """
+
+        class FailingHook(RequestHook):
+            def after_response(self, event: RequestEvent) -> None:
+                raise RuntimeError("boom")
+
+        client = betteruptime.Client(bearer_token="fake", hooks=[FailingHook()])
+        mocker.patch.object(
+            requests.Session, "request", return_value=fake_response(200, content=b'{"data": []}', headers={})
+        )
+        assert client.monitors.list() == {"data": []}
+
+    def test_async_hooks(self) -> None:
+        """
+        Test the async client calls the hooks too.
+        """
+        hook = RecordingHook()
+        transport = FakeTransport(
+            {("GET", f"{API}/monitors/1"): (200, {"data": {}}), ("GET", f"{API}/monitors/2"): (500, None)}
+        )
+
+        async def run() -> None:
+            async with betteruptime.AsyncClient(bearer_token="fake", transport=transport, hooks=[hook]) as client:
+                await client.monitors.get("1")
+                with pytest.raises(HTTPError):
+                    await client.monitors.get("2")
+
+        asyncio.run(run())
+        assert hook.calls == [
+            ("before_send", "monitors/{id}", None),
+            ("after_response", "monitors/{id}", 200),
+            ("before_send", "monitors/{id}", None),
+            ("on_error", "monitors/{id}", 500),
+        ]
+
+    def test_opentelemetry(self, mocker: MockerFixture) -> None:
+        """
+        Test the OpenTelemetry hook records the request duration histogram.
+        """
+        sdk_metrics = pytest.importorskip("opentelemetry.sdk.metrics")
+        export = pytest.importorskip("opentelemetry.sdk.metrics.export")
+        reader = export.InMemoryMetricReader()
+        hook = betteruptime.OpenTelemetryHook(meter_provider=sdk_metrics.MeterProvider(metric_readers=[reader]))
+        client = betteruptime.Client(bearer_token="fake", hooks=[hook])
+        mocker.patch.object(
+            requests.Session, "request", return_value=fake_response(200, content=b'{"data": []}', headers={})
+        )
+        client.monitors.list()
+
+        data = reader.get_metrics_data()
+        metrics = {
+            metric.name: metric
+            for resource_metrics in data.resource_metrics
+            for scope_metrics in resource_metrics.scope_metrics
+            for metric in scope_metrics.metrics
+        }
+        (point,) = metrics["http.client.request.duration"].data.data_points
+        assert point.count == 1
+        assert point.attributes["url.template"] == "monitors"
+        assert point.attributes["http.response.status_code"] == 200
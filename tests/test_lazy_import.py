@@ -0,0 +1,64 @@
+"""
+Lazy import tests
+"""
+import subprocess
+import sys
+
+import pytest
+
+import betteruptime
+from betteruptime.resources.monitors import Monitor
+
+
+class TestLazyImport:
+    """
+    Lazy module attributes and resources tests
+    """
+
+    def test_import_is_cheap(self) -> None:
+        """
+        Test `import betteruptime` neither loads the HTTP stack nor the resources.
+        """
+        code = (
+            "import sys, betteruptime; print(sorted({'requests', 'yarl', 'betteruptime.resources'} & set(sys.modules)))"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True).stdout
+        assert output.strip() == "[]"
+
+    def test_client_is_cheap(self) -> None:
+        """
+        Test building a client does not load the resources until they are accessed.
+        """
+        code = (
+            "import sys, betteruptime; client = betteruptime.Client(bearer_token='fake');"
+            " print('betteruptime.resources.monitors' in sys.modules); client.monitors;"
+            " print('betteruptime.resources.monitors' in sys.modules, 'betteruptime.resources.heartbeats' in sys.modules)"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True).stdout
+        assert output.split() == ["False", "True", "False"]
+
+    def test_lazy_attributes(self) -> None:
+        """
+        Test the public names resolve on first access and unknown names still raise.
+        """
+        assert betteruptime.Client is betteruptime.api.api_client.Client
+        assert betteruptime.resources.Monitor is Monitor
+        assert "Client" in dir(betteruptime)
+        with pytest.raises(AttributeError):
+            getattr(betteruptime, "Unknown")
+        with pytest.raises(AttributeError):
+            getattr(betteruptime.resources, "Unknown")
+
+    def test_resources_built_on_access(self) -> None:
+        """
+        Test the client builds a resource on first access, then reuses it.
+        """
+        client = betteruptime.Client(bearer_token="fake")
+        assert client._resources == {}
+        monitors = client.monitors
+        assert isinstance(monitors, Monitor)
+        assert client.monitors is monitors
+        assert list(client._resources) == ["monitors"]
+        status_page = client.status_pages("1")
+        assert status_page._reports is None
+        assert status_page.reports is status_page.reports
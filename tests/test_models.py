@@ -0,0 +1,96 @@
+"""
+Typed models tests
+"""
+import json
+import sys
+from typing import Any, Dict
+
+import pytest
+
+from betteruptime.models import Heartbeat, Model, Monitor, parse_item
+
+MONITOR: Dict[str, Any] = {
+    "id": "123456",
+    "type": "monitor",
+    "attributes": {
+        "url": "https://www.my.company/",
+        "pronounceable_name": "My company homepage",
+        "monitor_type": "status",
+        "status": "up",
+        "paused": False,
+        "regions": ["us", "eu"],
+        "new_attribute": 42,
+    },
+    "relationships": {"policy": {"data": None}},
+}
+
+
+class TestModels:
+    """
+    Slotted resource models tests
+    """
+
+    def test_from_payload(self) -> None:
+        """
+        Test that attributes are exposed as typed fields.
+        """
+        monitor = Monitor.from_payload({"data": MONITOR})
+        assert monitor.id == "123456"
+        assert monitor.url == "https://www.my.company/"
+        assert monitor.paused is False
+        assert monitor.regions == ["us", "eu"]
+        assert monitor.maintenance_from is None
+        assert monitor.extra == {"new_attribute": 42}
+
+    def test_slotted(self) -> None:
+        """
+        Test that models have no instance dict.
+        """
+        monitor = Monitor.from_item(MONITOR)
+        assert not hasattr(monitor, "__dict__")
+        with pytest.raises(AttributeError):
+            setattr(monitor, "unknown", 1)
+
+    def test_raw_round_trip(self) -> None:
+        """
+        Test that `raw` rebuilds the original item, unknown attributes included and absent ones omitted.
+        """
+        monitor = Monitor.from_item(MONITOR)
+        assert monitor.raw == MONITOR
+        assert Monitor.from_item(monitor.raw) == monitor
+        assert monitor.missing == Monitor._field_set.difference(MONITOR["attributes"])
+
+    def test_raw_keeps_null_attributes(self) -> None:
+        """
+        Test that attributes set to `null` by the API are kept apart from absent ones.
+        """
+        item = dict(MONITOR, attributes=dict(MONITOR["attributes"], maintenance_from=None))
+        monitor = Monitor.from_item(item)
+        assert monitor.maintenance_from is None
+        assert monitor.raw == item
+        assert monitor != Monitor.from_item(MONITOR)
+
+    def test_from_listing(self) -> None:
+        """
+        Test building the models of a list page.
+        """
+        payload = {"data": [dict(MONITOR, id=str(i)) for i in range(3)], "pagination": {"next": None}}
+        assert [monitor.id for monitor in Monitor.from_listing(payload)] == ["0", "1", "2"]
+
+    def test_parse_item(self) -> None:
+        """
+        Test that items are parsed with the model of their type.
+        """
+        assert isinstance(parse_item(MONITOR), Monitor)
+        assert isinstance(parse_item({"id": "1", "type": "heartbeat", "attributes": {}}), Heartbeat)
+        unknown = parse_item({"id": "1", "type": "team", "attributes": {"name": "Ops"}})
+        assert type(unknown) is Model
+        assert unknown.extra == {"name": "Ops"}
+
+    def test_short_strings_interned(self) -> None:
+        """
+        Test that repeated short values share a single string.
+        """
+        first, second = (Monitor.from_item(json.loads(json.dumps(MONITOR))) for _ in range(2))
+        assert first.status is second.status
+        assert first.status is sys.intern("up")
@@ -0,0 +1,121 @@
+"""
+Monitor index tests
+"""
+import time
+from typing import Any, Dict, List
+
+import requests
+from pytest_mock import MockerFixture
+
+import betteruptime
+from tests.helpers import fake_response
+
+API = "https://betteruptime.com/api/v2"
+
+
+def _monitor(resource_id: str, name: str, url: str) -> Dict[str, Any]:
+    return {"id": resource_id, "type": "monitor", "attributes": {"pronounceable_name": name, "url": url}}
+
+
+class FakeMonitorsAPI:
+    """
+    Fake monitors API recording the requests it receives.
+    """
+
+    def __init__(self) -> None:
+        self.monitors = [_monitor(str(i), f"Service {i}", f"https://{i}.my.company") for i in range(1, 6)]
+        self.calls: List[str] = []
+
+    def __call__(self, method: str, url: str, json: Any = None, **kwargs: Any) -> requests.Response:
+        self.calls.append(f"{method} {url}")
+        if method == "GET" and "?page=" in url:
+            return fake_response(200, {"data": self.monitors, "pagination": {"next": None}})
+        if method == "GET" and "?url=" in url:
+            return fake_response(200, {"data": [_monitor("9", "Late", "https://late.my.company")]})
+        if method == "POST":
+            return fake_response(201, {"data": _monitor("6", json["pronounceable_name"], json["url"])})
+        if method == "PATCH":
+            return fake_response(200, {"data": _monitor("1", json["pronounceable_name"], "https://1.my.company")})
+        return fake_response(204)
+
+
+class TestMonitorIndex:
+    """
+    Monitor index tests
+    """
+
+    def test_lookups_served_locally(self, client: betteruptime.Client, mocker: MockerFixture) -> None:
+        """
+        Test get, get_by_name and get_by_url do not hit the API once the index is loaded.
+        """
+        api = FakeMonitorsAPI()
+        mocker.patch.object(requests.Session, "request", side_effect=api)
+        index = client.monitors.enable_index()
+        assert len(index) == 5
+        assert len(api.calls) == 1
+
+        assert client.monitors.get_by_name("Service 2") == {"data": api.monitors[1]}
+        assert client.monitors.get_by_url("https://3.my.company") == {"data": api.monitors[2]}
+        assert client.monitors("4").get() == {"data": api.monitors[3]}
+        assert len(api.calls) == 1
+
+    def test_index_follows_crud(self, client: betteruptime.Client, mocker: MockerFixture) -> None:
+        """
+        Test creations, updates and deletions are reflected in the index.
+        """
+        api = FakeMonitorsAPI()
+        mocker.patch.object(requests.Session, "request", side_effect=api)
+        index = client.monitors.enable_index()
+
+        client.monitors.create({"pronounceable_name": "New", "url": "https://new.my.company"})
+        assert index.get_by_name("New") is not None
+        client.monitors("1").update({"pronounceable_name": "Renamed"})
+        assert index.get_by_name("Service 1") is None
+        assert index.get_by_name("Renamed") is not None
+
+        calls = len(api.calls)
+        client.monitors.delete_by_url("https://2.my.company")
+        assert api.calls[calls:] == [f"DELETE {API}/monitors/2"]
+        assert index.get("2") is None
+        assert index.get_by_url("https://2.my.company") is None
+
+    def test_returned_monitors_are_copies(self, client: betteruptime.Client, mocker: MockerFixture) -> None:
+        """
+        Test modifying a monitor returned by a lookup or a creation leaves the index unchanged.
+        """
+        api = FakeMonitorsAPI()
+        mocker.patch.object(requests.Session, "request", side_effect=api)
+        index = client.monitors.enable_index()
+
+        monitor = client.monitors.get_by_name("Service 1")
+        assert isinstance(monitor, dict)
+        monitor["data"]["attributes"]["url"] = "https://changed.my.company"
+        created = client.monitors.create({"pronounceable_name": "New", "url": "https://new.my.company"})
+        assert isinstance(created, dict)
+        created["data"]["attributes"]["pronounceable_name"] = "Changed"
+
+        assert index.get("1") == api.monitors[0]
+        assert index.get_by_url("https://changed.my.company") is None
+        assert index.get_by_name("New") == _monitor("6", "New", "https://new.my.company")
+
+    def test_miss_and_stale_fall_back_to_api(self, client: betteruptime.Client, mocker: MockerFixture) -> None:
+        """
+        Test unknown keys and a stale index are looked up through the API.
+        """
+        api = FakeMonitorsAPI()
+        mocker.patch.object(requests.Session, "request", side_effect=api)
+        index = client.monitors.enable_index(ttl=0.05)
+
+        monitor = client.monitors.get_by_url("https://late.my.company")
+        assert isinstance(monitor, dict)
+        assert monitor["data"]["id"] == "9"
+        assert api.calls[-1].startswith(f"GET {API}/monitors?url=")
+        assert index.get_by_url("https://late.my.company") is not None
+
+        time.sleep(0.1)
+        assert index.stale
+        assert index.get("1") is None
+        index.refresh()
+        assert not index.stale
+        assert index.get("1") is not None
+        assert len([call for call in api.calls if "?page=" in call]) == 2
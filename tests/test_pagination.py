@@ -0,0 +1,121 @@
+"""
+Pagination helpers tests
+"""
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+from pytest_mock import MockerFixture
+
+import betteruptime
+from betteruptime.api.exceptions import ApiError
+from betteruptime.util.pagination import iter_pages, page_number
+
+API = "https://betteruptime.com/api/v2"
+
+
+class FakePages:
+    """
+    Paginated listing of `count` pages with one item each, records fetched pages.
+    """
+
+    def __init__(self, count: int, delay: float = 0.0) -> None:
+        self.count = count
+        self.delay = delay
+        self.fetched: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, page: int) -> Dict[str, Any]:
+        with self._lock:
+            self.fetched.append(page)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if page == 4 and self.count < 0:
+            raise ApiError(resource="monitors", errors=None, status_code=429)
+        count = abs(self.count)
+        return {
+            "data": [{"id": str(page)}],
+            "pagination": {
+                "first": f"{API}/monitors?page=1",
+                "last": f"{API}/monitors?page={count}",
+                "prev": f"{API}/monitors?page={page - 1}" if page > 1 else None,
+                "next": f"{API}/monitors?page={page + 1}" if page < count else None,
+            },
+        }
+
+
+class TestPagination:
+    """
+    Pagination helpers tests
+    """
+
+    def test_page_number(self) -> None:
+        """
+        Test page number extraction from pagination links.
+        """
+        assert page_number(f"{API}/monitors?page=42") == 42
+        assert page_number(None) is None
+        assert page_number(f"{API}/monitors") is None
+
+    def test_sequential(self) -> None:
+        """
+        Test the default walk fetches pages one after the other.
+        """
+        pages = FakePages(5)
+        assert [result["data"][0]["id"] for result in iter_pages(pages)] == ["1", "2", "3", "4", "5"]
+        assert pages.max_in_flight == 1
+
+    def test_prefetch_keeps_order(self) -> None:
+        """
+        Test prefetched pages are yielded in page order with bounded concurrency.
+        """
+        pages = FakePages(20, delay=0.01)
+        results = list(iter_pages(pages, page=3, max_workers=4))
+        assert [result["data"][0]["id"] for result in results] == [str(page) for page in range(3, 21)]
+        assert sorted(pages.fetched) == list(range(3, 21))
+        assert 1 < pages.max_in_flight <= 4
+
+    def test_prefetch_early_stop(self) -> None:
+        """
+        Test breaking out of the iterator stops fetching pages.
+        """
+        pages = FakePages(60, delay=0.01)
+        for result in iter_pages(pages, max_workers=2, read_ahead=3):
+            if result["data"][0]["id"] == "5":
+                break
+        fetched = len(pages.fetched)
+        time.sleep(0.05)
+        assert fetched == len(pages.fetched)
+        assert fetched <= 5 + 3
+        assert pages.in_flight == 0
+
+    def test_prefetch_error(self) -> None:
+        """
+        Test errors raised while fetching a page are raised in order to the consumer.
+        """
+        pages = FakePages(-10)
+        seen = []
+        with pytest.raises(ApiError):
+            for result in iter_pages(pages, max_workers=3):
+                seen.append(result["data"][0]["id"])
+        assert seen == ["1", "2", "3"]
+
+    def test_list_iter_prefetch(self, client: betteruptime.Client, mocker: MockerFixture) -> None:
+        """
+        Test list_iter and monitors_iter accept prefetch options.
+        """
+        pages = FakePages(6)
+        mocker.patch.object(betteruptime.resources.Monitor, "list", side_effect=lambda page: pages(page))
+        monitors: List[Any] = list(client.monitors.list_iter(max_workers=3))
+        assert [monitor["id"] for monitor in monitors] == ["1", "2", "3", "4", "5", "6"]
+
+        group_pages = FakePages(3)
+        mocker.patch.object(betteruptime.resources.MonitorGroup, "monitors", side_effect=lambda page: group_pages(page))
+        monitors = list(client.monitor_groups("123456").monitors_iter(max_workers=2))
+        assert [monitor["id"] for monitor in monitors] == ["1", "2", "3"]
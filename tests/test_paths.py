@@ -0,0 +1,32 @@
+"""
+Resource path tests
+"""
+from yarl import URL
+
+import betteruptime
+
+
+class TestResourcePaths:
+    """
+    Cached resource paths tests
+    """
+
+    def test_paths_match_yarl(self) -> None:
+        """
+        Test the cached paths are the ones built by walking the parents.
+        """
+        client = betteruptime.Client(bearer_token="fake")
+        status_updates = client.status_pages("1").reports("2").status_updates
+        assert status_updates._path() == "status-pages/1/status-reports/2/status-updates"
+        assert status_updates._path("3") == str(status_updates._build_path(URL(status_updates.name)) / "3")
+        assert status_updates._page_path(4) == "status-pages/1/status-reports/2/status-updates?page=4"
+        assert client.monitors._path("a b") == str(URL("monitors") / "a b")
+
+    def test_path_computed_once(self) -> None:
+        """
+        Test the path is reused, and rebuilt when the resource is renamed.
+        """
+        monitors = betteruptime.Client(bearer_token="fake").monitors
+        assert monitors._path() is monitors._path()
+        monitors.name = "monitor-groups"
+        assert monitors._path("1") == "monitor-groups/1"
@@ -0,0 +1,98 @@
+"""
+Sparse fieldsets tests
+"""
+import json
+from typing import Any
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+import betteruptime
+from betteruptime.util.decoders import stdlib_decoder
+from betteruptime.util.projection import item_type, project_item, project_payload, projection_decoder
+from tests.helpers import fake_response
+from tests.stub_server import StubAPI
+
+FIELDS = ("url", "paused")
+
+
+class TestProjection:
+    """
+    Sparse fieldsets tests
+    """
+
+    @pytest.mark.parametrize("decoder", ["json", stdlib_decoder])
+    def test_list_iter_fields(self, decoder: Any) -> None:
+        """
+        Test listed items only keep the requested attributes, with built-in and custom decoders.
+        """
+        with StubAPI(monitors=7, per_page=3) as stub, betteruptime.Client(
+            bearer_token="fake", api_url=stub.url, decoder=decoder
+        ) as client:
+            monitors = list(stub.collections["monitors"].values())
+            expected = [project_item(monitor, FIELDS) for monitor in monitors]
+            assert list(client.monitors.list_iter(fields=FIELDS)) == expected
+            assert list(client.monitors.list_iter(fields=FIELDS, max_workers=3)) == expected
+            assert list(client.monitors.list_iter(fields=FIELDS, stream=True)) == expected
+            assert client.monitors.get(monitors[0]["id"], fields=["url"]) == {
+                "data": project_item(monitors[0], ["url"])
+            }
+            assert sorted(expected[0]["attributes"]) == ["paused", "url"]
+
+    def test_projection_decoder(self) -> None:
+        """
+        Test decode time projections match the projection of the whole payload.
+        """
+        payload = {
+            "data": [
+                {"id": "1", "type": "monitor", "attributes": {"url": "https://example.com", "paused": False, "x": 1}},
+                {"id": "2", "type": "monitor", "attributes": None, "relationships": {}},
+            ],
+            "pagination": {"next": None},
+            "included": [],
+        }
+        decoded = projection_decoder(FIELDS, stdlib_decoder)(json.dumps(payload).encode())
+        assert decoded == project_payload(payload, FIELDS)
+        assert decoded["data"][1] == {"id": "2", "type": "monitor", "attributes": {}}
+        with pytest.raises(ValueError):
+            projection_decoder(FIELDS, stdlib_decoder)(b"not json")
+
+    def test_sparse_fieldsets(self, mocker: MockerFixture) -> None:
+        """
+        Test the JSON:API sparse fieldset is only sent when enabled on the client.
+        """
+        payload = {"data": [], "pagination": {"next": None, "last": None}}
+        request = mocker.patch.object(
+            requests.Session, "request", side_effect=lambda *args, **kwargs: fake_response(200, payload)
+        )
+        client = betteruptime.Client(bearer_token="fake", sparse_fieldsets=True)
+        client.monitors.list(fields=["url", "paused"], filters={"monitor_type": "status"})
+        assert request.call_args.kwargs["params"] == {"monitor_type": "status", "fields[monitor]": "paused,url"}
+        list(client.monitor_groups("42").monitors_iter(fields=["url"]))
+        assert request.call_args.kwargs["params"] == {"fields[monitor]": "url"}
+        client.status_pages.list()
+        assert request.call_args.kwargs["params"] is None
+
+        betteruptime.Client(bearer_token="fake").monitors.list(fields=["url"])
+        assert request.call_args.kwargs["params"] is None
+        assert [item_type(name) for name in ("status-pages", "policies", "metadata")] == [
+            "status_page",
+            "policy",
+            "metadata",
+        ]
+
+    def test_index_is_not_projected(self, mocker: MockerFixture) -> None:
+        """
+        Test projected lookups do not replace the full monitors kept in the index.
+        """
+        monitor = {"id": "1", "type": "monitor", "attributes": {"url": "https://example.com", "paused": False}}
+        mocker.patch.object(
+            requests.Session,
+            "request",
+            side_effect=lambda *args, **kwargs: fake_response(200, {"data": [monitor], "pagination": {"next": None}}),
+        )
+        client = betteruptime.Client(bearer_token="fake")
+        index = client.monitors.enable_index()
+        assert client.monitors.get("1", fields=["url"]) == {"data": project_item(monitor, ["url"])}
+        assert index.get("1") == monitor
@@ -0,0 +1,99 @@
+"""
+Rate limiter tests
+"""
+import threading
+import time
+from email.utils import formatdate
+from typing import List
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+import betteruptime
+from betteruptime.api.exceptions import ApiError
+from betteruptime.api.rate_limit import RateLimiter
+from tests.helpers import EMPTY_PAGE, fake_response
+
+
+class TestRateLimiter:
+    """
+    Token bucket rate limiter tests
+    """
+
+    def test_burst_then_rate(self, mocker: MockerFixture) -> None:
+        """
+        Test the burst is served at once and the following requests are queued.
+        """
+        # Frozen clock: no token is refilled while the requests queue
+        mocker.patch("time.monotonic", return_value=1000.0)
+        limiter = RateLimiter(rate=50.0, burst=5)
+        delays: List[float] = []
+        threads = [threading.Thread(target=lambda: delays.append(limiter.acquire())) for _ in range(15)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = limiter.stats
+        assert sorted(delays) == pytest.approx([0.0] * 5 + [i / 50.0 for i in range(1, 11)])
+        assert stats.requests == 15
+        assert stats.delayed == 10
+        assert stats.queue_depth == 0
+        assert stats.max_queue_depth > 1
+        assert stats.total_wait == pytest.approx(sum(delays))
+        assert stats.mean_wait == pytest.approx(stats.total_wait / 15)
+
+    def test_learn_from_headers(self) -> None:
+        """
+        Test the bucket follows the API rate limit headers.
+        """
+        limiter = RateLimiter(rate=10.0, burst=10)
+        limiter.update(200, {"RateLimit-Limit": "120", "RateLimit-Policy": "120;w=60", "RateLimit-Remaining": "3"})
+        assert limiter.rate == 2.0
+        assert limiter.burst == 120
+        assert limiter.expected_wait == 0
+        limiter.update(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"})
+        assert 1.5 < limiter.expected_wait <= 2
+
+    def test_retry_after(self) -> None:
+        """
+        Test the backoff follows the Retry-After header, given as seconds or HTTP date.
+        """
+        limiter = RateLimiter(jitter=0.1)
+        assert 3.0 <= limiter.backoff({"Retry-After": "3"}, attempt=0) <= 3.3
+        assert 3.0 <= limiter.expected_wait <= 3.3
+        delay = RateLimiter(jitter=0).backoff({"Retry-After": formatdate(time.time() + 10, usegmt=True)}, attempt=0)
+        assert 8 < delay <= 10
+        assert 0 <= RateLimiter(backoff_factor=0.5).backoff({}, attempt=2) <= 2.0
+        assert limiter.stats.retries == 1
+
+    def test_client_retries_429(self, mocker: MockerFixture) -> None:
+        """
+        Test a 429 response is retried after Retry-After instead of raising.
+        """
+        limiter = RateLimiter(max_retries=2)
+        client = betteruptime.Client(bearer_token="fake", rate_limiter=limiter)
+        responses: List[requests.Response] = [
+            fake_response(429, EMPTY_PAGE, headers={"Retry-After": "0.05"}),
+            fake_response(503, EMPTY_PAGE, headers={"Retry-After": "0"}),
+            fake_response(200, EMPTY_PAGE, headers={}),
+        ]
+        send = mocker.patch.object(requests.Session, "request", side_effect=responses)
+        assert client.monitors.list() == {"data": []}
+        assert send.call_count == 3
+        assert limiter.stats.throttled == 2
+        assert limiter.stats.retries == 2
+
+    def test_client_gives_up(self, mocker: MockerFixture) -> None:
+        """
+        Test the API error is raised once the retries are exhausted.
+        """
+        client = betteruptime.Client(bearer_token="fake", rate_limiter=RateLimiter(max_retries=1))
+        responses = [
+            fake_response(429, EMPTY_PAGE, headers={"Retry-After": "0"}),
+            fake_response(429, EMPTY_PAGE, headers={"Retry-After": "0"}),
+        ]
+        mocker.patch.object(requests.Session, "request", side_effect=responses)
+        with pytest.raises(ApiError) as excinfo:
+            client.monitors.list()
+        assert 429 == excinfo.value.status_code
@@ -0,0 +1,93 @@
+"""
+Reconcile plan/apply tests
+"""
+from typing import Any, Dict, List
+
+import pytest
+
+import betteruptime
+from betteruptime.util.reconcile import CREATE, DELETE, UPDATE, plan_changes
+from tests.stub_server import StubAPI
+
+
+def _item(resource_id: str, **attributes: Any) -> Dict[str, Any]:
+    return {"id": resource_id, "type": "monitor", "attributes": attributes}
+
+
+class TestReconcile:
+    """
+    Declarative reconcile tests
+    """
+
+    def test_plan_changes(self) -> None:
+        """
+        Test only real differences become operations, with the changed attributes only.
+        """
+        current = [
+            _item("1", url="https://a.example", check_frequency=30, paused=False),
+            _item("2", url="https://b.example", check_frequency=30, paused=False),
+            _item("3", url="https://c.example", check_frequency=30, paused=False),
+        ]
+        desired: List[Dict[str, Any]] = [
+            {"url": "https://a.example", "check_frequency": 30},
+            {"url": "https://b.example", "check_frequency": 60, "paused": False},
+            {"url": "https://d.example", "check_frequency": 180},
+        ]
+        plan = plan_changes(current, desired, key="url")
+        assert plan.summary() == {CREATE: 1, UPDATE: 1, DELETE: 0, "unchanged": 1}
+        update = next(operation for operation in plan.operations if operation.action == UPDATE)
+        assert (update.resource_id, update.payload) == ("2", {"check_frequency": 60})
+        assert update.changes == {"check_frequency": (30, 60)}
+
+        pruned = plan_changes(current, desired, key="url", prune=True)
+        assert [(operation.action, operation.resource_id) for operation in pruned.operations][-1] == (DELETE, "3")
+        assert not plan_changes(current[:1], desired[:1], key="url")
+
+    def test_ambiguous_keys(self) -> None:
+        """
+        Test duplicated reconcile keys are refused instead of guessed.
+        """
+        with pytest.raises(ValueError):
+            plan_changes([_item("1", url="u"), _item("2", url="u")], [], key="url")
+        with pytest.raises(ValueError):
+            plan_changes([], [{"url": "u"}, {"url": "u"}], key="url")
+
+    def test_items_without_key(self) -> None:
+        """
+        Test current items without a key value are left alone, even with `prune`.
+        """
+        current = [
+            _item("1", company_name="Acme"),
+            _item("2", company_name="Acme"),
+            _item("3", name="status"),
+        ]
+        plan = plan_changes(current, [{"name": "other"}], key="name", prune=True)
+        assert [(operation.action, operation.key, operation.resource_id) for operation in plan.operations] == [
+            (CREATE, "other", None),
+            (DELETE, "status", "3"),
+        ]
+        assert not plan_changes(current[:2], [], key=("name", "subdomain"), prune=True)
+
+    def test_plan_and_apply(self) -> None:
+        """
+        Test applying a plan reaches the desired state, and a no-change plan only lists.
+        """
+        with StubAPI(monitors=5, per_page=2) as stub, betteruptime.Client(
+            bearer_token="fake", api_url=stub.url
+        ) as client:
+            for resource_id, item in stub.collections["monitors"].items():
+                item["attributes"] = dict(item["attributes"], url=f"https://{resource_id}.example")
+            desired = [
+                {"url": f"https://{resource_id}.example", "check_frequency": 60}
+                for resource_id in list(stub.collections["monitors"])[:4]
+            ] + [{"url": "https://new.example", "check_frequency": 60}]
+
+            plan = client.monitors.plan(desired, prune=True)
+            assert plan.summary()[CREATE] == 1 and plan.summary()[DELETE] == 1
+            results = client.monitors.apply(plan, max_workers=4)
+            assert all(result.ok for result in results)
+
+            requests_before = stub.requests
+            assert not client.monitors.plan(desired, prune=True)
+            # Three pages of two monitors
+            assert stub.requests - requests_before == 3
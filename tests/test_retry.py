@@ -0,0 +1,277 @@
+"""
+Retry policy tests
+"""
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+import betteruptime
+from betteruptime.api import async_http_client
+from betteruptime.api.async_http_client import (
+    AsyncHTTPClient,
+    AsyncResponse,
+    AsyncTransport,
+    HttpxAsyncTransport,
+    ThreadedAsyncTransport,
+)
+from betteruptime.api.exceptions import HttpBackoff, HTTPError, HttpTimeout, ProxyError
+from betteruptime.api.http_client import HTTPClient
+from betteruptime.api.retry import CIRCUIT_CLOSED, CIRCUIT_OPEN, RetryPolicy
+from tests.helpers import EMPTY_PAGE, fake_response
+
+
+def _refused() -> requests.ConnectionError:
+    reason = NewConnectionError(None, "Connection refused")
+    return requests.ConnectionError(MaxRetryError(None, "/", reason))
+
+
+class FlakyTransport(AsyncTransport):
+    """
+    Async transport timing out once before answering.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        timeout: float = 30.0,
+        allow_redirects: bool = True,
+    ) -> AsyncResponse:
+        self.calls += 1
+        if self.calls == 1:
+            raise HttpTimeout(method, url, timeout)
+        return AsyncResponse(status_code=200, reason="OK", headers={}, content=b'{"data": []}', url=url)
+
+
+class HangingTransport(AsyncTransport):
+    """
+    Async transport never answering its first request.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        timeout: float = 30.0,
+        allow_redirects: bool = True,
+    ) -> AsyncResponse:
+        self.calls += 1
+        if self.calls == 1:
+            await asyncio.sleep(10)
+        return AsyncResponse(status_code=200, reason="OK", headers={}, content=b'{"data": []}', url=url)
+
+
+class TestRetryPolicy:
+    """
+    Retry policy, retry budget and circuit breaker tests
+    """
+
+    def test_idempotent_methods(self, mocker: MockerFixture) -> None:
+        """
+        Test server errors and timeouts are retried for GET, not for POST.
+        """
+        policy = RetryPolicy(backoff_factor=0)
+        client = HTTPClient(bearer_token="fake", retry_policy=policy)
+        outcomes: List[Union[requests.Response, Exception]] = [
+            fake_response(502, EMPTY_PAGE),
+            requests.exceptions.ReadTimeout(),
+            fake_response(200, EMPTY_PAGE),
+        ]
+        send = mocker.patch.object(requests.Session, "request", side_effect=outcomes)
+        assert client.get("monitors").status_code == 200
+        assert send.call_count == 3
+
+        send = mocker.patch.object(requests.Session, "request", side_effect=[fake_response(500, EMPTY_PAGE)])
+        with pytest.raises(HTTPError):
+            client.post("monitors", json={})
+        assert send.call_count == 1
+        assert policy.stats.retries == 2
+        assert policy.stats.requests == 2
+
+    def test_unsent_and_idempotency_key(self, mocker: MockerFixture) -> None:
+        """
+        Test a POST is retried when the connection was refused or when it carries an Idempotency-Key.
+        """
+        client = HTTPClient(bearer_token="fake", retry_policy=RetryPolicy(backoff_factor=0))
+        send = mocker.patch.object(
+            requests.Session, "request", side_effect=[_refused(), fake_response(201, EMPTY_PAGE)]
+        )
+        assert client.post("monitors", json={}).status_code == 201
+        assert send.call_count == 2
+
+        send = mocker.patch.object(
+            requests.Session, "request", side_effect=[fake_response(500, EMPTY_PAGE), fake_response(201, EMPTY_PAGE)]
+        )
+        response = client.post("monitors", json={}, headers={"Idempotency-Key": "abc"})
+        assert response.status_code == 201
+        assert send.call_count == 2
+
+    def test_rate_limited_statuses_left_to_rate_limiter(self, mocker: MockerFixture) -> None:
+        """
+        Test a 503 is retried once by the rate limiter, not again by the retry policy, nor counted as a request.
+        """
+        policy = RetryPolicy(backoff_factor=0)
+        client = betteruptime.Client(
+            bearer_token="fake", retry_policy=policy, rate_limiter=betteruptime.RateLimiter(max_retries=1)
+        )
+        send = mocker.patch.object(
+            requests.Session, "request", side_effect=[fake_response(503, EMPTY_PAGE), fake_response(503, EMPTY_PAGE)]
+        )
+        with pytest.raises(HTTPError):
+            client.monitors.list()
+        assert send.call_count == 2
+        # The throttled retry is not a new request for the retry budget
+        assert (policy.stats.requests, policy.stats.retries) == (1, 0)
+
+    def test_retry_budget(self, mocker: MockerFixture) -> None:
+        """
+        Test retries stop once the budget of the window is spent.
+        """
+        policy = RetryPolicy(backoff_factor=0, budget_ratio=0, min_retries_per_window=1, failure_threshold=0)
+        client = HTTPClient(bearer_token="fake", retry_policy=policy)
+        send = mocker.patch.object(requests.Session, "request", side_effect=[fake_response(500, EMPTY_PAGE)] * 3)
+        with pytest.raises(HTTPError):
+            client.get("monitors")
+        with pytest.raises(HTTPError):
+            client.get("monitors")
+        assert send.call_count == 3
+        assert policy.stats.retries == 1
+        assert policy.stats.budget_exhausted == 2
+
+    def test_circuit_breaker(self, mocker: MockerFixture) -> None:
+        """
+        Test the circuit opens after consecutive failures, fails fast, then closes after a successful trial.
+        """
+        policy = RetryPolicy(max_retries=0, failure_threshold=2, recovery_time=0.1)
+        client = HTTPClient(bearer_token="fake", retry_policy=policy)
+        send = mocker.patch.object(
+            requests.Session,
+            "request",
+            side_effect=[
+                fake_response(500, EMPTY_PAGE),
+                fake_response(504, EMPTY_PAGE),
+                fake_response(200, EMPTY_PAGE),
+            ],
+        )
+        for _ in range(2):
+            with pytest.raises(HTTPError):
+                client.get("monitors")
+        assert policy.stats.circuit_state == CIRCUIT_OPEN
+        with pytest.raises(HttpBackoff) as excinfo:
+            client.get("monitors")
+        assert 0 < excinfo.value.backoff_period <= 0.1
+        assert send.call_count == 2
+
+        time.sleep(0.1)
+        assert client.get("monitors").status_code == 200
+        stats = policy.stats
+        assert (stats.circuit_state, stats.circuit_opened, stats.short_circuited) == (CIRCUIT_CLOSED, 1, 1)
+
+    def test_backoff(self) -> None:
+        """
+        Test the jittered backoff grows exponentially up to its bound.
+        """
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3.0)
+        assert all(0 <= policy.backoff(1) <= 1.0 for _ in range(100))
+        assert all(0 <= policy.backoff(10) <= 3.0 for _ in range(100))
+
+    def test_async_client(self) -> None:
+        """
+        Test the async client retries a timed out GET.
+        """
+        transport = FlakyTransport()
+        policy = RetryPolicy(backoff_factor=0)
+        client = betteruptime.AsyncClient(bearer_token="fake", transport=transport, retry_policy=policy)
+        assert asyncio.run(client.monitors.list()) == {"data": []}
+        assert transport.calls == 2
+        assert policy.stats.retries == 1
+
+    def test_async_transport_retries_disabled(self, mocker: MockerFixture) -> None:
+        """
+        Test the default async transport does not retry connections itself when a retry policy is set.
+        """
+        build = mocker.spy(async_http_client, "default_async_transport")
+        AsyncHTTPClient(bearer_token="fake", retry_policy=RetryPolicy())
+        assert build.call_args.kwargs["max_retries"] == 0
+        AsyncHTTPClient(bearer_token="fake")
+        assert build.call_args.kwargs["max_retries"] > 0
+
+    @pytest.mark.parametrize("transport", ["threaded", "httpx"])
+    def test_async_refused_post(self, transport: str, mocker: MockerFixture) -> None:
+        """
+        Test the async client retries a POST whose connection was refused, like the sync client.
+        """
+        policy = RetryPolicy(backoff_factor=0)
+        async_transport: AsyncTransport
+        if transport == "httpx":
+            httpx = pytest.importorskip("httpx")
+            async_transport = HttpxAsyncTransport(max_retries=0)
+            mocker.patch.object(
+                httpx.AsyncClient,
+                "request",
+                side_effect=[
+                    httpx.ConnectError("refused"),
+                    httpx.Response(201, json={"data": {}}, request=httpx.Request("POST", "https://example.com")),
+                ],
+            )
+        else:
+            async_transport = ThreadedAsyncTransport(max_retries=0)
+            mocker.patch.object(requests.Session, "request", side_effect=[_refused(), fake_response(201, {"data": {}})])
+
+        async def run() -> None:
+            async with betteruptime.AsyncClient(
+                bearer_token="fake", transport=async_transport, retry_policy=policy
+            ) as client:
+                assert await client.monitors.create({"url": "https://example.com"}) == {"data": {}}
+
+        asyncio.run(run())
+        assert policy.stats.retries == 1
+
+    def test_proxy_error_trial(self, mocker: MockerFixture) -> None:
+        """
+        Test a trial request failing on the proxy lets the next request through.
+        """
+        policy = RetryPolicy(max_retries=0, failure_threshold=1, recovery_time=0)
+        policy.record(failure=True)
+        client = HTTPClient(bearer_token="fake", retry_policy=policy)
+        mocker.patch.object(
+            requests.Session, "request", side_effect=[requests.exceptions.ProxyError(), fake_response(200, EMPTY_PAGE)]
+        )
+        with pytest.raises(ProxyError):
+            client.get("monitors")
+        assert client.get("monitors").status_code == 200
+        assert policy.stats.circuit_state == CIRCUIT_CLOSED
+
+    def test_cancelled_trial(self) -> None:
+        """
+        Test a cancelled async trial request lets the next request through.
+        """
+        policy = RetryPolicy(max_retries=0, failure_threshold=1, recovery_time=0)
+        policy.record(failure=True)
+        transport = HangingTransport()
+        client = betteruptime.AsyncClient(bearer_token="fake", transport=transport, retry_policy=policy)
+
+        async def main() -> Any:
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.monitors.list(), timeout=0.05)
+            return await client.monitors.list()
+
+        assert asyncio.run(main()) == {"data": []}
+        assert policy.stats.circuit_state == CIRCUIT_CLOSED
@@ -0,0 +1,81 @@
+"""
+Snapshot store tests
+"""
+import pathlib
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+import betteruptime
+from betteruptime.snapshot import export_snapshot, open_snapshot, write_collection, write_manifest
+from tests.stub_server import StubAPI
+
+
+class TestSnapshot:
+    """
+    Snapshot export and memory-mapped reader tests
+    """
+
+    @pytest.mark.parametrize("snapshot_format", ["ndjson", "arrow"])
+    def test_export_and_open(self, tmp_path: pathlib.Path, snapshot_format: str) -> None:
+        """
+        Test an exported account is read back by id and in order.
+        """
+        if snapshot_format == "arrow":
+            pytest.importorskip("pyarrow")
+        with StubAPI(monitors=7, heartbeats=3, per_page=2) as stub, betteruptime.Client(
+            bearer_token="fake", api_url=stub.url
+        ) as client:
+            counts = export_snapshot(
+                client, str(tmp_path), resources=["monitors", "heartbeats"], snapshot_format=snapshot_format
+            )
+            monitors = list(stub.collections["monitors"].values())
+        assert counts == {"monitors": 7, "heartbeats": 3}
+
+        with open_snapshot(str(tmp_path)) as snapshot:
+            assert snapshot.resources == ["monitors", "heartbeats"]
+            collection = snapshot["monitors"]
+            assert len(collection) == 7
+            assert collection[monitors[3]["id"]] == monitors[3]
+            assert monitors[0]["id"] in collection
+            assert collection.get("unknown") is None
+            assert list(collection) == monitors
+            with pytest.raises(KeyError):
+                snapshot["incidents"]
+
+    def test_empty_collection(self, tmp_path: pathlib.Path) -> None:
+        """
+        Test an empty collection can be opened.
+        """
+        write_manifest(str(tmp_path), {"monitors": write_collection(str(tmp_path), "monitors", [])})
+        with open_snapshot(str(tmp_path)) as snapshot:
+            assert len(snapshot["monitors"]) == 0
+            assert list(snapshot["monitors"]) == []
+            assert snapshot["monitors"].get("1") is None
+
+    def test_incomplete_snapshot(self, tmp_path: pathlib.Path) -> None:
+        """
+        Test a snapshot without its manifest is refused.
+        """
+        write_collection(str(tmp_path), "monitors", [{"id": "1", "type": "monitor", "attributes": {}}])
+        with pytest.raises(FileNotFoundError):
+            open_snapshot(str(tmp_path))
+
+    def test_interrupted_export(self, tmp_path: pathlib.Path, mocker: MockerFixture) -> None:
+        """
+        Test a re-export failing midway does not leave the previous manifest next to rewritten collections.
+        """
+        with StubAPI(monitors=3, heartbeats=2) as stub, betteruptime.Client(
+            bearer_token="fake", api_url=stub.url
+        ) as client:
+            export_snapshot(client, str(tmp_path), resources=["monitors", "heartbeats"])
+
+            def failing_list_iter(*args: Any, **kwargs: Any) -> Any:
+                raise ConnectionError("interrupted")
+
+            mocker.patch.object(type(client.heartbeats), "list_iter", failing_list_iter)
+            with pytest.raises(ConnectionError):
+                export_snapshot(client, str(tmp_path), resources=["monitors", "heartbeats"])
+        with pytest.raises(FileNotFoundError):
+            open_snapshot(str(tmp_path))
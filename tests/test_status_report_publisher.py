@@ -0,0 +1,122 @@
+"""
+Status report publisher tests
+"""
+import json
+import threading
+from typing import Any, Dict, List, Tuple
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+import betteruptime
+
+BASE_URL = "https://betteruptime.com/api/v2/status-pages"
+
+
+class FakeStatusPagesAPI:
+    """
+    Records the created reports and status updates, refusing reports on the `failing` status pages.
+    """
+
+    def __init__(self, failing: Tuple[str, ...] = ()) -> None:
+        self.failing = set(failing)
+        self.created: List[Tuple[str, Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, method: str, url: str, json: Any = None, **kwargs: Any) -> requests.Response:
+        response = requests.Response()
+        path = url[len(BASE_URL) + 1 :]
+        status_page_id = path.split("/", 1)[0]
+        with self._lock:
+            self.created.append((path, json))
+            resource_id = str(len(self.created))
+        if method == "POST" and status_page_id in self.failing:
+            response.status_code = 422
+            response._content = b'{"errors": "Invalid"}'
+        else:
+            response.status_code = 201
+            response._content = _dumps({"data": {"id": resource_id, "attributes": json}})
+        return response
+
+
+def _dumps(payload: Any) -> bytes:
+    return json.dumps(payload).encode()
+
+
+class TestStatusReportPublisher:
+    """
+    Status report fan-out tests
+    """
+
+    def test_publish_and_update(self, mocker: MockerFixture) -> None:
+        """
+        Test a report is created on every status page, then updated without listing the reports.
+        """
+        api = FakeStatusPagesAPI()
+        mocker.patch.object(requests.Session, "request", side_effect=api)
+        client = betteruptime.Client(bearer_token="fake")
+        publisher = client.status_pages.publisher(max_workers=4)
+
+        pages = {str(page): [str(page * 10), str(page * 10 + 1)] for page in range(1, 6)}
+        results = publisher.publish(pages, title="EU outage", message="Investigating", status="downtime")
+        assert [result.key for result in results] == list(pages)
+        assert all(result.ok for result in results)
+        assert set(publisher.report_ids) == set(pages)
+        path, payload = next(created for created in api.created if created[0].startswith("3/"))
+        assert path == "3/status-reports"
+        assert payload["title"] == "EU outage"
+        assert payload["affected_resources"] == [
+            {"status_page_resource_id": "30", "status": "downtime"},
+            {"status_page_resource_id": "31", "status": "downtime"},
+        ]
+
+        api.created.clear()
+        results = publisher.update("Fixed", status="resolved", status_page_ids=["2", "4"])
+        assert [result.key for result in results] == ["2", "4"]
+        report_ids = publisher.report_ids
+        assert sorted(path for path, _ in api.created) == [
+            f"2/status-reports/{report_ids['2']}/status-updates",
+            f"4/status-reports/{report_ids['4']}/status-updates",
+        ]
+        assert all(payload["affected_resources"][0]["status"] == "resolved" for _, payload in api.created)
+
+    def test_failed_pages_are_retried(self, mocker: MockerFixture) -> None:
+        """
+        Test publishing again only creates the reports that failed.
+        """
+        api = FakeStatusPagesAPI(failing=("2",))
+        mocker.patch.object(requests.Session, "request", side_effect=api)
+        publisher = betteruptime.Client(bearer_token="fake").status_pages.publisher()
+        pages = {"1": ["10"], "2": ["20"], "3": ["30"]}
+
+        results = publisher.publish(pages, title="EU outage", message="Investigating")
+        assert [result.ok for result in results] == [True, False, True]
+        assert sorted(publisher.report_ids) == ["1", "3"]
+        with pytest.raises(KeyError):
+            publisher.update("Fixed", status="resolved", status_page_ids=["2"])
+
+        api.failing.clear()
+        api.created.clear()
+        results = publisher.publish(pages, title="EU outage", message="Investigating")
+        assert [result.key for result in results] == ["2"]
+        assert [path for path, _ in api.created] == ["2/status-reports"]
+
+    def test_saved_report_ids(self, mocker: MockerFixture) -> None:
+        """
+        Test a publisher built from saved report ids updates the reports directly.
+        """
+        api = FakeStatusPagesAPI()
+        mocker.patch.object(requests.Session, "request", side_effect=api)
+        publisher = betteruptime.Client(bearer_token="fake").status_pages.publisher(report_ids={"7": "70"})
+        results = publisher.update("Monitoring", status="degraded", affected_resources={"7": ["700"]})
+        assert results[0].ok
+        assert api.created == [
+            (
+                "7/status-reports/70/status-updates",
+                {
+                    "message": "Monitoring",
+                    "affected_resources": [{"status_page_resource_id": "700", "status": "degraded"}],
+                },
+            )
+        ]
@@ -0,0 +1,136 @@
+"""
+Streaming JSON parsing tests
+"""
+import io
+import json
+from typing import Any, Dict, List
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+import betteruptime
+from betteruptime.util.streaming import JSONArrayParser, iter_json_array
+
+API = "https://betteruptime.com/api/v2"
+
+PAGE: Dict[str, Any] = {
+    "data": [
+        {"id": "1", "attributes": {"name": 'tricky "}]\\\\', "regions": ["us", {"nested": "]"}]}},
+        {"id": "2", "attributes": {"name": "café", "paused": False, "ratio": 0.5, "group": None}},
+        42,
+        "string",
+    ],
+    "pagination": {"first": f"{API}/monitors?page=1", "next": None},
+    "count": 4,
+}
+
+
+class RecordingBody(io.BytesIO):
+    """
+    Response body recording how many bytes were read.
+    """
+
+    def __init__(self, content: bytes) -> None:
+        super().__init__(content)
+        self.read_sizes: List[int] = []
+
+    def read(self, size: Any = -1) -> bytes:
+        chunk = super().read(size)
+        self.read_sizes.append(len(chunk))
+        return chunk
+
+
+def _streamed_response(payload: Any, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = RecordingBody(json.dumps(payload).encode("utf-8"))
+    return response
+
+
+class TestJSONArrayParser:
+    """
+    Incremental JSON parser tests
+    """
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 20])
+    def test_chunk_boundaries(self, chunk_size: int) -> None:
+        """
+        Test that items are decoded whatever the chunk boundaries.
+        """
+        body = json.dumps(PAGE, indent=2).encode("utf-8")
+        parser = JSONArrayParser()
+        chunks = (body[i : i + chunk_size] for i in range(0, len(body), chunk_size))
+        assert list(iter_json_array(chunks, parser)) == PAGE["data"]
+        assert parser.members == {"pagination": PAGE["pagination"], "count": 4}
+
+    def test_items_yielded_before_end(self) -> None:
+        """
+        Test that an item is returned as soon as it is complete.
+        """
+        parser = JSONArrayParser()
+        assert parser.feed(b'{"data": [{"id": "1"}, {"id"') == [{"id": "1"}]
+        assert parser.feed(b': "2"}], "pagination": {}}') == [{"id": "2"}]
+        assert parser.close() == []
+        assert parser.members == {"pagination": {}}
+
+    @pytest.mark.parametrize("body", [b"", b'{"data": [{"id": "1"}', b'[{"id": "1"}]', b'{"data" []}'])
+    def test_invalid_documents(self, body: bytes) -> None:
+        """
+        Test that truncated or invalid documents raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            list(iter_json_array([body], JSONArrayParser()))
+
+
+class TestStreamedListIter:
+    """
+    Streamed list_iter tests
+    """
+
+    def test_list_iter_stream(self, mocker: MockerFixture) -> None:
+        """
+        Test that streamed pages are followed and their responses closed.
+        """
+        pages = [
+            _streamed_response({"data": [{"id": "1"}], "pagination": {"next": f"{API}/monitors?page=2"}}),
+            _streamed_response({"data": [{"id": "2"}, {"id": "3"}], "pagination": {"next": None}}),
+        ]
+        closed = [mocker.spy(page, "close") for page in pages]
+        request = mocker.patch.object(requests.Session, "request", side_effect=pages)
+        client = betteruptime.Client(bearer_token="fake")
+        monitors: List[Any] = list(client.monitors.list_iter(stream=True))
+        assert [monitor["id"] for monitor in monitors] == ["1", "2", "3"]
+        assert [call.kwargs["stream"] for call in request.call_args_list] == [True, True]
+        assert [call.kwargs["url"] for call in request.call_args_list] == [
+            f"{API}/monitors?page=1",
+            f"{API}/monitors?page=2",
+        ]
+        assert all(spy.call_count >= 1 for spy in closed)
+
+    def test_first_item_before_body_is_read(self, mocker: MockerFixture) -> None:
+        """
+        Test that the first item is yielded before the whole page is downloaded.
+        """
+        payload = {"data": [{"id": str(i), "blob": "x" * 100_000} for i in range(10)], "pagination": {"next": None}}
+        response = _streamed_response(payload)
+        mocker.patch.object(requests.Session, "request", return_value=response)
+        client = betteruptime.Client(bearer_token="fake")
+        monitors = client.monitors.list_iter(stream=True)
+        first: Any = next(monitors)
+        assert first["id"] == "0"
+        assert isinstance(response.raw, RecordingBody)
+        assert sum(response.raw.read_sizes) < len(json.dumps(payload))
+        monitors.close()
+
+    def test_list_stream_error(self, mocker: MockerFixture) -> None:
+        """
+        Test that an error page raises an ApiError.
+        """
+        response = requests.Response()
+        response.status_code = 404
+        response._content = b'{"errors": "Not found"}'
+        mocker.patch.object(requests.Session, "request", return_value=response)
+        client = betteruptime.Client(bearer_token="fake")
+        with pytest.raises(betteruptime.api.exceptions.ApiError):
+            client.status_pages("1").sections.list_stream()
@@ -0,0 +1,44 @@
+"""
+Local stub API tests
+"""
+import pytest
+
+import betteruptime
+from betteruptime.api.exceptions import ApiError, HTTPError
+from tests.stub_server import StubAPI
+
+
+class TestStubAPI:
+    """
+    Local stub API tests
+    """
+
+    def test_crud_and_pagination(self) -> None:
+        """
+        Test that the stub serves the resources like the API does.
+        """
+        with StubAPI(monitors=7, per_page=3) as stub, betteruptime.Client(
+            bearer_token="fake", api_url=stub.url
+        ) as client:
+            assert len(list(client.monitors.list_iter())) == 7
+            created = client.heartbeats.create({"name": "Backup", "period": 60})
+            assert isinstance(created, dict)
+            heartbeat_id = created["data"]["id"]
+            client.heartbeats.update({"period": 120}, heartbeat_id)
+            heartbeat = client.heartbeats.get(heartbeat_id)
+            assert isinstance(heartbeat, dict)
+            assert heartbeat["data"]["attributes"]["period"] == 120
+            client.heartbeats.delete(heartbeat_id)
+            with pytest.raises(ApiError):
+                client.heartbeats.get(heartbeat_id)
+            updates = client.status_pages("1").reports("1").status_updates.list()
+            assert isinstance(updates, dict)
+            assert updates["data"]
+
+    def test_error_injection(self) -> None:
+        """
+        Test that injected errors reach the client.
+        """
+        with StubAPI(error_rate=1.0) as stub, betteruptime.Client(bearer_token="fake", api_url=stub.url) as client:
+            with pytest.raises(HTTPError):
+                client.monitors.list()
@@ -0,0 +1,139 @@
+"""
+Incremental sync tests
+"""
+import pathlib
+from typing import Any, Dict, List, Optional
+
+import requests
+from pytest_mock import MockerFixture
+
+import betteruptime
+from betteruptime.util.sync import FileCheckpointStore, MemoryCheckpointStore, SyncCheckpoint
+from tests.helpers import fake_response
+
+API = "https://betteruptime.com/api/v2"
+
+
+def _incident(resource_id: str, started_at: str, resolved_at: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "id": resource_id,
+        "type": "incident",
+        "attributes": {"name": f"Incident {resource_id}", "started_at": started_at, "resolved_at": resolved_at},
+    }
+
+
+class FakeIncidents:
+    """
+    Incidents API serving two items per page, filtered by `from` like the API does.
+    """
+
+    def __init__(self, incidents: List[Dict[str, Any]]) -> None:
+        self.incidents = {incident["id"]: incident for incident in incidents}
+        self.requests: List[str] = []
+
+    def __call__(self, method: str, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        path, _, query = url.partition("?")
+        self.requests.append(f"{path[len(API):]}?{query}" + (f"&from={params['from']}" if params else ""))
+        resource_id = path.rpartition("/")[2]
+        if resource_id in self.incidents:
+            return fake_response(200, {"data": self.incidents[resource_id]})
+        page = int(query.partition("page=")[2] or 1)
+        since = (params or {}).get("from", "")
+        items = [incident for incident in self.incidents.values() if incident["attributes"]["started_at"] >= since]
+        items.sort(key=lambda incident: incident["attributes"]["started_at"], reverse=True)
+        last = max(1, (len(items) + 1) // 2)
+        return fake_response(
+            200,
+            {
+                "data": items[(page - 1) * 2 : page * 2],
+                "pagination": {
+                    "last": f"{API}/incidents?page={last}",
+                    "next": f"{API}/incidents?page={page + 1}" if page < last else None,
+                },
+            },
+        )
+
+
+class TestIncrementalSync:
+    """
+    Incremental sync tests
+    """
+
+    def test_incidents_sync(self, mocker: MockerFixture) -> None:
+        """
+        Test later syncs only list recent incidents and catch the resolution of older ones.
+        """
+        api = FakeIncidents(
+            [
+                _incident("1", "2022-01-01T10:00:00Z", "2022-01-01T11:00:00Z"),
+                _incident("2", "2022-01-05T10:00:00Z"),
+                _incident("3", "2022-01-10T10:00:00Z", "2022-01-10T10:30:00Z"),
+            ]
+        )
+        mocker.patch.object(requests.Session, "request", side_effect=api)
+        client = betteruptime.Client(bearer_token="fake")
+        store = MemoryCheckpointStore()
+
+        assert [incident["id"] for incident in client.incidents.sync(store)] == ["3", "2", "1"]
+        checkpoint = store.load("incidents")
+        assert checkpoint is not None
+        assert (checkpoint.cursor, checkpoint.pending, checkpoint.page) == ("2022-01-10T10:00:00Z", ["2"], 1)
+
+        # Nothing changed
+        api.requests.clear()
+        assert list(client.incidents.sync(store)) == []
+        assert api.requests == ["/incidents?page=1&from=2022-01-09", "/incidents/2?"]
+
+        # A new incident, and the old pending one got resolved
+        api.incidents["4"] = _incident("4", "2022-01-12T08:00:00Z")
+        api.incidents["2"] = _incident("2", "2022-01-05T10:00:00Z", "2022-01-12T09:00:00Z")
+        assert [incident["id"] for incident in client.incidents.sync(store)] == ["4", "2"]
+        checkpoint = store.load("incidents")
+        assert checkpoint is not None
+        assert (checkpoint.cursor, checkpoint.pending) == ("2022-01-12T08:00:00Z", ["4"])
+
+    def test_resume_interrupted_sync(self, mocker: MockerFixture) -> None:
+        """
+        Test a sync stopped after a page resumes at the next one.
+        """
+        api = FakeIncidents([_incident(str(i), f"2022-01-0{i}T10:00:00Z", "2022-01-10T00:00:00Z") for i in range(1, 6)])
+        mocker.patch.object(requests.Session, "request", side_effect=api)
+        client = betteruptime.Client(bearer_token="fake")
+        store = MemoryCheckpointStore()
+
+        sync = client.incidents.sync(store)
+        assert [next(sync)["id"], next(sync)["id"], next(sync)["id"]] == ["5", "4", "3"]
+        sync.close()
+        checkpoint = store.load("incidents")
+        assert checkpoint is not None and checkpoint.page == 2
+
+        assert [incident["id"] for incident in client.incidents.sync(store)] == ["3", "2", "1"]
+
+    def test_generic_sync(self, mocker: MockerFixture, tmp_path: pathlib.Path) -> None:
+        """
+        Test resources without date filters yield changed items only, with a file store,
+        and forget the deleted items.
+        """
+        api = FakeIncidents([_incident("1", "2022-01-01T10:00:00Z"), _incident("2", "2022-01-02T10:00:00Z")])
+        mocker.patch.object(requests.Session, "request", side_effect=api)
+        client = betteruptime.Client(bearer_token="fake")
+        store = FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+
+        assert len(list(client.monitors.sync(store, key="items"))) == 2
+        api.incidents["2"]["attributes"]["name"] = "Renamed"
+        assert [item["id"] for item in client.monitors.sync(store, key="items")] == ["2"]
+        checkpoint = FileCheckpointStore(str(tmp_path / "checkpoints.json")).load("items")
+        assert checkpoint is not None and sorted(checkpoint.fingerprints) == ["1", "2"]
+
+        # Fingerprints of deleted items are dropped after a full pass
+        del api.incidents["1"]
+        assert list(client.monitors.sync(store, key="items")) == []
+        checkpoint = store.load("items")
+        assert checkpoint is not None and list(checkpoint.fingerprints) == ["2"]
+
+    def test_checkpoint_json(self) -> None:
+        """
+        Test checkpoints round trip through JSON and ignore unknown keys.
+        """
+        checkpoint = SyncCheckpoint(cursor="2022-01-01", page=3, pending=["1"])
+        assert SyncCheckpoint.from_json(dict(checkpoint.to_json(), unknown=True)) == checkpoint
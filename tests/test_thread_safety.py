@@ -0,0 +1,83 @@
+"""
+Thread safety tests
+"""
+from concurrent.futures import Future
+from typing import Any, Callable, List, Tuple
+
+import requests
+from pytest_mock import MockerFixture
+
+import betteruptime
+from tests.helpers import EMPTY_PAGE, fake_response
+from tests.stub_server import StubAPI
+
+CALLS_PER_CLIENT = 1000
+
+
+def _operations(client: betteruptime.Client, stub: StubAPI) -> List[Tuple[Callable[..., Any], Tuple[Any, ...], Any]]:
+    """
+    (method, arguments, expected item id) of the calls sent by a client, `None` for listings.
+    """
+    monitor_ids = list(stub.collections["monitors"])
+    heartbeat_ids = list(stub.collections["heartbeats"])
+    operations: List[Tuple[Callable[..., Any], Tuple[Any, ...], Any]] = []
+    for index in range(CALLS_PER_CLIENT):
+        monitor_id = monitor_ids[index % len(monitor_ids)]
+        heartbeat_id = heartbeat_ids[index % len(heartbeat_ids)]
+        operation = index % 4
+        if operation == 0:
+            operations.append((client.monitors.get, (monitor_id,), monitor_id))
+        elif operation == 1:
+            operations.append((client.heartbeats(heartbeat_id).get, (), heartbeat_id))
+        elif operation == 2:
+            operations.append((client.monitors.update, ({"paused": index % 2 == 0}, monitor_id), monitor_id))
+        else:
+            operations.append((client.heartbeats.list, (index % 4 + 1,), None))
+    return operations
+
+
+class TestThreadSafety:
+    """
+    Concurrent use of a shared client
+    """
+
+    def test_concurrent_clients(self) -> None:
+        """
+        Test thousands of concurrent calls through two clients never mix their headers nor their responses.
+        """
+        with StubAPI(monitors=40, heartbeats=40, per_page=10) as stub, betteruptime.Client(
+            bearer_token="alpha", api_url=stub.url, pool_maxsize=16, pool_block=True
+        ) as alpha, betteruptime.Client(
+            bearer_token="beta", api_url=stub.url, pool_maxsize=16, pool_block=True
+        ) as beta:
+            calls: List[Tuple["Future[Any]", Any]] = []
+            with alpha.executor() as alpha_executor, beta.executor() as beta_executor:
+                for alpha_call, beta_call in zip(_operations(alpha, stub), _operations(beta, stub)):
+                    for executor, (method, args, expected_id) in (
+                        (alpha_executor, alpha_call),
+                        (beta_executor, beta_call),
+                    ):
+                        calls.append((executor.submit(method, *args), expected_id))
+
+            for future, expected_id in calls:
+                payload = future.result()
+                if expected_id is None:
+                    assert len(payload["data"]) == 10
+                else:
+                    assert payload["data"]["id"] == expected_id
+
+        assert stub.authorizations == {"Bearer alpha": CALLS_PER_CLIENT, "Bearer beta": CALLS_PER_CLIENT}
+
+    def test_executor(self, mocker: MockerFixture) -> None:
+        """
+        Test the executor defaults to the pool size and runs the calls in the submitter context.
+        """
+        mocker.patch.object(requests.Session, "request", return_value=fake_response(200, EMPTY_PAGE))
+        cache = betteruptime.ResponseCache()
+        client = betteruptime.Client(bearer_token="fake", pool_maxsize=12, response_cache=cache)
+        with client.executor() as executor:
+            assert executor._max_workers == 12
+            assert list(executor.map(client.monitors.list, [1, 2, 3])) == [{"data": []}] * 3
+            with client.http_client.bypass_cache():
+                executor.submit(client.monitors.list, 1).result()
+        assert (cache.stats.misses, cache.stats.bypassed) == (3, 1)
@@ -0,0 +1,86 @@
+"""
+Pluggable HTTP transport tests
+"""
+import socket
+
+import pytest
+
+import betteruptime
+from betteruptime.api.exceptions import ApiError, ClientError, HTTPError, HttpTimeout
+from betteruptime.api.httpx_transport import HttpxTransport
+from tests.stub_server import StubAPI
+
+pytest.importorskip("httpx")
+
+
+def _closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+    return port
+
+
+class TestHttpxTransport:
+    """
+    httpx transport tests, against the local stub API
+    """
+
+    @pytest.mark.parametrize("http2", [False, True])
+    def test_resources(self, http2: bool) -> None:
+        """
+        Test the resources work the same over the httpx transport.
+        """
+        if http2:
+            pytest.importorskip("h2")
+        with StubAPI(monitors=9, per_page=2) as stub, betteruptime.Client(
+            bearer_token="fake", api_url=stub.url, transport=HttpxTransport(http2=http2)
+        ) as client:
+            monitors = list(stub.collections["monitors"].values())
+            assert list(client.monitors.list_iter(max_workers=4)) == monitors
+            assert client.monitors.get(monitors[0]["id"]) == {"data": monitors[0]}
+            updated = client.monitors.update({"paused": True}, monitors[1]["id"])
+            assert isinstance(updated, dict)
+            assert updated["data"]["attributes"]["paused"] is True
+            with client.monitors.list_stream() as page:
+                assert list(page) == list(stub.collections["monitors"].values())[:2]
+            with pytest.raises(ApiError) as excinfo:
+                client.monitors.get("0")
+            assert excinfo.value.status_code == 404
+
+    def test_exception_mapping(self) -> None:
+        """
+        Test transport errors are mapped to the client exceptions.
+        """
+        transport = HttpxTransport(http2=False, max_retries=0)
+        with betteruptime.Client(
+            bearer_token="fake", api_url=f"http://127.0.0.1:{_closed_port()}", transport=transport
+        ) as client:
+            with pytest.raises(ClientError):
+                client.monitors.list()
+
+        with StubAPI(latency=0.5) as stub, betteruptime.Client(
+            bearer_token="fake", api_url=stub.url, transport=HttpxTransport(http2=False)
+        ) as client:
+            with pytest.raises(HttpTimeout):
+                client.http_client.get("monitors", timeout=0.05)
+
+        with StubAPI(error_rate=1.0) as stub, betteruptime.Client(
+            bearer_token="fake", api_url=stub.url, transport=HttpxTransport(http2=False)
+        ) as client:
+            with pytest.raises(HTTPError):
+                client.monitors.list()
+
+    def test_connect_errors_are_retried(self) -> None:
+        """
+        Test a refused POST counts as never sent for the retry policy.
+        """
+        policy = betteruptime.RetryPolicy(backoff_factor=0, max_retries=2)
+        with betteruptime.Client(
+            bearer_token="fake",
+            api_url=f"http://127.0.0.1:{_closed_port()}",
+            transport=HttpxTransport(http2=False, max_retries=0),
+            retry_policy=policy,
+        ) as client:
+            with pytest.raises(ClientError):
+                client.monitors.create({"url": "https://example.com"})
+        assert policy.stats.retries == 2